@@ -0,0 +1,188 @@
+import json
+import os
+import struct
+import time
+import numpy as np
+
+# 파일 형식 식별자와 버전 (배열 구성이 바뀌면 버전을 올리고 이전 버전 읽기를 유지)
+ARTIFACT_MAGIC = b'PWBIAS\x00\x00'
+ARTIFACT_VERSION = 1
+
+# 파일 머리말: 식별자(8바이트), 버전(uint32), 메타데이터 JSON 길이(uint32)
+HEADER_FORMAT = '<8sII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# 배열 시작 위치 정렬 단위 (바이트)
+ARRAY_ALIGNMENT = 64
+
+def is_bias_artifact(path):
+    """
+    파일이 편향 점수 바이너리 파일인지 식별자로 확인
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+def _aligned(offset):
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+def write_bias_artifact(path, words, coefficients, columns, total_counts=None, tags=None, metadata=None):
+    """
+    단어별 편향 점수를 메모리 맵으로 읽을 수 있는 바이너리 파일로 저장
+
+    파일 구성 (리틀 엔디언):
+        - 머리말: 식별자, 버전, 메타데이터 JSON 길이
+        - 메타데이터 JSON: 열 이름, 품사 목록, 학습 정보, 배열별 위치/자료형/크기
+        - vocab: UTF-8 바이트 순으로 정렬한 고정 길이 단어 배열 ('S' 자료형, searchsorted로 조회)
+        - coefficients: (열 수, 단어 수) float32 배열 (열마다 연속된 메모리)
+        - total_counts: 단어별 총 등장 횟수 (int64)
+        - tags: 단어별 주 품사 번호 (uint8, 메타데이터 tag_table의 순서)
+
+    Args:
+        path: 저장할 파일 경로
+        words: 단어 목록
+        coefficients: (단어 수,) 또는 (단어 수, 열 수) 편향 점수 배열
+        columns: 편향 점수 열 이름 목록 (예: ['bias_score'], ['bias_x', 'bias_y'])
+        total_counts: 단어별 총 등장 횟수
+        tags: 단어별 주 품사
+        metadata: 함께 저장할 학습 정보 (min_word_count, training_fingerprint 등)
+    """
+    encoded = np.array([str(word).encode('utf-8') for word in words], dtype=object)
+    order = np.argsort(encoded, kind='stable')
+    vocab = encoded[order].astype(f"S{max(1, max((len(word) for word in encoded), default=1))}")
+    if len(vocab) > 1 and np.any(vocab[1:] == vocab[:-1]):
+        raise ValueError("중복된 단어가 있어 편향 점수 파일을 만들 수 없습니다.")
+
+    coefficients = np.asarray(coefficients, dtype=np.float32).reshape(len(encoded), -1)
+    if coefficients.shape[1] != len(columns):
+        raise ValueError(f"편향 점수 열 수({coefficients.shape[1]})와 열 이름 수({len(columns)})가 다릅니다.")
+
+    arrays = {
+        'vocab': vocab,
+        'coefficients': np.ascontiguousarray(coefficients[order].T),
+    }
+    if total_counts is not None:
+        arrays['total_counts'] = np.asarray(total_counts, dtype=np.int64)[order]
+
+    tag_table = []
+    if tags is not None:
+        tag_table = sorted({str(tag) for tag in tags})
+        tag_codes = {tag: code for code, tag in enumerate(tag_table)}
+        arrays['tags'] = np.array([tag_codes[str(tag)] for tag in tags], dtype=np.uint8)[order]
+
+    header = dict(metadata or {})
+    header.update({
+        'format_version': ARTIFACT_VERSION,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'words': len(vocab),
+        'columns': list(columns),
+        'tag_table': tag_table,
+    })
+
+    # 메타데이터 길이에 따라 배열 위치가 바뀌므로 위치가 고정될 때까지 반복 계산
+    layout = {}
+    while True:
+        header['arrays'] = layout
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        offset = _aligned(HEADER_SIZE + len(header_bytes))
+        new_layout = {}
+        for name, array in arrays.items():
+            new_layout[name] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+            offset = _aligned(offset + array.nbytes)
+        if new_layout == layout:
+            break
+        layout = new_layout
+
+    # 읽는 프로세스가 작성 중인 파일을 열지 않도록 임시 파일에 쓴 뒤 이름 변경
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, ARTIFACT_MAGIC, ARTIFACT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(layout[name]['offset'])
+            f.write(array.tobytes())
+    os.replace(temp_path, path)
+
+    return header
+
+class BiasArtifact:
+    """
+    write_bias_artifact()로 저장한 편향 점수 파일을 메모리 맵으로 읽는 클래스
+
+    배열은 파일을 복사하지 않고 메모리 맵 위의 뷰로 사용하므로
+    여러 프로세스가 같은 파일을 열어도 운영체제 페이지 캐시의 한 사본을 공유한다.
+    """
+
+    def __init__(self, path):
+        """
+        초기화 함수
+
+        Args:
+            path: 편향 점수 파일 경로
+        """
+        self.path = path
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r')
+
+        magic, version, header_length = struct.unpack_from(HEADER_FORMAT, self._buffer, 0)
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"편향 점수 파일 형식이 아닙니다: {path}")
+        if version > ARTIFACT_VERSION:
+            raise ValueError(f"지원하지 않는 편향 점수 파일 버전입니다: {version} (지원 버전: {ARTIFACT_VERSION} 이하)")
+
+        self.version = version
+        self.metadata = json.loads(bytes(self._buffer[HEADER_SIZE:HEADER_SIZE + header_length]).decode('utf-8'))
+        self.columns = self.metadata['columns']
+        self.tag_table = self.metadata.get('tag_table', [])
+
+        self.vocab = self._array('vocab')
+        self.coefficients = self._array('coefficients')
+        self.total_counts = self._array('total_counts')
+        self.tags = self._array('tags')
+
+    def _array(self, name):
+        """
+        메타데이터에 기록된 위치의 배열을 복사 없이 읽기 (없으면 None)
+        """
+        layout = self.metadata['arrays'].get(name)
+        if layout is None:
+            return None
+        dtype = np.dtype(layout['dtype'])
+        count = int(np.prod(layout['shape']))
+        array = np.frombuffer(self._buffer, dtype=dtype, count=count, offset=layout['offset'])
+        return array.reshape(layout['shape'])
+
+    def __len__(self):
+        return len(self.vocab)
+
+    def column(self, name='bias_score'):
+        """
+        편향 점수 열 (단어 순서는 vocab과 같음)
+        """
+        if name not in self.columns:
+            raise ValueError(f"편향 점수 파일에 없는 열입니다: {name} (사용 가능: {', '.join(self.columns)})")
+        return self.coefficients[self.columns.index(name)]
+
+    def lookup(self, words):
+        """
+        단어 목록의 vocab 번호를 한 번에 조회 (없는 단어는 -1)
+        """
+        if len(words) == 0 or len(self.vocab) == 0:
+            return np.full(len(words), -1, dtype=np.int64)
+
+        encoded = [str(word).encode('utf-8') for word in words]
+        keys = np.array(encoded, dtype=object).astype(self.vocab.dtype)
+        positions = np.searchsorted(self.vocab, keys)
+        positions = np.minimum(positions, len(self.vocab) - 1)
+
+        # 고정 길이보다 긴 단어는 잘려서 비교되므로 길이가 맞는 경우만 일치로 판단
+        width = self.vocab.dtype.itemsize
+        fits = np.fromiter((len(word) <= width for word in encoded), dtype=bool, count=len(encoded))
+        found = (self.vocab[positions] == keys) & fits
+        return np.where(found, positions, -1).astype(np.int64)
+
+    def word(self, index):
+        return self.vocab[index].decode('utf-8')
+
+    def tag(self, index):
+        if self.tags is None:
+            return None
+        return self.tag_table[self.tags[index]]
@@ -0,0 +1,229 @@
+import argparse
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.bias_artifact import BiasArtifact, is_bias_artifact
+
+class BiasScorer:
+    """
+    단어별 정치적 편향 점수로 문서의 정치적 편향도를 계산하는 클래스
+
+    문서의 편향 점수는 편향 점수가 있는 단어들의 점수를 등장 횟수로 가중 평균한 값이다.
+    여러 문서를 한 번에 처리할 때는 문서-단어 빈도 희소 행렬과 편향 점수 벡터의 곱으로 계산한다.
+    """
+
+    def __init__(self, bias_file='word_political_bias_1d.csv', score_column='bias_score', tokenizer=None):
+        """
+        초기화 함수
+
+        Args:
+            bias_file: 단어별 정치적 편향 점수 CSV 파일 경로
+            score_column: 편향 점수 열 이름
+            tokenizer: 텍스트 토큰화에 사용할 SpeechTokenizer (None이면 처음 사용할 때 생성)
+        """
+        bias_df = pd.read_csv(bias_file, encoding='utf-8-sig', usecols=['word', score_column])
+        bias_df = bias_df.dropna(subset=['word', score_column]).drop_duplicates('word')
+
+        self.words = bias_df['word'].astype(str).to_numpy()
+        self.scores = bias_df[score_column].to_numpy(dtype=np.float64)
+        self.word_index = {word: idx for idx, word in enumerate(self.words)}
+        self.artifact = None
+        self.tokenizer = tokenizer
+
+        print(f"편향 점수 로드: {len(self.words):,}개 단어")
+
+    @classmethod
+    def from_artifact(cls, artifact_file, score_column='bias_score', tokenizer=None):
+        """
+        WordPoliticalBiasAnalyzer.export_artifact()로 저장한 바이너리 파일에서 생성
+
+        CSV를 읽거나 단어 사전을 만들지 않고 파일을 메모리 맵으로 열어 정렬된 vocab에서 단어를 조회하므로
+        시작 시간이 짧고, 여러 프로세스가 같은 파일을 사용해도 메모리에는 한 사본만 올라간다.
+
+        Args:
+            artifact_file: 편향 점수 바이너리 파일 경로
+            score_column: 편향 점수 열 이름 (예: bias_score, bias_x, bias_y)
+            tokenizer: 텍스트 토큰화에 사용할 SpeechTokenizer
+        """
+        scorer = cls.__new__(cls)
+        scorer.artifact = BiasArtifact(artifact_file)
+        scorer.words = scorer.artifact.vocab
+        scorer.scores = scorer.artifact.column(score_column)
+        scorer.word_index = None
+        scorer.tokenizer = tokenizer
+
+        print(f"편향 점수 로드: {len(scorer.words):,}개 단어 ({artifact_file}, 버전 {scorer.artifact.version})")
+        return scorer
+
+    @classmethod
+    def load(cls, bias_file, score_column='bias_score', tokenizer=None):
+        """
+        편향 점수 CSV 또는 바이너리 파일에서 생성 (파일 식별자로 형식 판단)
+        """
+        if is_bias_artifact(bias_file):
+            return cls.from_artifact(bias_file, score_column, tokenizer)
+        return cls(bias_file, score_column, tokenizer)
+
+    def _word(self, idx):
+        """
+        단어 번호의 단어 문자열
+        """
+        if self.artifact is not None:
+            return self.artifact.word(idx)
+        return self.words[idx]
+
+    def lookup(self, words):
+        """
+        단어 목록의 편향 점수 번호를 한 번에 조회 (편향 점수가 없는 단어는 -1)
+        """
+        if self.artifact is not None:
+            return self.artifact.lookup(words)
+        word_index = self.word_index
+        return np.fromiter((word_index.get(word, -1) for word in words), dtype=np.int64, count=len(words))
+
+    def _get_tokenizer(self):
+        """
+        토크나이저 생성 (발언 토큰화와 같은 품사/불용어 규칙 사용)
+        """
+        if self.tokenizer is None:
+            from analysis.speech_tokenizer import SpeechTokenizer
+            self.tokenizer = SpeechTokenizer(use_database=False)
+        return self.tokenizer
+
+    def tokenize(self, text):
+        """
+        텍스트를 (단어, 품사) 목록으로 토큰화
+        """
+        return self._get_tokenizer().tokenize_text(text)
+
+    def build_document_matrix(self, token_lists):
+        """
+        문서-단어 빈도 희소 행렬 생성
+
+        Args:
+            token_lists: 문서별 토큰 목록 ((단어, 품사) 또는 단어)
+
+        Returns:
+            (문서 × 편향 점수 단어 빈도 CSR 행렬, 문서별 전체 토큰 수 배열)
+        """
+        total_tokens = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+        words = [
+            token[0] if isinstance(token, (tuple, list)) else token
+            for tokens in token_lists
+            for token in tokens
+        ]
+
+        # 배치의 모든 토큰을 한 번에 조회하고 편향 점수가 있는 토큰만 남김
+        indices = self.lookup(words)
+        doc_ids = np.repeat(np.arange(len(token_lists)), total_tokens)
+        matched = indices >= 0
+
+        # 같은 (문서, 단어) 항목은 CSR 변환 시 합쳐져 빈도가 됨
+        matrix = sparse.coo_matrix(
+            (np.ones(int(matched.sum()), dtype=np.float64), (doc_ids[matched], indices[matched])),
+            shape=(len(token_lists), len(self.words))
+        ).tocsr()
+        matrix.sum_duplicates()
+
+        return matrix, total_tokens
+
+    def _top_contributions(self, matrix, doc_idx, top_k):
+        """
+        문서의 편향 점수에 가장 크게 기여한 단어 목록 (단어, 등장 횟수, 기여도)
+        """
+        start, end = matrix.indptr[doc_idx], matrix.indptr[doc_idx + 1]
+        indices = matrix.indices[start:end]
+        counts = matrix.data[start:end]
+        contributions = counts * self.scores[indices]
+
+        order = np.argsort(-np.abs(contributions))[:top_k]
+        return [
+            (self._word(indices[i]), int(counts[i]), float(contributions[i]))
+            for i in order
+        ]
+
+    def score_token_batch(self, token_lists, top_k=10):
+        """
+        토큰화된 여러 문서의 편향 점수를 한 번에 계산
+
+        Args:
+            token_lists: 문서별 토큰 목록
+            top_k: 문서별로 반환할 주요 기여 단어 수 (0이면 생략)
+
+        Returns:
+            score, coverage, matched_tokens, total_tokens, top_words 열을 가진 데이터프레임
+        """
+        matrix, total_tokens = self.build_document_matrix(token_lists)
+
+        # 문서별 (편향 점수 × 등장 횟수) 합과 편향 점수가 있는 토큰 수
+        weighted_sums = matrix @ self.scores
+        matched_tokens = np.asarray(matrix.sum(axis=1)).ravel()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(matched_tokens > 0, weighted_sums / matched_tokens, np.nan)
+            coverage = np.where(total_tokens > 0, matched_tokens / total_tokens, 0.0)
+
+        result = pd.DataFrame({
+            'score': scores,
+            'coverage': coverage,
+            'matched_tokens': matched_tokens.astype(np.int64),
+            'total_tokens': total_tokens,
+        })
+
+        if top_k:
+            result['top_words'] = [self._top_contributions(matrix, doc_idx, top_k) for doc_idx in range(len(token_lists))]
+
+        return result
+
+    def score_tokens(self, tokens, top_k=10):
+        """
+        토큰화된 문서 하나의 편향 점수 계산
+        """
+        return self.score_token_batch([tokens], top_k).iloc[0].to_dict()
+
+    def score_texts(self, texts, top_k=10):
+        """
+        여러 문서 텍스트를 토큰화하여 편향 점수 계산
+        """
+        return self.score_token_batch([self.tokenize(text) for text in texts], top_k)
+
+    def score_text(self, text, top_k=10):
+        """
+        문서 텍스트 하나의 편향 점수 계산
+
+        Returns:
+            score(편향 점수), coverage(편향 점수가 있는 토큰 비율), matched_tokens, total_tokens, top_words
+        """
+        return self.score_tokens(self.tokenize(text), top_k)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='문서의 정치적 편향도 측정 도구')
+    parser.add_argument('--bias-file', type=str, default='word_political_bias_1d.csv',
+                        help='단어별 정치적 편향 점수 CSV 또는 바이너리 파일 경로')
+    parser.add_argument('--score-column', type=str, default='bias_score', help='편향 점수 열 이름 (기본값: bias_score)')
+    parser.add_argument('--text', type=str, help='편향도를 측정할 텍스트')
+    parser.add_argument('--file', type=str, help='편향도를 측정할 텍스트 파일 경로')
+    parser.add_argument('--top', type=int, default=10, help='출력할 주요 기여 단어 수 (기본값: 10)')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            text = f.read()
+    elif args.text:
+        text = args.text
+    else:
+        parser.error('--text 또는 --file 중 하나를 지정해야 합니다.')
+
+    scorer = BiasScorer.load(args.bias_file, score_column=args.score_column)
+    result = scorer.score_text(text, top_k=args.top)
+
+    print(f"편향 점수: {result['score']:.4f} (양수: 보수, 음수: 진보)")
+    print(f"적용 비율: {result['coverage'] * 100:.2f}% ({result['matched_tokens']}/{result['total_tokens']}개 토큰)")
+    print("\n=== 주요 기여 단어 ===")
+    for word, count, contribution in result['top_words']:
+        print(f"{word}: {contribution:+.4f} ({count}회)")
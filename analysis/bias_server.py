@@ -0,0 +1,348 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.speech_tokenizer import _init_worker, _tokenize_rows
+from analysis.bias_scorer import BiasScorer
+from instrumentation import METRICS
+
+# HTTP 상태 코드별 응답 문구
+HTTP_STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+class BiasScoringServer:
+    """
+    문서 편향도 측정 HTTP 서비스
+
+    형태소 분석기(JVM)를 미리 띄워 둔 워커 프로세스 풀과 편향 점수 인덱스를 메모리에 유지하고,
+    동시에 들어온 요청을 짧은 시간(max_wait_ms) 동안 모아 한 번에 토큰화/점수 계산한다.
+
+    - POST /score  {"text": "..."} 또는 {"texts": ["...", ...]}
+    - GET /health
+    - GET /metrics  요청 수, 평균 배치 크기, p50/p99 지연 시간(ms), 형태소 분석 지표
+    """
+
+    def __init__(self, bias_file='word_political_bias_1d.csv', workers=2, max_batch_size=32, max_wait_ms=5.0,
+                 top_k=10, cache_path=None, max_body_size=10 * 1024 * 1024, score_column='bias_score'):
+        """
+        초기화 함수
+
+        Args:
+            bias_file: 단어별 정치적 편향 점수 CSV 또는 바이너리 파일 경로
+            workers: 토큰화 워커 프로세스 수
+            max_batch_size: 한 번에 처리할 최대 문서 수
+            max_wait_ms: 배치를 모으기 위해 기다리는 최대 시간 (밀리초)
+            top_k: 응답에 포함할 주요 기여 단어 수
+            cache_path: 형태소 분석 캐시 파일 경로
+            max_body_size: 요청 본문 최대 크기 (바이트)
+            score_column: 편향 점수 열 이름 (예: bias_score, bias_x, bias_y)
+        """
+        self.scorer = BiasScorer.load(bias_file, score_column=score_column)
+        self.workers = workers
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.top_k = top_k
+        self.cache_path = cache_path
+        self.max_body_size = max_body_size
+
+        self.pool = None
+        self.queue = None
+        self.batch_slots = None
+        # 처리 중인 배치 작업 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+        self.batch_tasks = set()
+
+        # 지연 시간 통계 (최근 요청 기준)
+        self.latencies = deque(maxlen=10000)
+        self.batch_sizes = deque(maxlen=10000)
+        self.request_count = 0
+
+    def start_pool(self):
+        """
+        워커 프로세스 풀 생성 후 모든 워커의 형태소 분석기를 미리 로드
+        """
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=('kkma', self.cache_path),
+        )
+
+        print(f"{self.workers}개의 토큰화 워커를 준비하는 중...")
+        warmup = [self.pool.submit(_tokenize_rows, [(0, '국회 회의록 형태소 분석 준비')]) for _ in range(self.workers)]
+        for future in warmup:
+            future.result()
+        print("토큰화 워커 준비 완료")
+
+    async def score(self, texts):
+        """
+        문서 목록의 편향 점수 계산 (다른 요청과 함께 배치로 처리됨)
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            await self.queue.put((text, future))
+            futures.append(future)
+        return await asyncio.gather(*futures)
+
+    async def _batch_loop(self):
+        """
+        요청 큐에서 문서를 모아 배치 단위로 처리
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 이전 배치가 토큰화 중이어도 다음 배치를 받을 수 있도록 별도 작업으로 처리
+            await self.batch_slots.acquire()
+            task = loop.create_task(self._process_batch(batch))
+            self.batch_tasks.add(task)
+            task.add_done_callback(self.batch_tasks.discard)
+
+    async def _process_batch(self, batch):
+        """
+        배치 토큰화(워커 풀에 분배) 후 한 번의 벡터 연산으로 점수 계산
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            texts = [text for text, _ in batch]
+            rows = list(enumerate(texts))
+            part_size = max(1, -(-len(rows) // self.workers))
+            parts = [rows[i:i + part_size] for i in range(0, len(rows), part_size)]
+
+            results = await asyncio.gather(*[
+                loop.run_in_executor(self.pool, _tokenize_rows, part) for part in parts
+            ])
+            for _, worker_metrics in results:
+                METRICS.merge(worker_metrics)
+            token_lists = [tokens for part, _ in results for _, tokens, _ in part]
+
+            scores = self.scorer.score_token_batch(token_lists, top_k=self.top_k)
+            self.batch_sizes.append(len(batch))
+
+            for (_, future), row in zip(batch, scores.itertuples(index=False)):
+                if not future.done():
+                    future.set_result({
+                        'score': None if np.isnan(row.score) else float(row.score),
+                        'coverage': float(row.coverage),
+                        'matched_tokens': int(row.matched_tokens),
+                        'total_tokens': int(row.total_tokens),
+                        'top_words': [
+                            {'word': word, 'count': count, 'contribution': contribution}
+                            for word, count, contribution in row.top_words
+                        ] if self.top_k else [],
+                    })
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.batch_slots.release()
+
+    def metrics(self):
+        """
+        요청 처리 통계
+        """
+        latencies = np.array(self.latencies) if self.latencies else np.zeros(1)
+        return {
+            'requests': self.request_count,
+            'workers': self.workers,
+            'avg_batch_size': float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            'latency_ms_p50': float(np.percentile(latencies, 50)),
+            'latency_ms_p99': float(np.percentile(latencies, 99)),
+            # 워커에서 측정한 형태소 분석/캐시 지표
+            'tokenizer': METRICS.snapshot(),
+        }
+
+    async def _handle_request(self, method, path, body):
+        """
+        HTTP 요청 처리
+
+        Returns:
+            (상태 코드, 응답 객체)
+        """
+        if path == '/health':
+            return 200, {'status': 'ok'}
+
+        if path == '/metrics':
+            return 200, self.metrics()
+
+        if path != '/score':
+            return 404, {'error': 'not found'}
+
+        if method != 'POST':
+            return 405, {'error': 'POST 요청만 지원합니다.'}
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return 400, {'error': 'JSON 형식의 요청 본문이 필요합니다.'}
+
+        if not isinstance(payload, dict):
+            return 400, {'error': 'JSON 객체 형식의 요청 본문이 필요합니다.'}
+
+        if isinstance(payload.get('texts'), list):
+            if not all(isinstance(text, str) for text in payload['texts']):
+                return 400, {'error': "'texts' 필드는 문자열 목록이어야 합니다."}
+            results = await self.score(payload['texts'])
+            return 200, {'results': results}
+
+        if isinstance(payload.get('text'), str):
+            results = await self.score([payload['text']])
+            return 200, results[0]
+
+        return 400, {'error': "'text' 또는 'texts' 필드가 필요합니다."}
+
+    async def _handle_connection(self, reader, writer):
+        """
+        HTTP/1.1 연결 처리 (keep-alive 지원)
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    content_length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    content_length = -1
+
+                if content_length < 0:
+                    # 본문 길이를 알 수 없으므로 응답 후 연결 종료
+                    status, response = 400, {'error': 'invalid Content-Length'}
+                    body = b''
+                    keep_alive = False
+                elif content_length > self.max_body_size:
+                    status, response = 413, {'error': 'request body too large'}
+                    body = b''
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(content_length) if content_length else b''
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+
+                    start_time = time.perf_counter()
+                    try:
+                        status, response = await self._handle_request(method, path.split('?', 1)[0], body)
+                    except Exception as e:
+                        status, response = 500, {'error': str(e)}
+
+                    if path.startswith('/score'):
+                        self.request_count += 1
+                        self.latencies.append((time.perf_counter() - start_time) * 1000)
+
+                response_body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_STATUS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(response_body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1')
+                    + response_body
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        """
+        HTTP 서비스 실행
+        """
+        self.queue = asyncio.Queue()
+        # 동시에 토큰화 중인 배치 수 제한 (워커 수의 2배)
+        self.batch_slots = asyncio.Semaphore(self.workers * 2)
+        batch_task = asyncio.create_task(self._batch_loop())
+
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        print(f"편향도 측정 서비스 시작: http://{host}:{port}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batch_task.cancel()
+
+    def close(self):
+        """
+        워커 프로세스 풀 종료
+        """
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='문서 편향도 측정 HTTP 서비스')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='서비스 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='서비스 포트 (기본값: 8000)')
+    parser.add_argument('--bias-file', type=str, default='word_political_bias_1d.csv',
+                        help='단어별 정치적 편향 점수 CSV 또는 바이너리 파일 경로')
+    parser.add_argument('--score-column', type=str, default='bias_score', help='편향 점수 열 이름 (기본값: bias_score)')
+    parser.add_argument('--workers', type=int, default=2, help='토큰화 워커 프로세스 수 (기본값: 2)')
+    parser.add_argument('--max-batch-size', type=int, default=32, help='한 번에 처리할 최대 문서 수 (기본값: 32)')
+    parser.add_argument('--max-wait-ms', type=float, default=5.0,
+                        help='배치를 모으기 위해 기다리는 최대 시간(밀리초) (기본값: 5)')
+    parser.add_argument('--top', type=int, default=10, help='응답에 포함할 주요 기여 단어 수 (기본값: 10)')
+    parser.add_argument('--cache', type=str, help='형태소 분석 캐시 파일 경로')
+    args = parser.parse_args()
+
+    service = BiasScoringServer(
+        bias_file=args.bias_file,
+        workers=args.workers,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        top_k=args.top,
+        cache_path=args.cache,
+        score_column=args.score_column,
+    )
+
+    try:
+        service.start_pool()
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n편향도 측정 서비스를 종료합니다.")
+    finally:
+        service.close()
@@ -0,0 +1,137 @@
+import time
+import random
+import argparse
+import os
+import sys
+import pandas as pd
+from collections import Counter
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.speech_tokenizer import SpeechTokenizer, SPEECH_COLUMNS, combine_speech_text
+from analysis.morph_backends import BACKENDS
+from database.connection import connect
+
+def load_sample_speeches(sample_size=200, seed=42):
+    """
+    비교에 사용할 발언 표본 추출
+
+    Args:
+        sample_size: 표본 발언 수
+        seed: 표본 추출 시드 (같은 시드면 같은 표본)
+
+    Returns:
+        발언 텍스트 목록
+    """
+    conn = connect('read_only')
+
+    try:
+        speech_ids = [row[0] for row in conn.execute("SELECT id FROM speeches")]
+        sample_ids = sorted(random.Random(seed).sample(speech_ids, min(sample_size, len(speech_ids))))
+
+        texts = []
+        query = f"SELECT {', '.join(SPEECH_COLUMNS)} FROM speeches WHERE id = ?"
+        for speech_id in sample_ids:
+            row = conn.execute(query, (speech_id,)).fetchone()
+            texts.append(combine_speech_text(row))
+    finally:
+        conn.close()
+
+    print(f"비교용 발언 {len(texts)}개를 추출했습니다.")
+    return texts
+
+def token_agreement(reference_tokens, tokens):
+    """
+    기준 토큰 목록과 비교 토큰 목록의 일치 정도 계산 (토큰 빈도를 고려한 다중집합 비교)
+
+    Returns:
+        (일치 토큰 수, 기준 토큰 수, 비교 토큰 수)
+    """
+    reference_counts = Counter(reference_tokens)
+    counts = Counter(tokens)
+    matched = sum((reference_counts & counts).values())
+    return matched, sum(reference_counts.values()), sum(counts.values())
+
+def compare_backends(texts, backends, reference='kkma'):
+    """
+    형태소 분석기별 처리 속도와 기준 분석기(Kkma)와의 토큰 일치도 비교
+
+    Args:
+        texts: 비교에 사용할 발언 텍스트 목록
+        backends: 비교할 형태소 분석기 이름 목록
+        reference: 일치도 기준 분석기 이름
+
+    Returns:
+        분석기별 비교 결과 데이터프레임
+    """
+    results = {}
+    tokens_by_backend = {}
+
+    for name in [reference] + [backend for backend in backends if backend != reference]:
+        try:
+            tokenizer = SpeechTokenizer(use_database=False, backend=name)
+        except Exception as e:
+            print(f"{name} 형태소 분석기를 사용할 수 없습니다: {e}")
+            continue
+
+        # 첫 호출에 포함된 JVM/사전 로딩 시간은 제외
+        tokenizer.tokenize_text('국회 회의록 형태소 분석 준비')
+
+        print(f"{name} 형태소 분석 중...")
+        start_time = time.perf_counter()
+        tokens_by_backend[name] = [tokenizer.tokenize_text(text) for text in texts]
+        elapsed = time.perf_counter() - start_time
+
+        total_chars = sum(len(text) for text in texts)
+        total_tokens = sum(len(tokens) for tokens in tokens_by_backend[name])
+        results[name] = {
+            'backend': name,
+            'seconds': elapsed,
+            'docs_per_sec': len(texts) / elapsed if elapsed > 0 else 0,
+            'chars_per_sec': total_chars / elapsed if elapsed > 0 else 0,
+            'tokens_per_doc': total_tokens / len(texts) if texts else 0,
+        }
+
+    if reference not in tokens_by_backend:
+        raise ValueError(f"기준 형태소 분석기({reference})를 사용할 수 없어 일치도를 계산할 수 없습니다.")
+
+    # 기준 분석기와의 토큰 일치도 (단어+품사 기준, 단어 기준)
+    for name, backend_tokens in tokens_by_backend.items():
+        tagged = [0, 0, 0]
+        words = [0, 0, 0]
+        for reference_tokens, tokens in zip(tokens_by_backend[reference], backend_tokens):
+            for totals, counts in [
+                (tagged, token_agreement(reference_tokens, tokens)),
+                (words, token_agreement([word for word, _ in reference_tokens], [word for word, _ in tokens])),
+            ]:
+                for i, count in enumerate(counts):
+                    totals[i] += count
+
+        for prefix, (matched, reference_total, total) in [('token', tagged), ('word', words)]:
+            precision = matched / total if total > 0 else 0
+            recall = matched / reference_total if reference_total > 0 else 0
+            f1 = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0
+            results[name][f'{prefix}_precision'] = precision
+            results[name][f'{prefix}_recall'] = recall
+            results[name][f'{prefix}_f1'] = f1
+
+    return pd.DataFrame(list(results.values()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='형태소 분석기별 처리 속도 및 Kkma 일치도 비교 도구')
+    parser.add_argument('--backends', type=str, nargs='+', default=list(BACKENDS), choices=list(BACKENDS),
+                        help='비교할 형태소 분석기 (기본값: 전체)')
+    parser.add_argument('--sample', type=int, default=200, help='비교에 사용할 발언 수 (기본값: 200)')
+    parser.add_argument('--seed', type=int, default=42, help='표본 추출 시드 (기본값: 42)')
+    parser.add_argument('--output', type=str, help='비교 결과를 저장할 CSV 파일 경로')
+    args = parser.parse_args()
+
+    texts = load_sample_speeches(args.sample, args.seed)
+    report = compare_backends(texts, args.backends)
+
+    print("\n=== 형태소 분석기 비교 결과 (기준: kkma) ===")
+    print(report.to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+
+    if args.output:
+        report.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"비교 결과가 {args.output}에 저장되었습니다.")
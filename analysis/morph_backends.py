@@ -0,0 +1,162 @@
+from abc import ABC, abstractmethod
+
+# 분석에 사용하는 의미있는 품사 (Kkma 품사 태그 기준)
+# NNG(일반명사), NNP(고유명사), VV(동사), VA(형용사), VXV(보조동사), VXA(보조형용사)
+MEANINGFUL_TAGS = ['NNG', 'NNP', 'VV', 'VA', 'VXV', 'VXA']
+
+class MorphBackend(ABC):
+    """
+    형태소 분석기 공통 클래스
+
+    분석기마다 품사 체계가 다르므로 각 분석기의 품사 태그를 Kkma 기준 품사 태그로 변환한다.
+    변환 대상이 아닌 품사는 결과에서 제외된다.
+    """
+
+    # 분석기 이름 (캐시 구분 및 명령행 인수에 사용)
+    name = None
+
+    # 분석기 품사 태그 → Kkma 기준 품사 태그
+    tag_map = {}
+
+    def __init__(self):
+        """
+        초기화 함수
+        """
+        self.tagger = self._create_tagger()
+
+    @abstractmethod
+    def _create_tagger(self):
+        """
+        KoNLPy 형태소 분석기 생성
+        """
+
+    def _pos(self, text):
+        """
+        분석기 고유 품사 태그로 형태소 분석
+        """
+        return self.tagger.pos(text)
+
+    def map_tag(self, tag):
+        """
+        분석기 품사 태그를 Kkma 기준 품사 태그로 변환 (대상이 아니면 None)
+        """
+        return self.tag_map.get(tag)
+
+    def normalize_word(self, word, tag):
+        """
+        Kkma와 같은 형태가 되도록 단어 정규화
+        """
+        return word
+
+    def pos(self, text):
+        """
+        형태소 분석 후 Kkma 기준 품사로 변환된 (단어, 품사) 목록 반환
+        """
+        pos_tagged = []
+        for word, tag in self._pos(text):
+            mapped_tag = self.map_tag(tag)
+            if mapped_tag:
+                pos_tagged.append((self.normalize_word(word, mapped_tag), mapped_tag))
+        return pos_tagged
+
+class KkmaBackend(MorphBackend):
+    """
+    Kkma 형태소 분석기 (기준 분석기)
+    """
+
+    name = 'kkma'
+    tag_map = {tag: tag for tag in MEANINGFUL_TAGS}
+
+    def _create_tagger(self):
+        from konlpy.tag import Kkma
+        return Kkma()
+
+class OktBackend(MorphBackend):
+    """
+    Okt(Open Korean Text) 형태소 분석기
+
+    Okt는 일반명사와 고유명사, 본용언과 보조용언을 구분하지 않으므로
+    명사는 NNG, 동사는 VV, 형용사는 VA로 변환한다.
+    """
+
+    name = 'okt'
+    tag_map = {
+        'Noun': 'NNG',
+        'Verb': 'VV',
+        'Adjective': 'VA',
+    }
+
+    def _create_tagger(self):
+        from konlpy.tag import Okt
+        return Okt()
+
+    def _pos(self, text):
+        # 용언을 기본형으로 변환 (예: 했습니다 → 하다)
+        return self.tagger.pos(text, stem=True)
+
+    def normalize_word(self, word, tag):
+        # Kkma는 용언의 어간만 반환하므로 기본형 어미 '다'를 제거 (예: 하다 → 하)
+        if tag in ('VV', 'VA') and len(word) > 1 and word.endswith('다'):
+            return word[:-1]
+        return word
+
+class KomoranBackend(MorphBackend):
+    """
+    Komoran 형태소 분석기 (세종 품사 체계)
+
+    보조용언(VX)은 보조동사/보조형용사를 구분하지 않으므로 VXV로 변환한다.
+    """
+
+    name = 'komoran'
+    tag_map = {
+        'NNG': 'NNG',
+        'NNP': 'NNP',
+        'VV': 'VV',
+        'VA': 'VA',
+        'VX': 'VXV',
+    }
+
+    def _create_tagger(self):
+        from konlpy.tag import Komoran
+        return Komoran()
+
+class MecabBackend(MorphBackend):
+    """
+    Mecab 형태소 분석기 (mecab-ko-dic 품사 체계)
+
+    'VV+EP'처럼 여러 형태소가 결합된 태그는 첫 번째 형태소의 품사를 사용한다.
+    이때 단어는 어미가 포함된 형태로 남으므로 Kkma 결과와 차이가 생길 수 있다.
+    """
+
+    name = 'mecab'
+    tag_map = {
+        'NNG': 'NNG',
+        'NNP': 'NNP',
+        'VV': 'VV',
+        'VA': 'VA',
+        'VX': 'VXV',
+    }
+
+    def _create_tagger(self):
+        from konlpy.tag import Mecab
+        return Mecab()
+
+    def map_tag(self, tag):
+        return self.tag_map.get(tag.split('+')[0])
+
+# 사용 가능한 형태소 분석기 목록
+BACKENDS = {
+    backend.name: backend
+    for backend in [KkmaBackend, OktBackend, KomoranBackend, MecabBackend]
+}
+
+def get_backend(name):
+    """
+    이름으로 형태소 분석기 생성
+
+    Args:
+        name: 분석기 이름 (kkma, okt, komoran, mecab)
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 형태소 분석기입니다: {name} (지원: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
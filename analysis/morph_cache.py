@@ -0,0 +1,151 @@
+import json
+import hashlib
+from collections import OrderedDict
+from database.connection import connect
+
+# 형태소 분석 캐시 파일 경로
+CACHE_DATABASE_NAME = 'morph_cache.db'
+
+class MorphCache:
+    """
+    형태소 분석 결과를 문장 텍스트 해시 기준으로 저장하는 캐시 클래스
+
+    회의록에는 의사진행 발언 등 같은 문장이 반복해서 등장하므로, SpeechTokenizer는 발언을 문장 단위로 나누어
+    같은 문장은 형태소 분석기를 다시 호출하지 않고 저장된 (단어, 품사) 목록을 사용한다.
+    메모리의 LRU 캐시를 먼저 조회하고, 없으면 SQLite 캐시 파일을 조회한다.
+    불용어 목록이 바뀌어도 캐시를 다시 만들 필요가 없도록 불용어 제거 전의 결과를 저장한다.
+    """
+
+    def __init__(self, path=CACHE_DATABASE_NAME, memory_size=100000, namespace='kkma', flush_size=1000):
+        """
+        초기화 함수
+
+        Args:
+            path: 캐시 SQLite 파일 경로
+            memory_size: 메모리 LRU 캐시에 유지할 최대 항목 수
+            namespace: 캐시 키 구분자 (형태소 분석기가 다르면 결과도 다르므로 분석기 이름을 사용)
+            flush_size: 새 항목을 파일에 기록하는 단위
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self.namespace = namespace
+        self.flush_size = flush_size
+
+        # 여러 워커 프로세스가 같은 캐시 파일을 사용하므로 WAL 모드로 연결
+        self.conn = connect(path=path)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS morph_cache (
+            key TEXT PRIMARY KEY,
+            tokens TEXT
+        )
+        """)
+        self.conn.commit()
+
+        self.memory = OrderedDict()
+        self.pending = {}
+
+        # 캐시 적중/실패 횟수
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _key(self, text):
+        """
+        캐시 키 생성 (분석기 이름 + 텍스트의 해시)
+        """
+        return hashlib.sha1(f"{self.namespace}\0{text}".encode('utf-8')).hexdigest()
+
+    def _remember(self, key, tokens):
+        """
+        메모리 LRU 캐시에 항목 추가 (최대 크기를 넘으면 가장 오래된 항목 제거)
+        """
+        self.memory[key] = tokens
+        self.memory.move_to_end(key)
+
+        if len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def get(self, text):
+        """
+        캐시에서 형태소 분석 결과 조회
+
+        Returns:
+            (단어, 품사) 목록, 캐시에 없으면 None
+        """
+        key = self._key(text)
+
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.memory_hits += 1
+            return self.memory[key]
+
+        if key in self.pending:
+            tokens_json = self.pending[key]
+        else:
+            row = self.conn.execute("SELECT tokens FROM morph_cache WHERE key = ?", (key,)).fetchone()
+            tokens_json = row[0] if row else None
+
+        if tokens_json is None:
+            self.misses += 1
+            return None
+
+        tokens = [tuple(token) for token in json.loads(tokens_json)]
+        self._remember(key, tokens)
+        self.disk_hits += 1
+        return tokens
+
+    def put(self, text, tokens):
+        """
+        형태소 분석 결과를 캐시에 저장
+        """
+        key = self._key(text)
+        self._remember(key, tokens)
+        self.pending[key] = json.dumps(tokens, ensure_ascii=False)
+
+        if len(self.pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """
+        아직 기록하지 않은 항목을 캐시 파일에 저장
+        """
+        if not self.pending:
+            return
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO morph_cache (key, tokens) VALUES (?, ?)",
+            self.pending.items()
+        )
+        self.conn.commit()
+        self.pending = {}
+
+    def stats(self):
+        """
+        캐시 적중/실패 통계
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hit_rate = (self.memory_hits + self.disk_hits) / lookups * 100 if lookups > 0 else 0
+
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': hit_rate,
+        }
+
+    def print_stats(self):
+        """
+        캐시 적중/실패 통계 출력
+        """
+        stats = self.stats()
+        print(f"형태소 분석 캐시: 메모리 적중 {stats['memory_hits']:,}회, 파일 적중 {stats['disk_hits']:,}회, "
+              f"실패 {stats['misses']:,}회 (적중률: {stats['hit_rate']:.2f}%)")
+
+    def close(self):
+        """
+        남은 항목을 저장하고 연결 종료
+        """
+        if self.conn:
+            self.flush()
+            self.conn.close()
+            self.conn = None
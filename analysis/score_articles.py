@@ -0,0 +1,268 @@
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.speech_tokenizer import SpeechTokenizer, _init_worker, _tokenize_rows
+from analysis.bias_scorer import BiasScorer
+from instrumentation import METRICS
+
+# 결과 파일 열 목록
+OUTPUT_COLUMNS = ['id', 'score', 'coverage', 'matched_tokens', 'total_tokens', 'top_words']
+
+def _init_scoring_worker(*args):
+    """
+    기사 점수 계산용 워커 초기화 (표준 출력은 결과 출력에 사용되므로 로그는 표준 오류로 출력)
+    """
+    sys.stdout = sys.stderr
+    _init_worker(*args)
+
+def detect_format(path, file_format=None):
+    """
+    입력 파일 형식 결정 (지정하지 않으면 확장자로 판단)
+    """
+    if file_format:
+        return file_format
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.json', '.ndjson'):
+        return 'jsonl'
+    if extension == '.csv':
+        return 'csv'
+    return 'txt'
+
+def iter_documents(path, file_format, text_field='text', id_field='id'):
+    """
+    입력 파일에서 (문서 ID, 텍스트)를 한 건씩 읽기 (파일 전체를 메모리에 올리지 않음)
+
+    Args:
+        path: 입력 파일 경로 ('-'이면 표준 입력)
+        file_format: 입력 형식 (jsonl, csv, txt - txt는 한 줄에 문서 하나)
+        text_field: jsonl/csv의 본문 필드 이름
+        id_field: jsonl/csv의 문서 ID 필드 이름 (없으면 순번 사용)
+    """
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8-sig', newline='')
+
+    try:
+        if file_format == 'jsonl':
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"{line_no}번째 줄을 읽을 수 없어 건너뜁니다.", file=sys.stderr)
+                    continue
+                if not isinstance(record, dict):
+                    print(f"{line_no}번째 줄이 JSON 객체가 아니어서 건너뜁니다.", file=sys.stderr)
+                    continue
+                yield record.get(id_field, line_no), record.get(text_field) or ''
+
+        elif file_format == 'csv':
+            csv.field_size_limit(sys.maxsize)
+            for row_no, record in enumerate(csv.DictReader(f), 1):
+                yield record.get(id_field) or row_no, record.get(text_field) or ''
+
+        else:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if line:
+                    yield line_no, line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def iter_batches(documents, batch_size):
+    """
+    문서를 batch_size개씩 묶기
+    """
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class ResultWriter:
+    """
+    점수 계산 결과를 JSONL 또는 CSV로 바로바로 기록하는 클래스
+    """
+
+    def __init__(self, f, output_format='jsonl'):
+        self.f = f
+        self.output_format = output_format
+        self.csv_writer = None
+
+        if output_format == 'csv':
+            self.csv_writer = csv.writer(f)
+            self.csv_writer.writerow(OUTPUT_COLUMNS)
+
+    def write(self, doc_ids, scores):
+        """
+        한 배치의 결과 기록
+        """
+        for doc_id, row in zip(doc_ids, scores.itertuples(index=False)):
+            score = None if row.score != row.score else float(row.score)
+            top_words = getattr(row, 'top_words', [])
+
+            if self.csv_writer:
+                self.csv_writer.writerow([
+                    doc_id, score, f"{row.coverage:.6f}", row.matched_tokens, row.total_tokens,
+                    ';'.join(f"{word}:{contribution:.6f}" for word, _, contribution in top_words),
+                ])
+            else:
+                self.f.write(json.dumps({
+                    'id': doc_id,
+                    'score': score,
+                    'coverage': float(row.coverage),
+                    'matched_tokens': int(row.matched_tokens),
+                    'total_tokens': int(row.total_tokens),
+                    'top_words': [[word, count, contribution] for word, count, contribution in top_words],
+                }, ensure_ascii=False) + '\n')
+
+        self.f.flush()
+
+def score_articles(input_path, output_path='-', bias_file='word_political_bias_1d.csv', file_format=None,
+                   output_format=None, text_field='text', id_field='id', workers=1, batch_size=64,
+                   max_pending=None, top_k=5, cache_path=None, report_interval=10.0, score_column='bias_score'):
+    """
+    기사 파일을 스트리밍으로 읽어 토큰화하고 편향 점수를 계산하여 바로 기록
+
+    읽기 → 토큰화(워커 풀) → 점수 계산 → 기록 단계를 배치 단위로 처리하며,
+    워커에 동시에 전달하는 배치 수를 max_pending으로 제한하여 입력 크기와 관계없이
+    메모리 사용량이 일정하게 유지된다.
+
+    Args:
+        input_path: 입력 파일 경로 ('-'이면 표준 입력)
+        output_path: 결과 파일 경로 ('-'이면 표준 출력)
+        bias_file: 단어별 정치적 편향 점수 CSV 또는 바이너리 파일 경로
+        file_format: 입력 형식 (jsonl, csv, txt, None이면 확장자로 판단)
+        output_format: 출력 형식 (jsonl, csv, None이면 확장자로 판단)
+        text_field: 본문 필드 이름
+        id_field: 문서 ID 필드 이름
+        workers: 토큰화 워커 프로세스 수
+        batch_size: 한 번에 토큰화/점수 계산할 문서 수
+        max_pending: 동시에 처리 중인 최대 배치 수 (기본값: 워커 수의 2배)
+        top_k: 문서별로 기록할 주요 기여 단어 수
+        cache_path: 형태소 분석 캐시 파일 경로
+        report_interval: 처리 속도 출력 간격 (초)
+        score_column: 편향 점수 열 이름 (예: bias_score, bias_x, bias_y)
+
+    Returns:
+        처리한 문서 수
+    """
+    file_format = detect_format(input_path, file_format)
+    output_format = output_format or ('csv' if output_path.endswith('.csv') else 'jsonl')
+    max_pending = max_pending or max(2, workers * 2)
+
+    output_file = sys.stdout if output_path == '-' else open(output_path, 'w', encoding='utf-8', newline='')
+    # 표준 출력으로 결과를 기록하는 경우 로그가 섞이지 않도록 로그는 표준 오류로 출력
+    log_stdout = sys.stdout
+    sys.stdout = sys.stderr
+
+    pool = None
+    try:
+        scorer = BiasScorer.load(bias_file, score_column=score_column)
+        writer = ResultWriter(output_file, output_format)
+
+        if workers > 1:
+            # 워커마다 자체 형태소 분석기(JVM)를 가지므로 spawn 방식으로 생성
+            pool = multiprocessing.get_context('spawn').Pool(
+                workers, initializer=_init_scoring_worker, initargs=('kkma', cache_path)
+            )
+        else:
+            scorer.tokenizer = SpeechTokenizer(use_database=False, cache_path=cache_path)
+
+        start_time = time.perf_counter()
+        last_report = start_time
+        total_docs = 0
+        pending = deque()
+
+        def write_results(doc_ids, token_lists):
+            scores = scorer.score_token_batch(token_lists, top_k=top_k)
+            writer.write(doc_ids, scores)
+
+        def drain(limit):
+            # 가장 먼저 보낸 배치부터 순서대로 결과 기록
+            nonlocal total_docs
+            while len(pending) > limit:
+                doc_ids, async_result = pending.popleft()
+                results, worker_metrics = async_result.get()
+                METRICS.merge(worker_metrics)
+                write_results(doc_ids, [tokens for _, tokens, _ in results])
+                total_docs += len(doc_ids)
+
+        for batch in iter_batches(iter_documents(input_path, file_format, text_field, id_field), batch_size):
+            doc_ids = [doc_id for doc_id, _ in batch]
+
+            if pool is None:
+                write_results(doc_ids, [scorer.tokenize(text) for _, text in batch])
+                total_docs += len(batch)
+            else:
+                # 워커에는 배치 내 순번만 전달 (결과는 입력 순서대로 반환됨)
+                rows = [(idx, text) for idx, (_, text) in enumerate(batch)]
+                pending.append((doc_ids, pool.apply_async(_tokenize_rows, (rows,))))
+                drain(max_pending)
+
+            now = time.perf_counter()
+            if now - last_report >= report_interval:
+                print(f"{total_docs:,}개 문서 처리 ({total_docs / (now - start_time):.1f} docs/sec)")
+                last_report = now
+
+        drain(0)
+
+        elapsed = time.perf_counter() - start_time
+        rate = total_docs / elapsed if elapsed > 0 else 0
+        print(f"총 {total_docs:,}개 문서 처리 완료 ({elapsed:.1f}초, {rate:.1f} docs/sec)")
+        METRICS.print_summary('토큰화 실행 지표')
+        return total_docs
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        sys.stdout = log_stdout
+        if output_file is not sys.stdout:
+            output_file.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='대량 기사 정치적 편향도 측정 도구')
+    parser.add_argument('input', type=str, help="입력 파일 경로 (JSONL, CSV, 텍스트, '-'이면 표준 입력)")
+    parser.add_argument('--output', type=str, default='-', help="결과 파일 경로 ('-'이면 표준 출력, 기본값: -)")
+    parser.add_argument('--bias-file', type=str, default='word_political_bias_1d.csv',
+                        help='단어별 정치적 편향 점수 CSV 또는 바이너리 파일 경로')
+    parser.add_argument('--score-column', type=str, default='bias_score', help='편향 점수 열 이름 (기본값: bias_score)')
+    parser.add_argument('--format', type=str, choices=['jsonl', 'csv', 'txt'], help='입력 형식 (기본값: 확장자로 판단)')
+    parser.add_argument('--output-format', type=str, choices=['jsonl', 'csv'], help='출력 형식 (기본값: 확장자로 판단)')
+    parser.add_argument('--text-field', type=str, default='text', help='본문 필드 이름 (기본값: text)')
+    parser.add_argument('--id-field', type=str, default='id', help='문서 ID 필드 이름 (기본값: id)')
+    parser.add_argument('--workers', type=int, default=1, help='토큰화 워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('--batch-size', type=int, default=64, help='배치당 문서 수 (기본값: 64)')
+    parser.add_argument('--max-pending', type=int, help='동시에 처리 중인 최대 배치 수 (기본값: 워커 수의 2배)')
+    parser.add_argument('--top', type=int, default=5, help='문서별로 기록할 주요 기여 단어 수 (기본값: 5)')
+    parser.add_argument('--cache', type=str, help='형태소 분석 캐시 파일 경로')
+    args = parser.parse_args()
+
+    score_articles(
+        args.input,
+        output_path=args.output,
+        bias_file=args.bias_file,
+        file_format=args.format,
+        output_format=args.output_format,
+        text_field=args.text_field,
+        id_field=args.id_field,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        max_pending=args.max_pending,
+        top_k=args.top,
+        cache_path=args.cache,
+        score_column=args.score_column,
+    )
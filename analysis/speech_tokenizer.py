@@ -1,29 +1,282 @@
 import sqlite3
 import re
+import json
+import hashlib
+import heapq
+import time
+import multiprocessing
+import os
+import sys
 import pandas as pd
-from konlpy.tag import Kkma
 from collections import Counter
 
-# 데이터베이스 파일 경로
-DATABASE_NAME = 'political_speeches.db'
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.morph_cache import MorphCache, CACHE_DATABASE_NAME
+from analysis.morph_backends import BACKENDS, MEANINGFUL_TAGS, get_backend
+from analysis.token_store import TokenStore
+from database.connection import connect
+from instrumentation import METRICS, Progress, configure, count, timer
+
+# 발언 내용이 나뉘어 저장된 열 목록
+SPEECH_COLUMNS = ['발언내용1', '발언내용2', '발언내용3', '발언내용4', '발언내용5', '발언내용6', '발언내용7']
+
+def combine_speech_text(values):
+    """
+    발언내용1~7 값을 하나의 발언 텍스트로 합치기
+    """
+    return ' '.join(str(value) if not pd.isna(value) else '' for value in values)
+
+def tokenizer_settings_key(backend='kkma', max_segment_length=0, sentences=False):
+    """
+    토큰화 결과에 영향을 주는 설정 (원문 해시에 포함하여 설정이 바뀐 발언을 증분 처리에서 다시 토큰화)
+    
+    기본 설정(kkma, 나누지 않음, 문장별 분석 안 함)은 빈 문자열이므로 설정을 포함하기 전에 저장한 원문 해시와 같다.
+    
+    Args:
+        sentences: 문장별로 형태소 분석 (캐시를 사용하는 경우)
+    """
+    if backend == 'kkma' and not max_segment_length and not sentences:
+        return ''
+    return f"{backend}:{max_segment_length or 0}" + (':sentences' if sentences else '')
+
+def text_hash(text, settings=''):
+    """
+    발언 텍스트의 해시 (원문 또는 토큰화 설정 변경 여부 확인용)
+    """
+    if settings:
+        text = f"{settings}\n{text}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def speech_text_hash(*values, settings=''):
+    """
+    발언내용1~7 값으로 원문 해시 계산 (SQLite 사용자 정의 함수로 등록하여 사용)
+    """
+    return text_hash(combine_speech_text(values), settings)
+
+def split_sentences(text):
+    """
+    텍스트를 문장 부호(. ? !) 뒤의 공백 기준으로 문장 단위로 나누기
+    """
+    return [sentence for sentence in re.split(r'(?<=[.?!])\s+', text) if sentence]
+
+def split_text(text, max_length):
+    """
+    긴 텍스트를 문장 단위로 나누어 max_length 이하의 구간으로 묶기
+    
+    형태소 분석 시간은 입력 길이에 따라 급격히 늘어나므로 긴 발언은 나누어 분석한다.
+    한 문장이 max_length보다 길면 공백 기준으로, 공백이 없으면 길이 기준으로 자른다.
+    
+    Args:
+        text: 발언 텍스트
+        max_length: 구간 최대 길이 (0 또는 None이면 나누지 않음)
+    
+    Returns:
+        구간 텍스트 목록
+    """
+    if not max_length or not text or len(text) <= max_length:
+        return [text]
+    
+    # 문장 단위로 나눈 뒤 긴 문장은 단어 단위로 다시 나눔
+    pieces = []
+    for sentence in split_sentences(text):
+        if len(sentence) <= max_length:
+            pieces.append(sentence)
+            continue
+        for word in sentence.split():
+            pieces.extend(word[i:i + max_length] for i in range(0, len(word), max_length))
+    
+    # max_length를 넘지 않는 범위에서 이어 붙이기
+    segments = []
+    current = ''
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_length:
+            segments.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        segments.append(current)
+    
+    return segments
+
+# 워커 프로세스별 토크나이저 (프로세스마다 별도의 Kkma/JVM 인스턴스를 사용)
+_worker_tokenizer = None
+
+def _init_worker(backend='kkma', cache_path=None, cache_size=100000, max_segment_length=0):
+    """
+    워커 프로세스 초기화 함수 (데이터베이스 연결 없이 형태소 분석기만 생성)
+    """
+    global _worker_tokenizer
+    _worker_tokenizer = SpeechTokenizer(use_database=False, backend=backend,
+                                        cache_path=cache_path, cache_size=cache_size,
+                                        max_segment_length=max_segment_length)
+    
+    # 워커 종료 시 캐시에 남은 항목 저장
+    multiprocessing.util.Finalize(None, _worker_tokenizer.close, exitpriority=10)
+
+def _tokenize_rows(rows):
+    """
+    워커 프로세스에서 (발언 ID, 발언 텍스트) 목록을 토큰화
+    
+    Returns:
+        ((발언 ID, 토큰 목록, 처리 시간(초)) 목록, 이번 작업에서 측정한 지표)
+        지표는 메인 프로세스에서 METRICS.merge()로 합친다.
+    """
+    results = []
+    for speech_id, text in rows:
+        start_time = time.perf_counter()
+        tokens_with_tags = _worker_tokenizer.tokenize_text(text)
+        results.append((speech_id, tokens_with_tags, time.perf_counter() - start_time))
+    return results, METRICS.snapshot(reset=True)
+
+class SpeechTokenWriter:
+    """
+    토큰화된 발언을 모아서 일괄 업데이트하는 클래스
+    
+    발언마다 UPDATE와 commit을 실행하면 행마다 저널 동기화가 발생하므로,
+    (토큰, 원문 해시, 발언 ID)를 버퍼에 모았다가 executemany로 batch_size 단위로 반영하고
+    commit()은 청크 단위로 한 번만 호출한다.
+    """
+    
+    # 토큰을 저장하는 열 (JSON, 토큰 ID 배열)
+    TOKEN_COLUMNS = ('토큰화된_발언', '토큰_ID')
+    
+    # 저장 형식별로 값을 쓰는 열
+    STORAGE_COLUMNS = {
+        'json': ('토큰화된_발언',),
+        'binary': ('토큰_ID',),
+        'both': ('토큰화된_발언', '토큰_ID'),
+    }
+    
+    def __init__(self, conn, batch_size=500, storage='json'):
+        """
+        초기화 함수
+        
+        Args:
+            conn: 데이터베이스 연결
+            batch_size: executemany 한 번에 반영할 발언 수
+            storage: 토큰 저장 형식 (json: 토큰화된_발언 열, binary: 토큰_ID 열, both: 두 열 모두)
+        """
+        if storage not in self.STORAGE_COLUMNS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {storage}")
+        
+        self.conn = conn
+        self.batch_size = batch_size
+        self.storage = storage
+        self.token_store = TokenStore(conn) if storage != 'json' else None
+        
+        # 다른 저장 형식으로 토큰화한 이전 결과가 남아 읽히지 않도록 다른 형식의 열은 비움
+        existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(speeches)")}
+        assignments = [f"{column} = ?" for column in self.STORAGE_COLUMNS[storage]]
+        assignments += [f"{column} = NULL" for column in self.TOKEN_COLUMNS
+                        if column not in self.STORAGE_COLUMNS[storage] and column in existing_columns]
+        self.update_query = f"UPDATE speeches SET {', '.join(assignments)}, 원문_해시 = ? WHERE id = ?"
+        self.pending = []
+        self.pending_timings = []
+        self.written = 0
+    
+    def add(self, speech_id, tokens_with_tags, source_hash=None):
+        """
+        토큰화된 발언을 버퍼에 추가 (버퍼가 가득 차면 반영)
+        
+        Args:
+            speech_id: 발언 ID
+            tokens_with_tags: (단어, 품사) 목록
+            source_hash: 토큰화한 원문의 해시
+        """
+        values = []
+        if self.storage in ('json', 'both'):
+            with timer('tokenizer.json_encode'):
+                values.append(json.dumps(tokens_with_tags, ensure_ascii=False))
+        if self.storage in ('binary', 'both'):
+            with timer('tokenizer.binary_encode'):
+                values.append(self.token_store.encode(tokens_with_tags))
+        
+        self.pending.append((*values, source_hash, speech_id))
+        
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+    
+    def add_timing(self, speech_id, text_length, segments, seconds):
+        """
+        발언별 형태소 분석 시간을 버퍼에 추가
+        """
+        self.pending_timings.append((speech_id, text_length, segments, seconds))
+    
+    def flush(self):
+        """
+        버퍼에 모인 발언을 현재 트랜잭션에 반영 (커밋하지 않음)
+        """
+        if self.pending_timings:
+            with timer('sql.insert_timings'):
+                self.conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO speech_tokenize_timings (speech_id, text_length, segments, seconds)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    self.pending_timings
+                )
+            self.pending_timings = []
+        
+        if not self.pending:
+            return
+        
+        # 새로 등장한 단어의 vocab ID를 먼저 반영
+        if self.token_store:
+            self.token_store.flush()
+        
+        with timer('sql.update_tokens'):
+            self.conn.executemany(self.update_query, self.pending)
+        count('sql.updated_speeches', len(self.pending))
+        self.written += len(self.pending)
+        self.pending = []
+    
+    def commit(self):
+        """
+        남은 버퍼를 반영하고 트랜잭션 커밋
+        """
+        self.flush()
+        with timer('sql.commit'):
+            self.conn.commit()
 
 class SpeechTokenizer:
     """
     국회의원 발언 텍스트를 토큰화하고 불용어를 제거하는 클래스
     """
     
-    def __init__(self):
+    def __init__(self, use_database=True, backend='kkma', cache_path=None, cache_size=100000,
+                 max_segment_length=0):
         """
         초기화 함수
+        
+        Args:
+            use_database: 데이터베이스 연결 여부 (워커 프로세스에서는 형태소 분석만 수행하므로 False)
+            backend: 형태소 분석기 이름 (kkma, okt, komoran, mecab)
+            cache_path: 형태소 분석 캐시 파일 경로 (None이면 캐시를 사용하지 않음)
+            cache_size: 메모리 LRU 캐시에 유지할 최대 항목 수
+            max_segment_length: 한 번에 형태소 분석할 최대 글자 수 (더 긴 발언은 문장 단위로 나누어 분석, 0이면 나누지 않음)
+                (나누면 형태소 분석 결과가 나누지 않은 경우와 달라질 수 있으므로 기본값은 0)
         """
-        self.conn = sqlite3.connect(DATABASE_NAME)
-        self.kkma = Kkma()
+        self.conn = connect('bulk') if use_database else None
+        self.backend = get_backend(backend)
+        self.cache_path = cache_path
+        self.cache_size = cache_size
+        self.max_segment_length = max_segment_length
+        self.settings_key = tokenizer_settings_key(self.backend.name, max_segment_length, sentences=bool(cache_path))
+        self.cache = MorphCache(cache_path, memory_size=cache_size, namespace=backend) if cache_path else None
         
         # 불용어 목록 로드
         self.stopwords = self._load_stopwords()
         
         # 기존 speeches 테이블에 토큰화된 텍스트를 저장할 열 추가
-        self._alter_speeches_table()
+        if self.conn:
+            self._alter_speeches_table()
+            self._create_checkpoint_table()
+            self._create_timing_table()
+            self.conn.create_function('speech_text_hash', len(SPEECH_COLUMNS),
+                                      lambda *values: speech_text_hash(*values, settings=self.settings_key),
+                                      deterministic=True)
     
     def _load_stopwords(self):
         """
@@ -46,32 +299,176 @@ class SpeechTokenizer:
         except sqlite3.OperationalError:
             # 이미 열이 존재하는 경우
             print("'토큰화된_발언' 열이 이미 존재합니다.")
+        
+        try:
+            # 토큰화한 원문의 해시를 저장할 열 추가 (원문 변경 감지용)
+            self.conn.execute("ALTER TABLE speeches ADD COLUMN 원문_해시 TEXT")
+            self.conn.commit()
+            print("speeches 테이블에 '원문_해시' 열이 추가되었습니다.")
+        except sqlite3.OperationalError:
+            pass
+        
+        # 토큰 ID 배열(바이너리 저장 형식)을 저장할 열 추가 (증분 처리 조건에서 JSON 형식일 때도 사용)
+        TokenStore.add_token_id_column(self.conn)
+    
+    def _create_checkpoint_table(self):
+        """
+        중단된 토큰화 작업을 이어서 진행하기 위한 체크포인트 테이블 생성
+        """
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS tokenizer_checkpoint (
+            name TEXT PRIMARY KEY,
+            last_id INTEGER,
+            updated_at TEXT
+        )
+        """)
+        self.conn.commit()
+    
+    def _create_timing_table(self):
+        """
+        발언별 형태소 분석 시간을 기록할 테이블 생성 (비정상적으로 오래 걸리는 발언 확인용)
+        """
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS speech_tokenize_timings (
+            speech_id INTEGER PRIMARY KEY,
+            text_length INTEGER,
+            segments INTEGER,
+            seconds REAL
+        )
+        """)
+        self.conn.commit()
+    
+    def _load_checkpoint(self):
+        """
+        마지막으로 처리한 발언 ID 조회 (체크포인트가 없으면 0)
+        """
+        row = self.conn.execute(
+            "SELECT last_id FROM tokenizer_checkpoint WHERE name = 'speeches'"
+        ).fetchone()
+        return row[0] if row else 0
+    
+    def _save_checkpoint(self, last_id):
+        """
+        마지막으로 처리한 발언 ID 저장 (청크 커밋과 같은 트랜잭션에서 실행)
+        """
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO tokenizer_checkpoint (name, last_id, updated_at)
+            VALUES ('speeches', ?, datetime('now'))
+            """,
+            (last_id,)
+        )
+    
+    def _clear_checkpoint(self):
+        """
+        전체 발언 처리가 끝나면 체크포인트 삭제
+        """
+        self.conn.execute("DELETE FROM tokenizer_checkpoint WHERE name = 'speeches'")
+        self.conn.commit()
+    
+    def _backfill_source_hashes(self):
+        """
+        원문 해시 열이 추가되기 전에 토큰화된 발언의 해시를 채움
+        (기존 토큰화 결과는 현재 원문 기준으로 만들어졌다고 간주)
+        """
+        columns = ', '.join(SPEECH_COLUMNS)
+        cursor = self.conn.execute(f"""
+        UPDATE speeches SET 원문_해시 = speech_text_hash({columns})
+        WHERE (토큰화된_발언 IS NOT NULL OR 토큰_ID IS NOT NULL) AND 원문_해시 IS NULL
+        """)
+        self.conn.commit()
+        
+        if cursor.rowcount > 0:
+            print(f"기존 토큰화된 발언 {cursor.rowcount:,}개의 원문 해시를 채웠습니다.")
+    
+    def split_text(self, text):
+        """
+        긴 텍스트를 형태소 분석 구간으로 나누기
+        """
+        return split_text(text, self.max_segment_length)
     
     def tokenize_text(self, text):
         """
         텍스트를 형태소 분석하여 명사, 동사, 형용사 등 의미있는 품사만 추출
+        (긴 텍스트는 구간별로 분석한 뒤 결과를 순서대로 합침)
         """
         if not text or pd.isna(text):
             return []
         
-        # 특수문자 및 숫자 제거
+        segments = self.split_text(text)
+        if len(segments) == 1:
+            return self._tokenize_segment(segments[0])
+        
+        tokens_with_tags = []
+        for segment in segments:
+            tokens_with_tags.extend(self._tokenize_segment(segment))
+        return tokens_with_tags
+    
+    @staticmethod
+    def _clean_text(text):
+        """
+        특수문자 및 숫자 제거
+        """
         text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', ' ', text)
+        return re.sub(r'\d+', ' ', text)
+    
+    def _analyze(self, text):
+        """
+        형태소 분석 후 의미있는 품사의 (단어, 품사) 목록 반환 (불용어 제거 전)
+        """
+        # 형태소 분석 (Kkma는 처리 시간이 오래 걸릴 수 있음)
+        # 분석기 품사 태그는 Kkma 기준 품사 태그로 변환됨
+        with timer(f"tokenizer.{self.backend.name}_pos"):
+            pos_tagged = self.backend.pos(text)
+        count('tokenizer.analyzed_chars', len(text))
         
-        try:
-            # 형태소 분석 (Kkma는 처리 시간이 오래 걸릴 수 있음)
-            pos_tagged = self.kkma.pos(text)
+        # 의미있는 품사만 선택 (명사, 동사, 형용사)
+        # Kkma 품사 태그: NNG(일반명사), NNP(고유명사), VV(동사), VA(형용사), VXV(보조동사), VXA(보조형용사)
+        return [(word, tag) for word, tag in pos_tagged if tag in MEANINGFUL_TAGS and len(word) > 1]
+    
+    def _analyze_cached(self, text):
+        """
+        문장 단위로 캐시를 조회하여 형태소 분석
+        
+        회의록에서 반복되는 의사진행 문구는 발언 전체가 아니라 문장 단위로 반복되므로,
+        문장마다 캐시를 조회하고 캐시에 없는 문장만 형태소 분석기로 분석한다.
+        """
+        tokens_with_tags = []
+        for sentence in split_sentences(text):
+            sentence = self._clean_text(sentence).strip()
+            if not sentence:
+                continue
             
-            # 의미있는 품사만 선택 (명사, 동사, 형용사)
-            # Kkma 품사 태그: NNG(일반명사), NNP(고유명사), VV(동사), VA(형용사), VXV(보조동사), VXA(보조형용사)
-            meaningful_tags = ['NNG', 'NNP', 'VV', 'VA', 'VXV', 'VXA']
-            tokens_with_tags = [(word, tag) for word, tag in pos_tagged if tag in meaningful_tags and len(word) > 1]
+            sentence_tokens = self.cache.get(sentence)
+            if sentence_tokens is None:
+                sentence_tokens = self._analyze(sentence)
+                self.cache.put(sentence, sentence_tokens)
+            tokens_with_tags.extend(sentence_tokens)
+        return tokens_with_tags
+    
+    def _tokenize_segment(self, text):
+        """
+        한 구간의 텍스트를 형태소 분석
+        
+        캐시를 사용하면 문장별로 분석한 결과를 합치고, 사용하지 않으면 구간 전체를 한 번에 분석한다.
+        """
+        if not text:
+            return []
+        
+        count('tokenizer.segments')
+        
+        try:
+            if self.cache:
+                tokens_with_tags = self._analyze_cached(text)
+            else:
+                tokens_with_tags = self._analyze(self._clean_text(text))
             
             # 불용어 제거
             filtered_tokens = [(token, tag) for token, tag in tokens_with_tags if token not in self.stopwords]
             
             return filtered_tokens
         except Exception as e:
+            count('tokenizer.errors')
             print(f"형태소 분석 중 오류 발생: {e}")
             return []
     
@@ -80,7 +477,6 @@ class SpeechTokenizer:
         특정 발언의 토큰화된 텍스트를 speeches 테이블에 직접 업데이트
         """
         # 토큰과 태그를 문자열로 변환 (JSON 형식)
-        import json
         tokens_json = json.dumps(tokens_with_tags, ensure_ascii=False)
         
         # speeches 테이블 업데이트
@@ -91,73 +487,242 @@ class SpeechTokenizer:
         
         self.conn.commit()
     
-    def process_speeches(self, limit=None):
+    @staticmethod
+    def _combine_speech_text(row):
+        """
+        발언내용1~7 열을 하나의 발언 텍스트로 합치기
+        """
+        return combine_speech_text(row[column] for column in SPEECH_COLUMNS)
+    
+    def _tokenize_chunk(self, rows, pool=None, worker_chunk_size=50):
+        """
+        청크 단위 발언 토큰화
+        
+        워커 풀을 사용하는 경우 긴 발언의 구간도 각각 별도 작업으로 분배하여
+        한 발언이 한 워커를 오래 점유하지 않도록 한다.
+        
+        Args:
+            rows: (발언 ID, 발언 텍스트) 목록
+            pool: 워커 프로세스 풀 (None이면 현재 프로세스에서 순차 처리)
+            worker_chunk_size: 워커에 한 번에 전달할 작업(발언 또는 구간) 수
+        
+        Returns:
+            (발언 ID, 토큰 목록, 구간 수, 처리 시간(초)) 목록 (입력 순서 유지)
+        """
+        if pool is None:
+            results = []
+            for speech_id, text in rows:
+                start_time = time.perf_counter()
+                tokens_with_tags = self.tokenize_text(text)
+                elapsed = time.perf_counter() - start_time
+                results.append((speech_id, tokens_with_tags, len(self.split_text(text)), elapsed))
+            return results
+        
+        # 발언을 구간 단위 작업으로 나누기
+        units = []
+        segment_counts = {}
+        for speech_id, text in rows:
+            segments = self.split_text(text)
+            segment_counts[speech_id] = len(segments)
+            units.extend((speech_id, segment) for segment in segments)
+        
+        # 워커별 작업 단위로 나누어 분배 (imap은 입력 순서대로 결과를 반환하므로 구간 순서가 유지됨)
+        tokens_by_speech = {speech_id: [] for speech_id, _ in rows}
+        seconds_by_speech = {speech_id: 0.0 for speech_id, _ in rows}
+        batches = [units[i:i + worker_chunk_size] for i in range(0, len(units), worker_chunk_size)]
+        for batch, worker_metrics in pool.imap(_tokenize_rows, batches):
+            METRICS.merge(worker_metrics)
+            for speech_id, tokens_with_tags, elapsed in batch:
+                tokens_by_speech[speech_id].extend(tokens_with_tags)
+                seconds_by_speech[speech_id] += elapsed
+        
+        return [
+            (speech_id, tokens_by_speech[speech_id], segment_counts[speech_id], seconds_by_speech[speech_id])
+            for speech_id, _ in rows
+        ]
+    
+    def process_speeches(self, limit=None, workers=1, worker_chunk_size=50, batch_size=500,
+                         incremental=False, resume=False, storage='json'):
         """
         모든 발언을 처리하고 토큰화하여 speeches 테이블에 직접 업데이트
+        
+        Args:
+            limit: 처리할 발언 수 제한
+            workers: 형태소 분석 워커 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+            worker_chunk_size: 워커에 한 번에 전달할 작업(발언 또는 긴 발언의 구간) 수
+            batch_size: executemany 한 번에 업데이트할 발언 수 (커밋은 청크 단위)
+            incremental: 토큰화되지 않았거나 원문이 변경된 발언만 처리
+            resume: 체크포인트에 저장된 마지막 발언 ID 이후부터 처리
+            storage: 토큰 저장 형식 (json, binary, both)
         """
         # 처리할 발언 가져오기
-        query = """
-        SELECT id, 발언내용1, 발언내용2, 발언내용3, 발언내용4, 발언내용5, 발언내용6, 발언내용7
+        query = f"""
+        SELECT id, {', '.join(SPEECH_COLUMNS)}
         FROM speeches
+        WHERE id > ?
         """
         
+        if incremental:
+            # 원문 해시가 없는 기존 토큰화 결과는 해시만 채워서 재처리 대상에서 제외
+            # (원문 해시에 토큰화 설정이 포함되므로 분석기나 구간 길이를 바꾸면 모든 발언이 다시 처리됨)
+            self._backfill_source_hashes()
+            conditions = [
+                '(토큰화된_발언 IS NULL AND 토큰_ID IS NULL)',
+                f"원문_해시 != speech_text_hash({', '.join(SPEECH_COLUMNS)})",
+            ]
+            if not self.settings_key:
+                # 기본 설정의 해시는 설정을 포함하지 않으므로, 구간을 나누어 분석했던 발언은 기록된 구간 수로 찾음
+                conditions.append('id IN (SELECT speech_id FROM speech_tokenize_timings WHERE segments > 1)')
+            query += f"AND ({' OR '.join(conditions)})\n"
+        
+        # 체크포인트 이후부터 처리
+        start_id = self._load_checkpoint() if resume else 0
+        if start_id:
+            print(f"체크포인트에서 이어서 처리합니다. (발언 ID {start_id} 이후)")
+        
+        query += " ORDER BY id"
+        
         if limit:
             query += f" LIMIT {limit}"
         
+        # 진행률 계산용 전체 발언 수 (증분 처리는 해시 비교가 필요하므로 세지 않음)
+        total = None
+        if not incremental:
+            total = self.conn.execute("SELECT COUNT(*) FROM speeches WHERE id > ?", (start_id,)).fetchone()[0]
+            if limit:
+                total = min(total, limit)
+        
+        # 워커 프로세스 풀 생성
+        # 각 워커는 자체 Kkma(JVM) 인스턴스를 가지며, 이미 JVM이 실행 중인 프로세스를 fork하면
+        # JVM 상태가 깨질 수 있으므로 spawn 방식으로 생성한다.
+        # 데이터베이스 쓰기는 현재 프로세스에서만 수행하여 SQLite 쓰기 경합을 피한다.
+        pool = None
+        if workers and workers > 1:
+            pool = multiprocessing.get_context('spawn').Pool(
+                workers, initializer=_init_worker,
+                initargs=(self.backend.name, self.cache_path, self.cache_size, self.max_segment_length)
+            )
+            print(f"{workers}개의 워커 프로세스로 형태소 분석을 수행합니다.")
+        
         # 데이터 로드 (메모리 효율성을 위해 청크 단위로 처리)
         chunk_size = 1000
         total_processed = 0
+        writer = SpeechTokenWriter(self.conn, batch_size=batch_size, storage=storage)
         
-        for chunk in pd.read_sql_query(query, self.conn, chunksize=chunk_size):
-            print(f"발언 처리 중... ({total_processed}~{total_processed + len(chunk)})")
-            
-            # 발언 내용 합치기
-            chunk['전체발언'] = chunk.apply(
-                lambda row: ' '.join([
-                    str(row['발언내용1']) if not pd.isna(row['발언내용1']) else '',
-                    str(row['발언내용2']) if not pd.isna(row['발언내용2']) else '',
-                    str(row['발언내용3']) if not pd.isna(row['발언내용3']) else '',
-                    str(row['발언내용4']) if not pd.isna(row['발언내용4']) else '',
-                    str(row['발언내용5']) if not pd.isna(row['발언내용5']) else '',
-                    str(row['발언내용6']) if not pd.isna(row['발언내용6']) else '',
-                    str(row['발언내용7']) if not pd.isna(row['발언내용7']) else ''
-                ]), axis=1
-            )
-            
-            # 각 발언에 대한 형태소 분석 및 토큰화
-            for idx, row in chunk.iterrows():
-                speech_id = row['id']
-                tokens_with_tags = self.tokenize_text(row['전체발언'])
+        # 형태소 분석 시간이 가장 오래 걸린 발언 (처리 시간, 발언 ID, 글자 수, 구간 수)
+        slowest_speeches = []
+        progress = Progress('tokenizer.speeches', total=total, label='발언 토큰화')
+        
+        try:
+            for chunk in pd.read_sql_query(query, self.conn, params=(start_id,), chunksize=chunk_size):
+                # 처리할 발언이 없으면 빈 청크 하나가 반환됨
+                if chunk.empty:
+                    continue
                 
-                # speeches 테이블 업데이트
-                self.update_speech(speech_id, tokens_with_tags)
-            
-            total_processed += len(chunk)
-            print(f"처리 완료: {total_processed}개 발언")
+                # 발언 내용 합치기
+                chunk['전체발언'] = chunk.apply(self._combine_speech_text, axis=1)
+                rows = [(int(speech_id), text) for speech_id, text in zip(chunk['id'], chunk['전체발언'])]
+                source_hashes = {speech_id: text_hash(text, self.settings_key) for speech_id, text in rows}
+                
+                text_lengths = {speech_id: len(text) for speech_id, text in rows}
+                
+                # 각 발언에 대한 형태소 분석 및 토큰화
+                results = self._tokenize_chunk(rows, pool, worker_chunk_size)
+                
+                for speech_id, tokens_with_tags, segments, seconds in results:
+                    # speeches 테이블 업데이트 (버퍼에 모아서 일괄 반영)
+                    writer.add(speech_id, tokens_with_tags, source_hashes[speech_id])
+                    writer.add_timing(speech_id, text_lengths[speech_id], segments, seconds)
+                    
+                    timing = (seconds, speech_id, text_lengths[speech_id], segments)
+                    if len(slowest_speeches) < 10:
+                        heapq.heappush(slowest_speeches, timing)
+                    else:
+                        heapq.heappushpop(slowest_speeches, timing)
+                
+                # 청크 단위로 한 번만 커밋 (체크포인트도 같은 트랜잭션에 저장)
+                self._save_checkpoint(rows[-1][0])
+                writer.commit()
+                
+                total_processed += len(chunk)
+                progress.update(len(chunk))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        # 끝까지 처리한 경우에만 체크포인트 삭제 (--limit으로 중단한 경우 다음 실행에서 이어서 처리)
+        if not limit or total_processed < limit:
+            self._clear_checkpoint()
+        
+        progress.close()
         
-        print(f"총 {total_processed}개 발언 처리 완료")
+        if slowest_speeches:
+            print("\n=== 형태소 분석 시간이 가장 오래 걸린 발언 ===")
+            for seconds, speech_id, text_length, segments in sorted(slowest_speeches, reverse=True):
+                print(f"발언 ID {speech_id}: {seconds:.2f}초 ({text_length:,}자, {segments}개 구간)")
+        
+        if self.cache and pool is None:
+            self.cache.print_stats()
+        
+        METRICS.print_summary('토큰화 실행 지표')
     
     def close(self):
         """
         연결 종료
         """
+        if self.cache:
+            # 워커 프로세스의 캐시 통계는 워커 종료 시 출력됨
+            if self.conn is None:
+                self.cache.print_stats()
+            self.cache.close()
+            self.cache = None
+        
         if self.conn:
             self.conn.close()
             print("데이터베이스 연결이 종료되었습니다.")
 
 if __name__ == "__main__":
-    tokenizer = SpeechTokenizer()
+    # 명령행 인수 파싱
+    import argparse
+    parser = argparse.ArgumentParser(description='국회의원 발언 토큰화 도구')
+    parser.add_argument('--limit', type=int, help='처리할 발언 수 제한')
+    parser.add_argument('--workers', type=int, default=1, help='형태소 분석 워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('--worker-chunk-size', type=int, default=50,
+                        help='워커에 한 번에 전달할 발언 수 (기본값: 50)')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='executemany 한 번에 업데이트할 발언 수 (기본값: 500)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='토큰화되지 않았거나 원문이 변경된 발언만 처리')
+    parser.add_argument('--resume', action='store_true',
+                        help='체크포인트에 저장된 마지막 발언 이후부터 이어서 처리')
+    parser.add_argument('--storage', type=str, default='json', choices=['json', 'binary', 'both'],
+                        help='토큰 저장 형식 (json: 토큰화된_발언, binary: 토큰_ID, both: 모두, 기본값: json)')
+    parser.add_argument('--max-segment-length', type=int, default=0,
+                        help='한 번에 형태소 분석할 최대 글자 수 (기본값: 0, 나누지 않음 - 나누면 분석 결과가 달라질 수 있음)')
+    parser.add_argument('--backend', type=str, default='kkma', choices=list(BACKENDS),
+                        help='형태소 분석기 (기본값: kkma)')
+    parser.add_argument('--cache', nargs='?', const=CACHE_DATABASE_NAME, default=None,
+                        help='형태소 분석 캐시 파일 경로 (경로 생략 시 morph_cache.db)')
+    parser.add_argument('--cache-size', type=int, default=100000,
+                        help='메모리 LRU 캐시 최대 항목 수 (기본값: 100000)')
+    parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 실행 지표를 기록할 JSON Lines 파일 경로')
+    parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
+    args = parser.parse_args()
+    configure(args.metrics_jsonl, args.metrics_prom)
+    
+    tokenizer = SpeechTokenizer(backend=args.backend, cache_path=args.cache, cache_size=args.cache_size,
+                                max_segment_length=args.max_segment_length)
     
     try:
-        # 명령행 인수 파싱
-        import argparse
-        parser = argparse.ArgumentParser(description='국회의원 발언 토큰화 도구')
-        parser.add_argument('--limit', type=int, help='처리할 발언 수 제한')
-        args = parser.parse_args()
-        
         # 발언 처리
         print("국회의원 발언 토큰화를 시작합니다...")
-        tokenizer.process_speeches(limit=args.limit)
+        tokenizer.process_speeches(limit=args.limit, workers=args.workers,
+                                   worker_chunk_size=args.worker_chunk_size,
+                                   batch_size=args.batch_size,
+                                   incremental=args.incremental,
+                                   resume=args.resume,
+                                   storage=args.storage)
         print("토큰화가 완료되었습니다.")
     
     finally:
@@ -0,0 +1,221 @@
+import sqlite3
+import json
+import argparse
+import os
+import sys
+import numpy as np
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.connection import connect
+from instrumentation import METRICS, Progress, configure, count, timer
+
+# 토큰 ID 배열 자료형 (부호 없는 32비트 정수, 리틀 엔디언)
+TOKEN_ID_DTYPE = np.dtype('<u4')
+
+def load_json_tokens(tokens_json):
+    """
+    기존 JSON 형식(토큰화된_발언 열)의 토큰 목록 읽기
+
+    Returns:
+        (단어, 품사) 목록, 읽을 수 없으면 빈 목록
+    """
+    try:
+        with timer('tokens.json_decode'):
+            return [tuple(token) for token in json.loads(tokens_json)]
+    except (json.JSONDecodeError, TypeError):
+        count('tokens.json_decode_errors')
+        return []
+
+class TokenStore:
+    """
+    토큰화된 발언을 정수 ID 배열로 저장하고 읽는 클래스
+
+    (단어, 품사) 쌍마다 vocab 테이블의 정수 ID를 부여하고, 발언의 토큰 목록은
+    ID 배열을 4바이트 정수 BLOB으로 묶어 speeches.토큰_ID 열에 저장한다.
+    JSON 문자열보다 저장 공간이 작고, 읽을 때 np.frombuffer로 바로 배열을 만들 수 있어
+    토큰마다 파이썬 객체를 만들지 않는다.
+    """
+
+    def __init__(self, conn):
+        """
+        초기화 함수
+
+        Args:
+            conn: 데이터베이스 연결
+        """
+        self.conn = conn
+        self._create_tables()
+
+        # 기존 vocab 로드 ((단어, 품사) → ID)
+        self.vocab_ids = {
+            (word, tag): vocab_id
+            for vocab_id, word, tag in self.conn.execute("SELECT id, word, tag FROM vocab")
+        }
+        self.next_id = max(self.vocab_ids.values(), default=0) + 1
+        self.pending_vocab = []
+        self._id_to_token = {}
+
+    def _create_tables(self):
+        """
+        vocab 테이블과 speeches 테이블의 토큰 ID 열 생성
+        """
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS vocab (
+            id INTEGER PRIMARY KEY,
+            word TEXT,
+            tag TEXT,
+            UNIQUE (word, tag)
+        )
+        """)
+
+        self.add_token_id_column(self.conn)
+        self.conn.commit()
+
+    @staticmethod
+    def add_token_id_column(conn):
+        """
+        speeches 테이블에 토큰 ID 배열을 저장할 열 추가 (이미 있으면 무시)
+        """
+        try:
+            conn.execute("ALTER TABLE speeches ADD COLUMN 토큰_ID BLOB")
+            conn.commit()
+            print("speeches 테이블에 '토큰_ID' 열이 추가되었습니다.")
+        except sqlite3.OperationalError:
+            # 이미 열이 존재하는 경우
+            pass
+
+    def encode(self, tokens_with_tags):
+        """
+        (단어, 품사) 목록을 토큰 ID 배열 BLOB으로 변환 (처음 등장한 단어는 vocab에 추가)
+        """
+        token_ids = []
+        for word, tag in tokens_with_tags:
+            key = (word, tag)
+            vocab_id = self.vocab_ids.get(key)
+            if vocab_id is None:
+                vocab_id = self.next_id
+                self.next_id += 1
+                self.vocab_ids[key] = vocab_id
+                self.pending_vocab.append((vocab_id, word, tag))
+            token_ids.append(vocab_id)
+
+        return np.array(token_ids, dtype=TOKEN_ID_DTYPE).tobytes()
+
+    def flush(self):
+        """
+        새로 추가된 vocab을 현재 트랜잭션에 반영 (커밋하지 않음)
+        """
+        if not self.pending_vocab:
+            return
+
+        with timer('sql.insert_vocab'):
+            self.conn.executemany("INSERT INTO vocab (id, word, tag) VALUES (?, ?, ?)", self.pending_vocab)
+        count('tokens.new_vocab', len(self.pending_vocab))
+        self.pending_vocab = []
+
+    @staticmethod
+    def decode_ids(blob):
+        """
+        토큰 ID 배열 BLOB을 numpy 배열로 변환 (데이터 복사 없이 읽기 전용 배열 반환)
+        """
+        if not blob:
+            return np.empty(0, dtype=TOKEN_ID_DTYPE)
+        return np.frombuffer(blob, dtype=TOKEN_ID_DTYPE)
+
+    def load_vocab_arrays(self):
+        """
+        토큰 ID로 바로 조회할 수 있는 단어/품사 배열 로드 (0번 ID는 사용하지 않음)
+
+        Returns:
+            (단어 배열, 품사 배열) - words[token_ids]처럼 ID 배열로 한 번에 조회
+        """
+        self.flush()
+
+        words = np.empty(self.next_id, dtype=object)
+        tags = np.empty(self.next_id, dtype=object)
+        for (word, tag), vocab_id in self.vocab_ids.items():
+            words[vocab_id] = word
+            tags[vocab_id] = tag
+
+        return words, tags
+
+    def decode(self, blob):
+        """
+        토큰 ID 배열 BLOB을 (단어, 품사) 목록으로 변환 (기존 JSON 형식과 같은 결과)
+        """
+        if len(self._id_to_token) != len(self.vocab_ids):
+            self._id_to_token = {vocab_id: key for key, vocab_id in self.vocab_ids.items()}
+
+        return [self._id_to_token[int(token_id)] for token_id in self.decode_ids(blob)]
+
+    def convert_json_tokens(self, batch_size=5000, drop_json=False):
+        """
+        기존 JSON 형식으로 저장된 토큰화 결과를 토큰 ID 배열로 변환 (형태소 분석을 다시 하지 않음)
+
+        Args:
+            batch_size: 한 번에 변환하여 커밋할 발언 수
+            drop_json: 변환 후 JSON 열 값을 비워 저장 공간 확보
+        """
+        # 같은 테이블을 갱신하면서 읽으므로 열린 커서를 유지하지 않고 id 범위로 나누어 조회
+        read_query = """
+        SELECT id, 토큰화된_발언
+        FROM speeches
+        WHERE 토큰화된_발언 IS NOT NULL AND 토큰_ID IS NULL AND id > ?
+        ORDER BY id
+        LIMIT ?
+        """
+
+        if drop_json:
+            update_query = "UPDATE speeches SET 토큰_ID = ?, 토큰화된_발언 = NULL WHERE id = ?"
+        else:
+            update_query = "UPDATE speeches SET 토큰_ID = ? WHERE id = ?"
+
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM speeches WHERE 토큰화된_발언 IS NOT NULL AND 토큰_ID IS NULL"
+        ).fetchone()[0]
+        progress = Progress('tokens.converted_speeches', total=total, label='토큰 ID 변환')
+        last_id = -1
+        while True:
+            rows = self.conn.execute(read_query, (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            updates = [(self.encode(load_json_tokens(tokens_json)), speech_id) for speech_id, tokens_json in rows]
+            self.flush()
+            with timer('sql.update_tokens'):
+                self.conn.executemany(update_query, updates)
+            with timer('sql.commit'):
+                self.conn.commit()
+
+            progress.update(len(rows))
+
+        progress.close()
+        print(f"총 {progress.done:,}개 발언을 토큰 ID 배열로 변환했습니다. (vocab {len(self.vocab_ids):,}개)")
+        return progress.done
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='토큰화된 발언 저장 형식 변환 도구')
+    parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 변환할 발언 수 (기본값: 5000)')
+    parser.add_argument('--drop-json', action='store_true', help='변환 후 JSON 열 값을 비우고 VACUUM 실행')
+    parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 실행 지표를 기록할 JSON Lines 파일 경로')
+    parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
+    args = parser.parse_args()
+    configure(args.metrics_jsonl, args.metrics_prom)
+
+    conn = connect('bulk')
+
+    try:
+        store = TokenStore(conn)
+        store.convert_json_tokens(batch_size=args.batch_size, drop_json=args.drop_json)
+
+        if args.drop_json:
+            print("데이터베이스 파일 크기를 줄이는 중...")
+            with timer('sql.vacuum'):
+                conn.execute("VACUUM")
+
+        METRICS.print_summary('변환 실행 지표')
+    finally:
+        conn.close()
+        print("데이터베이스 연결이 종료되었습니다.")
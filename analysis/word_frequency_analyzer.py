@@ -1,11 +1,22 @@
-import sqlite3
-import json
 import pandas as pd
-from collections import Counter
+import numpy as np
 import argparse
+import os
+import sys
 
-# 데이터베이스 파일 경로
-DATABASE_NAME = 'political_speeches.db'
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.token_store import TokenStore, load_json_tokens
+from database.connection import connect
+from instrumentation import METRICS, Progress, configure, count, timer
+
+# 기간 단위 (회의 날짜 파일을 사용할 때 pandas 기간 코드, meetings는 회의번호 순서로 일정 개수씩 묶음)
+PERIOD_UNITS = {
+    'year': 'Y',
+    'quarter': 'Q',
+    'month': 'M',
+    'meetings': None,
+}
 
 class WordFrequencyAnalyzer:
     """
@@ -16,7 +27,7 @@ class WordFrequencyAnalyzer:
         """
         초기화 함수
         """
-        self.conn = sqlite3.connect(DATABASE_NAME)
+        self.conn = connect('bulk')
         
         # 의원별 단어 빈도를 저장할 테이블 생성
         self._create_frequency_tables()
@@ -39,85 +50,415 @@ class WordFrequencyAnalyzer:
         )
         """)
         
+        # 회의별 기간 테이블 (기간별 단어 빈도 집계에 사용, period_order는 기간의 시간 순서)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS meeting_periods (
+            회의번호 TEXT PRIMARY KEY,
+            period TEXT,
+            period_order INTEGER
+        )
+        """)
+        
+        # 의원별, 기간별 단어 빈도 테이블 (구간별 편향 모델 학습에서 기간 부분 집계로 사용)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS member_period_word_frequency (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            member_id TEXT,
+            speaker TEXT,
+            party TEXT,
+            period TEXT,
+            word TEXT,
+            tag TEXT,
+            count INTEGER,
+            FOREIGN KEY (speaker) REFERENCES member_bias(name)
+        )
+        """)
+        
+        self._create_frequency_indexes()
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_period_word_freq_period ON member_period_word_frequency(period)")
         self.conn.commit()
     
-    def analyze_member_word_frequency(self, limit=None):
+    def _create_frequency_indexes(self):
         """
-        각 의원별 단어 사용 빈도 분석
+        단어 빈도 테이블 인덱스 생성
+        
+        (speaker, count DESC, word, tag) 인덱스는 의원별 상위 단어 조회를 인덱스만으로 처리하고
+        의원별 삭제에도 사용된다.
         """
-        # 의원 목록 가져오기
-        query = """
-        SELECT DISTINCT s.의원ID, s.발언자, m.party
+        self.conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_word_freq_speaker_count
+        ON member_word_frequency(speaker, count DESC, word, tag)
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_word_freq_word ON member_word_frequency(word)")
+    
+    def _drop_frequency_indexes(self):
+        """
+        대량 삽입 전에 단어 빈도 테이블 인덱스 삭제 (삽입 후 한 번에 다시 생성)
+        """
+        self.conn.execute("DROP INDEX IF EXISTS idx_word_freq_speaker_count")
+        self.conn.execute("DROP INDEX IF EXISTS idx_word_freq_word")
+    
+    def _has_column(self, table, column):
+        """
+        테이블에 열이 존재하는지 확인
+        """
+        return any(row[1] == column for row in self.conn.execute(f"PRAGMA table_info({table})"))
+    
+    def _speech_source_query(self, has_binary, limit=None, by_period=False):
+        """
+        의원 발언의 토큰 열을 한 번에 읽는 쿼리 생성
+        
+        Args:
+            has_binary: 토큰_ID 열이 있으면 토큰화된_발언과 함께 읽음 (두 저장 형식을 한 번의 스캔에서 처리)
+            limit: 의원별 발언 수 제한 (두 저장 형식을 합쳐 의원별로 앞에서부터 limit개 발언만 사용)
+            by_period: 발언이 속한 기간(meeting_periods 테이블)도 함께 읽기 (기간이 지정되지 않은 회의의 발언은 제외)
+        
+        Returns:
+            id, 의원ID, 발언자, (period,) 토큰화된_발언, (토큰_ID) 열을 읽는 쿼리
+        """
+        if has_binary:
+            token_columns = '토큰화된_발언, 토큰_ID'
+            source_columns = 's.토큰화된_발언, s.토큰_ID'
+            tokenized = 's.토큰화된_발언 IS NOT NULL OR s.토큰_ID IS NOT NULL'
+        else:
+            token_columns = '토큰화된_발언'
+            source_columns = 's.토큰화된_발언'
+            tokenized = 's.토큰화된_발언 IS NOT NULL'
+        
+        period_column = ', p.period' if by_period else ''
+        period_join = 'JOIN meeting_periods p ON s.회의번호 = p.회의번호' if by_period else ''
+        
+        query = f"""
+        SELECT s.id, s.의원ID, s.발언자{period_column}, {source_columns}
         FROM speeches s
         JOIN member_bias m ON s.발언자 = m.name
-        WHERE s.토큰화된_발언 IS NOT NULL
+        {period_join}
+        WHERE {tokenized}
         """
         
-        members = pd.read_sql_query(query, self.conn)
-        total_members = len(members)
+        if limit:
+            query = f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY 발언자 ORDER BY id) AS rn
+                FROM ({query})
+            )
+            WHERE rn <= {int(limit)}
+            """
         
-        print(f"총 {total_members}명의 의원에 대한 단어 빈도 분석을 시작합니다...")
+        return f"SELECT id, 의원ID, 발언자{', period' if by_period else ''}, {token_columns} FROM ({query})"
+    
+    def _load_vocab_ids(self):
+        """
+        vocab 테이블의 (단어, 품사) → 토큰 ID (테이블이 없으면 빈 딕셔너리)
+        """
+        exists = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vocab'").fetchone()
+        if not exists:
+            return {}
+        return {(word, tag): vocab_id for vocab_id, word, tag in self.conn.execute("SELECT id, word, tag FROM vocab")}
+    
+    def _count_tokens(self, limit=None, fetch_size=5000, by_period=False):
+        """
+        토큰화된 발언의 (의원, 단어, 품사)별 빈도를 speeches 테이블 한 번의 스캔으로 집계
         
-        for idx, row in members.iterrows():
-            member_id = row['의원ID']
-            speaker = row['발언자']
-            party = row['party']
-            
-            print(f"[{idx+1}/{total_members}] {speaker}({party}) 의원 분석 중...")
-            
-            # 해당 의원의 토큰화된 발언 가져오기
-            query = """
-            SELECT 토큰화된_발언
-            FROM speeches
-            WHERE 발언자 = ? AND 토큰화된_발언 IS NOT NULL
-            """
-            
-            if limit:
-                query += f" LIMIT {limit}"
+        발언마다 마지막 토큰화에서 채운 열만 읽는다. SpeechTokenWriter는 다른 저장 형식의 열을 비우므로
+        값이 있는 열이 최신 결과이고, 두 열이 모두 있으면(both 형식, JSON 변환) 같은 토큰이다.
+        토큰 ID 배열(토큰_ID 열)은 그대로 사용하고, JSON 형식(토큰화된_발언 열)은
+        (단어, 품사)를 같은 vocab 번호로 바꾼 뒤, (의원 번호, 토큰 ID)를 하나의 정수 키로 만들어
+        배치 단위로 numpy로 빈도를 계산한다.
+        by_period이면 의원 번호 대신 (의원, 기간) 조합 번호를 사용한다.
+        """
+        has_binary = self._has_column('speeches', '토큰_ID')
+        
+        # JSON 형식 발언에만 있는 (단어, 품사)는 vocab 테이블에 쓰지 않고 집계에서만 쓰는 번호를 이어서 부여
+        vocab_ids = self._load_vocab_ids()
+        next_id = [max(vocab_ids.values(), default=0) + 1]
+        
+        def json_token_ids(tokens_json):
+            token_ids = []
+            for token in load_json_tokens(tokens_json):
+                token_id = vocab_ids.get(token)
+                if token_id is None:
+                    token_id = vocab_ids[token] = next_id[0]
+                    next_id[0] += 1
+                token_ids.append(token_id)
+            return np.array(token_ids, dtype=np.int64)
+        
+        query = self._speech_source_query(has_binary, limit, by_period)
+        with timer('sql.select_tokens'):
+            cursor = self.conn.execute(query)
+        progress = Progress('frequency.speeches', label='발언 단어 빈도 집계')
+        
+        group_codes = {}
+        member_ids = {}
+        batch_keys = []
+        batch_counts = []
+        
+        while True:
+            with timer('sql.fetch_tokens'):
+                rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            progress.update(len(rows))
             
-            speeches = pd.read_sql_query(query, self.conn, params=[speaker])
+            token_arrays = []
+            codes = []
+            for row in rows:
+                member_id, speaker = row[1], row[2]
+                group = (speaker, row[3] if by_period else None)
+                code = group_codes.setdefault(group, len(group_codes))
+                if member_id is not None and (speaker not in member_ids or member_id > member_ids[speaker]):
+                    # 의원ID는 발언자별로 하나만 사용 (기존 집계와 같이 가장 큰 값)
+                    member_ids[speaker] = member_id
+                
+                # 발언마다 마지막으로 쓴 저장 형식 선택 (두 열이 모두 있으면 같은 토큰이므로 토큰 ID 배열 사용)
+                blob = row[-1] if has_binary else None
+                if blob is not None:
+                    count('frequency.binary_speeches')
+                    token_arrays.append(TokenStore.decode_ids(blob).astype(np.int64))
+                else:
+                    count('frequency.json_speeches')
+                    token_arrays.append(json_token_ids(row[-2] if has_binary else row[-1]))
+                codes.append(code)
             
-            if speeches.empty:
-                print(f"  {speaker} 의원의 토큰화된 발언이 없습니다.")
+            lengths = np.fromiter((len(tokens) for tokens in token_arrays), dtype=np.int64, count=len(token_arrays))
+            if lengths.sum() == 0:
                 continue
             
-            # 모든 토큰 수집
-            all_tokens = []
-            for speech in speeches['토큰화된_발언']:
-                try:
-                    # 문자열을 JSON으로 파싱
-                    tokens = json.loads(speech)
-                    all_tokens.extend(tokens)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            
-            if not all_tokens:
-                print(f"  {speaker} 의원의 토큰이 없습니다.")
-                continue
+            # 토큰 ID는 32비트 정수이므로 그룹 번호를 상위 비트에 두어 하나의 키로 만듦
+            keys = (np.repeat(np.array(codes, dtype=np.int64), lengths) << 32) | np.concatenate(token_arrays)
             
-            # 단어별 빈도 계산
-            word_counts = Counter()
-            for word, tag in all_tokens:
-                word_counts[(word, tag)] += 1
+            with timer('frequency.count_batch'):
+                unique_keys, counts = np.unique(keys, return_counts=True)
+            count('frequency.tokens', len(keys))
+            batch_keys.append(unique_keys)
+            batch_counts.append(counts)
+        
+        progress.close()
+        
+        if not batch_keys:
+            return pd.DataFrame(columns=self._count_columns(by_period))
+        
+        # 배치별 부분 집계를 합산
+        keys, inverse = np.unique(np.concatenate(batch_keys), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate(batch_counts)).astype(np.int64)
+        
+        words = np.empty(next_id[0], dtype=object)
+        tags = np.empty(next_id[0], dtype=object)
+        for (word, tag), vocab_id in vocab_ids.items():
+            words[vocab_id] = word
+            tags[vocab_id] = tag
+        
+        speakers = np.empty(len(group_codes), dtype=object)
+        periods = np.empty(len(group_codes), dtype=object)
+        for (speaker, period), code in group_codes.items():
+            speakers[code] = speaker
+            periods[code] = period
+        
+        groups = keys >> 32
+        token_ids = keys & 0xFFFFFFFF
+        result = pd.DataFrame({'member_id': pd.Series(speakers[groups]).map(member_ids).values,
+                               'speaker': speakers[groups]})
+        if by_period:
+            result['period'] = periods[groups]
+        result['word'] = words[token_ids]
+        result['tag'] = tags[token_ids]
+        result['count'] = counts
+        
+        return result
+    
+    @staticmethod
+    def _count_columns(by_period=False):
+        if by_period:
+            return ['member_id', 'speaker', 'period', 'word', 'tag', 'count']
+        return ['member_id', 'speaker', 'word', 'tag', 'count']
+    
+    def count_member_words(self, limit=None, by_period=False):
+        """
+        모든 의원의 (단어, 품사)별 사용 빈도를 speeches 테이블 한 번의 스캔으로 집계
+        
+        토큰 ID 배열과 JSON 형식이 섞여 있어도 발언마다 저장 형식을 골라 읽으므로 테이블은 한 번만 읽는다.
+        
+        Args:
+            limit: 의원별 분석 시 발언 수 제한
+            by_period: 기간(meeting_periods 테이블)별로 나누어 집계
+        
+        Returns:
+            member_id, speaker, (period,) word, tag, count 열을 가진 데이터프레임
+        """
+        print("토큰화된 발언 집계 중...")
+        return self._count_tokens(limit, by_period=by_period)
+    
+    def analyze_member_word_frequency(self, limit=None):
+        """
+        각 의원별 단어 사용 빈도 분석
+        """
+        # 의원별 정당 정보
+        parties = dict(self.conn.execute("SELECT name, party FROM member_bias").fetchall())
+        
+        # 모든 의원의 단어 빈도를 한 번에 집계
+        word_counts = self.count_member_words(limit)
+        speakers = word_counts['speaker'].unique()
+        
+        # 의원별 단어 수 요약 (의원마다 출력하지 않고 분포만 출력)
+        words_per_member = word_counts.groupby('speaker').size()
+        count('frequency.members', len(speakers))
+        count('frequency.rows', len(word_counts))
+        if len(speakers):
+            print(f"총 {len(speakers)}명의 의원에 대한 단어 빈도를 저장합니다... "
+                  f"(의원별 단어 수: 최소 {words_per_member.min():,}, "
+                  f"중앙값 {int(words_per_member.median()):,}, 최대 {words_per_member.max():,})")
+        
+        # 기존 데이터 삭제 (의원 인덱스 사용)
+        with timer('sql.delete_frequency'):
+            self.conn.executemany(
+                "DELETE FROM member_word_frequency WHERE speaker = ?",
+                [(speaker,) for speaker in speakers]
+            )
+        
+        # 인덱스를 삭제한 상태에서 새 데이터를 일괄 삽입한 뒤 인덱스를 한 번에 생성
+        self._drop_frequency_indexes()
+        
+        rows = zip(
+            word_counts['member_id'],
+            word_counts['speaker'],
+            word_counts['speaker'].map(parties),
+            word_counts['word'],
+            word_counts['tag'],
+            word_counts['count'].astype(int).tolist(),
+        )
+        with timer('sql.insert_frequency'):
+            self.conn.executemany(
+                """
+                INSERT INTO member_word_frequency 
+                (member_id, speaker, party, word, tag, count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+        
+        print("단어 빈도 테이블 인덱스 생성 중...")
+        with timer('sql.create_frequency_indexes'):
+            self._create_frequency_indexes()
+            self.conn.execute("ANALYZE member_word_frequency")
+        
+        # 삭제, 삽입, 인덱스 생성을 하나의 트랜잭션으로 커밋
+        with timer('sql.commit'):
+            self.conn.commit()
+        print(f"총 {len(word_counts):,}개 행을 저장했습니다.")
+        
+        print("모든 의원의 단어 빈도 분석이 완료되었습니다.")
+        METRICS.print_summary('단어 빈도 분석 실행 지표')
+    
+    def assign_meeting_periods(self, period='year', meeting_dates_file=None, meetings_per_period=50):
+        """
+        회의번호별 기간을 meeting_periods 테이블에 저장 (커밋하지 않음)
+        
+        Args:
+            period: 기간 단위 (year, quarter, month: 회의 날짜 기준, meetings: 회의번호 순서로 묶음)
+            meeting_dates_file: 회의번호, 회의일자 열을 가진 CSV 파일 경로 (year, quarter, month 단위에 필요)
+            meetings_per_period: meetings 단위에서 한 기간에 묶을 회의 수
+        """
+        if period not in PERIOD_UNITS:
+            raise ValueError(f"지원하지 않는 기간 단위입니다: {period}")
+        
+        meetings = pd.read_sql_query(
+            "SELECT DISTINCT 회의번호 FROM speeches WHERE 회의번호 IS NOT NULL", self.conn
+        )['회의번호'].astype(str)
+        
+        if period == 'meetings':
+            # 회의번호가 모두 숫자면 숫자 순서, 아니면 문자열 순서로 정렬하여 일정 개수씩 묶음
+            numbers = pd.to_numeric(meetings, errors='coerce')
+            order = numbers.argsort(kind='stable') if numbers.notna().all() else meetings.argsort(kind='stable')
+            meetings = meetings.iloc[order].reset_index(drop=True)
+            orders = pd.Series(np.arange(len(meetings)) // meetings_per_period)
+            groups = meetings.groupby(orders)
+            labels = groups.transform('first') + '~' + groups.transform('last')
+        else:
+            if not meeting_dates_file:
+                raise ValueError(f"기간 단위 '{period}'는 회의 날짜 파일(회의번호, 회의일자 열)이 필요합니다.")
             
-            # 기존 데이터 삭제
-            self.conn.execute("DELETE FROM member_word_frequency WHERE speaker = ?", (speaker,))
+            dates = pd.read_csv(meeting_dates_file, dtype={'회의번호': str})
+            missing = [column for column in ('회의번호', '회의일자') if column not in dates.columns]
+            if missing:
+                raise ValueError(f"회의 날짜 파일에 없는 열입니다: {', '.join(missing)}")
             
-            # 새 데이터 삽입
-            for (word, tag), count in word_counts.items():
-                self.conn.execute(
-                    """
-                    INSERT INTO member_word_frequency 
-                    (member_id, speaker, party, word, tag, count)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (member_id, speaker, party, word, tag, count)
-                )
+            dates = dates.drop_duplicates('회의번호').set_index('회의번호')['회의일자']
+            dates = pd.to_datetime(dates.reindex(meetings).values)
+            undated = int(pd.isna(dates).sum())
+            if undated:
+                print(f"날짜가 없는 회의 {undated:,}개는 기간별 집계에서 제외합니다.")
             
-            self.conn.commit()
-            print(f"  {speaker} 의원 분석 완료: {len(word_counts)}개 단어")
+            meetings = meetings[~pd.isna(dates)].reset_index(drop=True)
+            labels = pd.Series(dates[~pd.isna(dates)].to_period(PERIOD_UNITS[period]).astype(str))
+            # 같은 단위의 기간 문자열은 문자열 순서가 시간 순서와 같음
+            orders = pd.Series(pd.factorize(labels, sort=True)[0])
         
-        print("모든 의원의 단어 빈도 분석이 완료되었습니다.")
+        with timer('sql.insert_meeting_periods'):
+            self.conn.execute("DELETE FROM meeting_periods")
+            self.conn.executemany(
+                "INSERT INTO meeting_periods (회의번호, period, period_order) VALUES (?, ?, ?)",
+                zip(meetings, labels, orders.astype(int).tolist())
+            )
+        
+        if len(labels):
+            print(f"회의 {len(meetings):,}개를 {labels.nunique()}개 기간으로 나누었습니다. "
+                  f"(첫 기간: {labels.iloc[orders.argmin()]}, 마지막 기간: {labels.iloc[orders.argmax()]})")
+    
+    def analyze_member_period_word_frequency(self, limit=None, period='year', meeting_dates_file=None,
+                                             meetings_per_period=50):
+        """
+        의원별, 기간별 단어 사용 빈도 분석
+        
+        speeches 테이블을 한 번만 스캔하여 (의원, 기간, 단어, 품사)별 빈도를 집계한다.
+        구간별 편향 모델은 이 기간 부분 집계를 합산하여 만들기 때문에 구간이 겹쳐도 발언을 다시 읽지 않는다.
+        
+        Args:
+            limit: 의원별 분석 시 발언 수 제한
+            period: 기간 단위 (year, quarter, month, meetings)
+            meeting_dates_file: 회의번호, 회의일자 열을 가진 CSV 파일 경로
+            meetings_per_period: meetings 단위에서 한 기간에 묶을 회의 수
+        """
+        parties = dict(self.conn.execute("SELECT name, party FROM member_bias").fetchall())
+        
+        self.assign_meeting_periods(period, meeting_dates_file, meetings_per_period)
+        word_counts = self.count_member_words(limit, by_period=True)
+        
+        count('frequency.period_rows', len(word_counts))
+        print(f"총 {word_counts['speaker'].nunique()}명의 의원, {word_counts['period'].nunique()}개 기간의 "
+              f"단어 빈도를 저장합니다... ({len(word_counts):,}개 행)")
+        
+        # 기간 구분이 바뀔 수 있으므로 기간별 빈도는 전체를 다시 저장
+        with timer('sql.delete_period_frequency'):
+            self.conn.execute("DELETE FROM member_period_word_frequency")
+            self.conn.execute("DROP INDEX IF EXISTS idx_period_word_freq_period")
+        
+        rows = zip(
+            word_counts['member_id'],
+            word_counts['speaker'],
+            word_counts['speaker'].map(parties),
+            word_counts['period'],
+            word_counts['word'],
+            word_counts['tag'],
+            word_counts['count'].astype(int).tolist(),
+        )
+        with timer('sql.insert_period_frequency'):
+            self.conn.executemany(
+                """
+                INSERT INTO member_period_word_frequency 
+                (member_id, speaker, party, period, word, tag, count)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+        
+        with timer('sql.create_frequency_indexes'):
+            self.conn.execute("CREATE INDEX idx_period_word_freq_period ON member_period_word_frequency(period)")
+            self.conn.execute("ANALYZE member_period_word_frequency")
+        
+        with timer('sql.commit'):
+            self.conn.commit()
+        print(f"총 {len(word_counts):,}개 행을 저장했습니다.")
+        METRICS.print_summary('기간별 단어 빈도 분석 실행 지표')
     
     def get_top_words_by_member(self, speaker, limit=50):
         """
@@ -151,13 +492,30 @@ if __name__ == "__main__":
         parser.add_argument('--limit', type=int, help='의원별 분석 시 발언 수 제한')
         parser.add_argument('--speaker', type=str, help='특정 의원의 상위 단어 조회')
         parser.add_argument('--top', type=int, default=50, help='상위 단어 개수 (기본값: 50)')
+        parser.add_argument('--by-period', action='store_true',
+                            help='의원별, 기간별 단어 빈도를 member_period_word_frequency 테이블에 저장 (구간별 편향 분석용)')
+        parser.add_argument('--period', type=str, default='year', choices=list(PERIOD_UNITS),
+                            help='기간 단위 (기본값: year, meetings는 회의번호 순서로 묶음)')
+        parser.add_argument('--meeting-dates', type=str,
+                            help='회의번호, 회의일자 열을 가진 CSV 파일 경로 (year/quarter/month 단위에 필요)')
+        parser.add_argument('--meetings-per-period', type=int, default=50,
+                            help='meetings 단위에서 한 기간에 묶을 회의 수 (기본값: 50)')
+        parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 실행 지표를 기록할 JSON Lines 파일 경로')
+        parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
         args = parser.parse_args()
+        configure(args.metrics_jsonl, args.metrics_prom)
         
         if args.speaker:
             # 특정 의원의 상위 단어 조회
             top_words = analyzer.get_top_words_by_member(args.speaker, args.top)
             print(f"{args.speaker} 의원의 상위 {args.top}개 단어:")
             print(top_words)
+        elif args.by_period:
+            # 의원별, 기간별 단어 빈도 분석
+            analyzer.analyze_member_period_word_frequency(limit=args.limit, period=args.period,
+                                                          meeting_dates_file=args.meeting_dates,
+                                                          meetings_per_period=args.meetings_per_period)
+            print("기간별 단어 빈도 분석이 완료되었습니다.")
         else:
             # 의원별 단어 빈도 분석
             analyzer.analyze_member_word_frequency(limit=args.limit)
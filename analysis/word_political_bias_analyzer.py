@@ -1,12 +1,225 @@
-import sqlite3
 import pandas as pd
 import numpy as np
+from scipy import sparse
+from sklearn.base import BaseEstimator, RegressorMixin, clone
 from sklearn.feature_extraction.text import TfidfTransformer
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+from sklearn.metrics import r2_score
+from sklearn.model_selection import GridSearchCV, KFold
+import joblib
 import argparse
+import contextlib
+import hashlib
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
 
-# 데이터베이스 파일 경로
-DATABASE_NAME = 'political_speeches.db'
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.bias_artifact import write_bias_artifact
+from database.connection import connect
+from instrumentation import Progress, count, timer
+
+# 회귀 모델 종류 (linear 외의 모델은 정규화 강도를 k-fold 교차 검증으로 선택)
+MODELS = {
+    'linear': LinearRegression,
+    'ridge': Ridge,
+    'lasso': Lasso,
+    'elasticnet': ElasticNet,
+}
+
+# 모델별 추가 설정 (좌표 하강법은 작은 alpha에서 수렴이 느리므로 반복 횟수를 늘림)
+MODEL_OPTIONS = {
+    'lasso': {'max_iter': 10000},
+    'elasticnet': {'max_iter': 10000},
+}
+
+# 정치적 위치 열별 결과 열 이름 (그 밖의 열은 bias_{열 이름})
+TARGET_COLUMNS = {
+    'coord1D': 'bias_x',
+    'coord2D': 'bias_y',
+}
+
+# 교차 검증 기본값
+DEFAULT_CV_FOLDS = 5
+DEFAULT_N_ALPHAS = 20
+DEFAULT_L1_RATIOS = (0.1, 0.5, 0.9)
+
+def default_alphas(model, X, y, n_alphas=DEFAULT_N_ALPHAS, l1_ratios=DEFAULT_L1_RATIOS):
+    """
+    모델별 정규화 강도(alpha) 후보 (로그 간격)
+    
+    Ridge는 의원-단어 행렬의 행이 L2 정규화되어 있으므로 1e-5 ~ 1e3 범위를 사용하고,
+    Lasso/ElasticNet은 모든 계수가 0이 되는 alpha_max부터 alpha_max / 1000까지 사용한다 (sklearn LassoCV와 같은 기준).
+    """
+    if model == 'ridge':
+        return np.logspace(-5, 3, n_alphas)
+    
+    # 중심화한 y와 상관이 가장 큰 단어의 계수가 alpha_max에서 처음 0이 아니게 됨
+    correlation = np.abs(X.T @ (y - y.mean())).max()
+    l1_ratio = min(l1_ratios) if model == 'elasticnet' else 1.0
+    alpha_max = correlation / (len(y) * l1_ratio)
+    return np.logspace(np.log10(alpha_max), np.log10(alpha_max * 1e-3), n_alphas)
+
+class GramRidge(BaseEstimator, RegressorMixin):
+    """
+    의원 × 의원 Gram 행렬을 한 번 분해하여 여러 종속 변수(정치적 위치 차원)를 함께 푸는 ridge 회귀
+    
+    coef = Xcᵀ (Xc Xcᵀ + αI)⁻¹ Yc  (Xc, Yc: 열 평균을 뺀 행렬)
+    
+    단어 수보다 의원 수가 훨씬 적으므로 단어 × 단어 대신 의원 × 의원 행렬을 고유값 분해하고,
+    분해 결과는 모든 종속 변수와 모든 alpha에 재사용한다.
+    alpha=0이면 최소 노름 최소제곱 해 (희소 행렬에서 LinearRegression이 구하는 해와 같음).
+    """
+    
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+    
+    @staticmethod
+    def decompose(X):
+        """
+        열 평균을 뺀 Gram 행렬 Xc Xcᵀ의 고유값 분해 (희소 행렬 X를 밀집 행렬로 바꾸지 않음)
+        
+        Returns:
+            (X, 열 평균, 고유값, 고유벡터)
+        """
+        X = sparse.csr_matrix(X)
+        x_mean = np.asarray(X.mean(axis=0)).ravel()
+        
+        # Xc Xcᵀ = H (X Xᵀ) H (H: 중심화 행렬)
+        gram = (X @ X.T).toarray()
+        gram_mean = gram.mean(axis=0)
+        gram = gram - gram_mean[None, :] - gram_mean[:, None] + gram_mean.mean()
+        
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        return X, x_mean, eigenvalues, eigenvectors
+    
+    @staticmethod
+    def solve(decomposition, Y, alpha):
+        """
+        분해 결과로 계수 계산
+        
+        Returns:
+            (계수, 절편) - Y가 2차원이면 계수는 (종속 변수 수, 단어 수) 배열
+        """
+        X, x_mean, eigenvalues, eigenvectors = decomposition
+        Y = np.asarray(Y, dtype=np.float64)
+        y_mean = Y.mean(axis=0)
+        
+        if alpha > 0:
+            inverse = 1.0 / (eigenvalues + alpha)
+        else:
+            # 중심화로 생긴 0 고유값은 제외 (유사 역행렬)
+            tolerance = eigenvalues.max() * len(eigenvalues) * np.finfo(np.float64).eps
+            inverse = np.divide(1.0, eigenvalues, out=np.zeros_like(eigenvalues), where=eigenvalues > tolerance)
+        
+        dual = eigenvectors @ (inverse.reshape(-1, *[1] * (Y.ndim - 1)) * (eigenvectors.T @ (Y - y_mean)))
+        
+        # Xcᵀ dual = Xᵀ dual - x̄ (1ᵀ dual)
+        coef = X.T @ dual - np.multiply.outer(x_mean, dual.sum(axis=0))
+        intercept = y_mean - x_mean @ coef
+        return coef.T, intercept
+    
+    def fit(self, X, Y):
+        self.coef_, self.intercept_ = self.solve(self.decompose(X), Y, self.alpha)
+        return self
+    
+    def predict(self, X):
+        return X @ self.coef_.T + self.intercept_
+
+# 부트스트랩 워커와 공유하는 학습 데이터 배열 (파일 이름: {이름}.npy)
+BOOTSTRAP_ARRAYS = ('data', 'indices', 'indptr', 'shape', 'y')
+
+# 워커 프로세스별 부트스트랩 학습 데이터 (의원-단어 행렬, 정치적 위치, 학습 설정이 같은 모델)
+_bootstrap_data = None
+
+def _init_bootstrap_worker(array_dir, estimator):
+    """
+    부트스트랩 워커 초기화 함수
+    
+    의원-단어 행렬(CSR 배열)과 정치적 위치를 메모리 맵으로 열기 때문에
+    작업마다 행렬을 전달하지 않고 모든 워커가 같은 파일 페이지를 공유한다.
+    """
+    global _bootstrap_data
+    arrays = {name: np.load(os.path.join(array_dir, f"{name}.npy"), mmap_mode='r') for name in BOOTSTRAP_ARRAYS}
+    X = sparse.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']), shape=tuple(arrays['shape']))
+    _bootstrap_data = (X, arrays['y'], estimator)
+
+def _bootstrap_coefficients(seeds):
+    """
+    의원을 복원 추출한 표본으로 모델을 다시 학습하여 단어별 계수 계산
+    
+    Args:
+        seeds: 반복별 난수 시드 (np.random.SeedSequence) 목록
+    
+    Returns:
+        (반복 수, 단어 수) 계수 배열
+    """
+    X, y, estimator = _bootstrap_data
+    n_members = X.shape[0]
+    coefficients = np.empty((len(seeds), X.shape[1]), dtype=np.float32)
+    
+    for i, seed in enumerate(seeds):
+        rows = np.random.default_rng(seed).integers(0, n_members, n_members)
+        model = clone(estimator)
+        model.fit(X[rows], y[rows])
+        coefficients[i] = model.coef_
+    
+    return coefficients
+
+# 워커 프로세스별 구간 학습 설정 (분석기, 기간 집계 행렬의 의원/단어/품사 목록, 학습 옵션)
+_window_data = None
+
+def _init_window_worker(wnominate_file, speakers, words, tags, options):
+    """
+    구간 학습 워커 초기화 함수 (의원/단어 목록은 작업마다 보내지 않고 워커마다 한 번만 전달)
+    """
+    global _window_data
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = WordPoliticalBiasAnalyzer(wnominate_file)
+    _window_data = (analyzer, speakers, words, tags, options)
+
+def _fit_window(task):
+    """
+    한 구간의 의원 × (단어, 품사) 빈도 행렬로 의원-단어 행렬을 만들고 회귀 모델 학습
+    
+    Args:
+        task: (구간 번호, 빈도 희소 행렬)
+    
+    Returns:
+        (구간 번호, 단어별 편향 점수 데이터프레임 또는 None, 학습 요약 또는 건너뛴 이유)
+    """
+    analyzer, speakers, words, tags, options = _window_data
+    window, counts = task
+    counts = counts.tocoo()
+    word_freq_df = pd.DataFrame({
+        'speaker': speakers[counts.row],
+        'word': words[counts.col],
+        'tag': tags[counts.col],
+        'count': counts.data,
+    })
+    
+    # 구간마다 출력하면 병렬 실행 시 출력이 섞이므로 요약만 반환
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            matrix, matrix_speakers, matrix_words, word_total_counts = analyzer.create_word_speaker_matrix(
+                word_freq_df, options['min_word_count']
+            )
+            word_bias = analyzer.train_regression_model(
+                matrix, matrix_speakers, matrix_words, word_total_counts, model=options['model'],
+                cv_folds=options['cv_folds'], alphas=options['alphas'], l1_ratios=options['l1_ratios'],
+                n_jobs=options['n_jobs'], targets=options['targets']
+            )
+    except ValueError as e:
+        return window, None, str(e)
+    
+    info = analyzer.model_info
+    summary = {'members': info['members'], 'words': len(word_bias), **info['params']}
+    if 'cv_r2' in info:
+        summary['cv_r2'] = info['cv_r2']
+    return window, word_bias, summary
 
 class WordPoliticalBiasAnalyzer:
     """
@@ -20,9 +233,15 @@ class WordPoliticalBiasAnalyzer:
         Args:
             wnominate_file: 의원별 정치적 위치 정보가 담긴 CSV 파일 경로
         """
-        self.conn = sqlite3.connect(DATABASE_NAME)
+        self.conn = connect('read_only')
+        self.wnominate_file = wnominate_file
         self.wnominate_data = pd.read_csv(wnominate_file)
         print(f"정치적 위치 데이터 로드: {len(self.wnominate_data)}명의 의원 정보")
+        
+        # 마지막으로 학습한 모델과 교차 검증 결과
+        self.model = None
+        self.model_info = None
+        self.cv_results = None
     
     def load_word_frequency_data(self):
         """
@@ -42,130 +261,690 @@ class WordPoliticalBiasAnalyzer:
         """
         의원-단어 행렬 생성
         
+        의원과 단어를 정수 번호로 변환하여 희소 행렬(CSR)을 직접 만들기 때문에
+        메모리 사용량이 의원 수 × 단어 수가 아니라 0이 아닌 값의 개수에 비례한다.
+        
         Args:
             word_freq_df: 단어 빈도 데이터프레임
             min_word_count: 최소 등장 횟수 (이 횟수 미만으로 등장한 단어는 제외)
         
         Returns:
-            의원-단어 행렬, 단어 목록, 단어별 총 등장 횟수
+            의원-단어 희소 행렬(TF-IDF 적용), 의원 목록, 단어 목록, 단어별 총 등장 횟수
         """
         print(f"의원-단어 행렬 생성 중...")
         
-        # 각 의원별 총 단어 수 계산
-        speaker_total_words = word_freq_df.groupby('speaker')['count'].sum().reset_index()
-        speaker_total_words.columns = ['speaker', 'total_words']
-        
-        # 단어 빈도 데이터에 총 단어 수 정보 병합
-        word_freq_df = pd.merge(word_freq_df, speaker_total_words, on='speaker')
-        
-        # 단어 사용 비율 계산 (정규화)
-        word_freq_df['ratio'] = word_freq_df['count'] / word_freq_df['total_words']
+        # 각 의원별 총 단어 수로 나누어 단어 사용 비율 계산 (정규화)
+        speaker_total_words = word_freq_df.groupby('speaker')['count'].transform('sum')
+        word_freq_df = word_freq_df.assign(ratio=word_freq_df['count'] / speaker_total_words)
         
         # 각 단어별 총 등장 횟수 계산
         word_counts = word_freq_df.groupby('word')['count'].sum()
         
         # 최소 등장 횟수 필터링
-        frequent_words = word_counts[word_counts >= min_word_count].index.tolist()
+        frequent_words = word_counts[word_counts >= min_word_count].index
         word_freq_df = word_freq_df[word_freq_df['word'].isin(frequent_words)]
         
         print(f"최소 {min_word_count}회 이상 등장한 단어 {len(frequent_words)}개 선택")
         
-        # 의원-단어 행렬 생성
-        pivot_df = word_freq_df.pivot_table(
-            index='speaker', 
-            columns='word', 
-            values='ratio',
-            fill_value=0
-        )
+        # 같은 단어가 품사별로 나뉘어 있으면 비율의 평균 사용 (기존 pivot_table과 동일)
+        cell_ratios = word_freq_df.groupby(['speaker', 'word'])['ratio'].mean()
         
-        # TF-IDF 변환 적용
-        tfidf = TfidfTransformer()
-        tfidf_matrix = tfidf.fit_transform(pivot_df.values)
+        # 의원과 단어를 정수 번호로 변환 (정렬된 순서)
+        speakers = pd.Index(np.sort(word_freq_df['speaker'].unique()))
+        words = pd.Index(np.sort(word_freq_df['word'].unique()))
+        rows = speakers.get_indexer(cell_ratios.index.get_level_values('speaker'))
+        cols = words.get_indexer(cell_ratios.index.get_level_values('word'))
         
-        # 변환된 행렬을 데이터프레임으로 변환
-        tfidf_df = pd.DataFrame(
-            tfidf_matrix.toarray(),
-            index=pivot_df.index,
-            columns=pivot_df.columns
+        # 의원-단어 희소 행렬 생성
+        ratio_matrix = sparse.csr_matrix(
+            (cell_ratios.values, (rows, cols)),
+            shape=(len(speakers), len(words))
         )
         
-        print(f"TF-IDF 변환 완료: {tfidf_df.shape[0]}명의 의원, {tfidf_df.shape[1]}개의 단어")
+        # TF-IDF 변환 적용 (희소 행렬 그대로 변환)
+        tfidf = TfidfTransformer()
+        tfidf_matrix = tfidf.fit_transform(ratio_matrix)
+        
+        print(f"TF-IDF 변환 완료: {tfidf_matrix.shape[0]}명의 의원, {tfidf_matrix.shape[1]}개의 단어 "
+              f"(0이 아닌 값 {tfidf_matrix.nnz:,}개)")
         
         # 단어별 총 등장 횟수를 Series로 반환
-        word_total_counts = word_counts[frequent_words]
+        word_total_counts = word_counts[words]
         
-        return tfidf_df, list(tfidf_df.columns), word_total_counts
+        return tfidf_matrix, list(speakers), list(words), word_total_counts
     
-    def train_regression_model(self, word_speaker_matrix, words, word_total_counts):
+    def _training_data(self, word_speaker_matrix, speakers, targets=('coord1D',)):
         """
-        선형 회귀 모델 학습 (1차원 편향만 사용)
+        정치적 위치 데이터가 있는 의원의 행만 골라 회귀 모델 학습 데이터 생성
         
         Args:
-            word_speaker_matrix: 의원-단어 행렬 (TF-IDF 적용됨)
-            words: 단어 목록
-            word_total_counts: 단어별 총 등장 횟수
+            targets: 종속 변수로 사용할 정치적 위치 열 목록
         
         Returns:
-            단어별 정치적 편향 점수
+            (독립 변수: 단어 사용 비율 희소 행렬, 종속 변수: 정치적 위치 - 열이 하나면 1차원 배열)
         """
-        print("선형 회귀 모델 학습 중...")
+        missing = [column for column in targets if column not in self.wnominate_data.columns]
+        if missing:
+            raise ValueError(f"정치적 위치 데이터에 없는 열입니다: {', '.join(missing)}")
         
-        # 의원-단어 행렬과 정치적 위치 데이터 병합
-        X_df = word_speaker_matrix.reset_index()
-        merged_df = pd.merge(X_df, self.wnominate_data, left_on='speaker', right_on='name')
+        # 의원 목록과 정치적 위치 데이터 병합 (행렬의 행 번호만 사용)
+        speaker_rows = pd.DataFrame({'speaker': speakers, 'row': np.arange(len(speakers))})
+        merged_df = pd.merge(speaker_rows, self.wnominate_data, left_on='speaker', right_on='name')
         
         if merged_df.empty:
             raise ValueError("의원-단어 행렬과 정치적 위치 데이터를 병합할 수 없습니다. 의원 이름이 일치하는지 확인하세요.")
         
-        # 독립 변수 (단어 사용 비율)
-        X = merged_df[words].values
+        X = word_speaker_matrix[merged_df['row'].values]
+        y = merged_df[list(targets)].values
+        if len(targets) == 1:
+            y = y.ravel()
+        return X, y
+    
+    def _fit_multi_target(self, X, Y, model, cv_folds, alphas, random_state):
+        """
+        여러 정치적 위치 차원을 GramRidge로 함께 학습
         
-        # 종속 변수 (정치적 위치 x)
-        y = merged_df['coord1D'].values
+        ridge는 fold마다 Gram 행렬을 한 번만 분해하고 모든 alpha 후보와 차원에 재사용하여
+        교차 검증 MSE(차원 평균)가 가장 작은 alpha를 선택한다.
+        
+        Returns:
+            (전체 데이터로 학습한 모델, 후보별 교차 검증 결과 데이터프레임 또는 None)
+        """
+        if model == 'linear':
+            alphas = [0.0]
+        elif alphas is None:
+            alphas = default_alphas('ridge', X, Y)
+        
+        if len(alphas) == 1:
+            with timer('model.fit'):
+                return GramRidge(alpha=float(alphas[0])).fit(X, Y), None
+        
+        print(f"{cv_folds}-fold 교차 검증: 후보 {len(alphas)}개 × {cv_folds}개 fold (fold별 분해 1회)")
+        mse = np.empty((len(alphas), cv_folds))
+        r2 = np.empty((len(alphas), cv_folds))
+        
+        with timer('model.cv_search'):
+            folds = KFold(n_splits=cv_folds, shuffle=True, random_state=random_state).split(X)
+            for fold, (train_rows, test_rows) in enumerate(folds):
+                decomposition = GramRidge.decompose(X[train_rows])
+                for i, alpha in enumerate(alphas):
+                    coef, intercept = GramRidge.solve(decomposition, Y[train_rows], alpha)
+                    predicted = X[test_rows] @ coef.T + intercept
+                    mse[i, fold] = np.mean((Y[test_rows] - predicted) ** 2)
+                    r2[i, fold] = r2_score(Y[test_rows], predicted)
+        
+        cv_results = pd.DataFrame({
+            'alpha': np.asarray(alphas, dtype=float),
+            'mean_mse': mse.mean(axis=1),
+            'std_mse': mse.std(axis=1),
+            'mean_r2': r2.mean(axis=1),
+            'std_r2': r2.std(axis=1),
+        })
+        cv_results['rank'] = cv_results['mean_mse'].rank(method='min').astype(int)
+        cv_results = cv_results.sort_values('rank').reset_index(drop=True)
+        
+        best = cv_results.iloc[0]
+        print(f"최적 설정: {{'alpha': {best['alpha']}}} (교차 검증 MSE {best['mean_mse']:.4f}, R² {best['mean_r2']:.4f})")
+        if best['alpha'] in (min(alphas), max(alphas)):
+            print("최적 alpha가 후보 범위의 경계에 있습니다. --alphas로 후보 범위를 넓혀 보세요.")
+        
+        with timer('model.fit'):
+            estimator = GramRidge(alpha=float(best['alpha'])).fit(X, Y)
+        return estimator, cv_results
+    
+    def _search_regularization(self, X, y, model, cv_folds, alphas, l1_ratios, n_jobs, random_state):
+        """
+        정규화 강도 후보별로 k-fold 교차 검증을 수행하여 가장 좋은 모델 선택
+        
+        (후보, fold) 조합은 서로 독립적이므로 n_jobs개의 프로세스에서 병렬로 학습한다.
+        
+        Returns:
+            (전체 데이터로 다시 학습한 최적 모델, 후보별 교차 검증 결과 데이터프레임)
+        """
+        if alphas is None:
+            alphas = default_alphas(model, X, y, l1_ratios=l1_ratios)
+        
+        param_grid = {'alpha': [float(alpha) for alpha in alphas]}
+        if model == 'elasticnet':
+            param_grid['l1_ratio'] = [float(ratio) for ratio in l1_ratios]
+        
+        if n_jobs == 0:
+            # joblib은 0을 허용하지 않으므로 부트스트랩과 같이 순차 처리로 취급
+            n_jobs = 1
+        
+        candidates = len(param_grid['alpha']) * len(param_grid.get('l1_ratio', [None]))
+        print(f"{cv_folds}-fold 교차 검증: 후보 {candidates}개 × {cv_folds}개 fold = {candidates * cv_folds}회 학습")
+        
+        search = GridSearchCV(
+            MODELS[model](**MODEL_OPTIONS.get(model, {})),
+            param_grid,
+            cv=KFold(n_splits=cv_folds, shuffle=True, random_state=random_state),
+            scoring={'mse': 'neg_mean_squared_error', 'r2': 'r2'},
+            refit='mse',
+            n_jobs=n_jobs,
+        )
+        with timer('model.cv_search'):
+            search.fit(X, y)
+        
+        results = search.cv_results_
+        cv_results = pd.DataFrame({'alpha': np.asarray(results['param_alpha'], dtype=float)})
+        if model == 'elasticnet':
+            cv_results['l1_ratio'] = np.asarray(results['param_l1_ratio'], dtype=float)
+        cv_results['mean_mse'] = -results['mean_test_mse']
+        cv_results['std_mse'] = results['std_test_mse']
+        cv_results['mean_r2'] = results['mean_test_r2']
+        cv_results['std_r2'] = results['std_test_r2']
+        cv_results['mean_fit_seconds'] = results['mean_fit_time']
+        cv_results['rank'] = results['rank_test_mse']
+        cv_results = cv_results.sort_values('rank').reset_index(drop=True)
+        
+        best = cv_results.iloc[0]
+        print(f"최적 설정: {search.best_params_} (교차 검증 MSE {best['mean_mse']:.4f}, R² {best['mean_r2']:.4f})")
+        if best['alpha'] in (min(param_grid['alpha']), max(param_grid['alpha'])):
+            print("최적 alpha가 후보 범위의 경계에 있습니다. --alphas로 후보 범위를 넓혀 보세요.")
+        
+        return search.best_estimator_, cv_results
+    
+    def train_regression_model(self, word_speaker_matrix, speakers, words, word_total_counts, model='linear',
+                               cv_folds=DEFAULT_CV_FOLDS, alphas=None, l1_ratios=DEFAULT_L1_RATIOS,
+                               n_jobs=-1, random_state=0, targets=('coord1D',)):
+        """
+        회귀 모델 학습
+        
+        의원 수(약 300명)보다 단어 수(약 18,000개)가 훨씬 많아 일반 선형 회귀는 해가 유일하지 않으므로,
+        ridge/lasso/elasticnet을 선택하면 정규화 강도를 k-fold 교차 검증으로 고른 모델을 사용한다.
+        
+        targets에 여러 열(예: coord1D, coord2D)을 지정하면 linear/ridge 모델을 GramRidge로
+        한 번의 분해에서 함께 풀고, 결과는 차원별 bias_x, bias_y(그 밖의 열은 bias_{열 이름}) 열로 반환한다.
+        
+        Args:
+            word_speaker_matrix: 의원-단어 희소 행렬 (TF-IDF 적용됨)
+            speakers: 행렬의 행 순서에 해당하는 의원 목록
+            words: 단어 목록
+            word_total_counts: 단어별 총 등장 횟수
+            model: 회귀 모델 (linear, ridge, lasso, elasticnet)
+            cv_folds: 교차 검증 fold 수
+            alphas: 정규화 강도 후보 (None이면 모델별 기본 범위)
+            l1_ratios: elasticnet의 L1 비율 후보
+            n_jobs: 교차 검증 병렬 프로세스 수 (-1이면 모든 코어)
+            random_state: fold 분할 난수 시드
+            targets: 종속 변수로 사용할 정치적 위치 열 목록
+        
+        Returns:
+            단어별 정치적 편향 점수
+        """
+        if model not in MODELS:
+            raise ValueError(f"지원하지 않는 회귀 모델입니다: {model}")
+        if len(targets) > 1 and model not in ('linear', 'ridge'):
+            raise ValueError("여러 차원을 함께 학습하는 모드는 linear, ridge 모델만 지원합니다.")
+        
+        print(f"회귀 모델({model}) 학습 중... (종속 변수: {', '.join(targets)})")
+        
+        X, y = self._training_data(word_speaker_matrix, speakers, targets)
+        
+        # 학습 데이터 지문 (같은 지문이면 같은 의원-단어 행렬과 정치적 위치로 학습한 모델)
+        fingerprint = hashlib.sha256()
+        X_csr = sparse.csr_matrix(X)
+        for array in (X_csr.data, X_csr.indices, X_csr.indptr, np.asarray(y, dtype=np.float64)):
+            fingerprint.update(np.ascontiguousarray(array).tobytes())
+        fingerprint.update('\n'.join(words).encode('utf-8'))
         
         # 회귀 모델 학습
-        model = LinearRegression()
-        model.fit(X, y)
+        if len(targets) > 1:
+            estimator, self.cv_results = self._fit_multi_target(X, y, model, cv_folds, alphas, random_state)
+        elif model == 'linear':
+            estimator = LinearRegression()
+            with timer('model.fit'):
+                estimator.fit(X, y)
+            self.cv_results = None
+        else:
+            estimator, self.cv_results = self._search_regularization(
+                X, y, model, cv_folds, alphas, l1_ratios, n_jobs, random_state
+            )
+        
+        self.model = estimator
+        self.model_info = {
+            'model': model,
+            'params': {key: float(value) for key, value in estimator.get_params().items()
+                       if key in ('alpha', 'l1_ratio')},
+            'cv_folds': cv_folds if self.cv_results is not None else None,
+            'targets': list(targets),
+            'training_fingerprint': fingerprint.hexdigest(),
+            'members': int(X.shape[0]),
+            'words': list(words),
+        }
+        if self.cv_results is not None:
+            self.model_info['cv_mse'] = float(self.cv_results['mean_mse'].iloc[0])
+            self.model_info['cv_r2'] = float(self.cv_results['mean_r2'].iloc[0])
         
         # 단어별 정치적 편향 점수 계산
-        word_bias = pd.DataFrame({
-            'word': words,
-            'bias_score': model.coef_,
-            'total_count': [word_total_counts[word] for word in words]
-        })
+        if len(targets) > 1:
+            bias_columns = [TARGET_COLUMNS.get(column, f"bias_{column}") for column in targets]
+            word_bias = pd.DataFrame(estimator.coef_.T, columns=bias_columns)
+            word_bias.insert(0, 'word', words)
+            word_bias['total_count'] = word_total_counts.values
+            
+            # 편향 벡터의 크기가 큰 순서로 정렬
+            word_bias['abs_bias'] = np.linalg.norm(estimator.coef_, axis=0)
+        else:
+            bias_columns = ['bias_score']
+            word_bias = pd.DataFrame({
+                'word': words,
+                'bias_score': estimator.coef_,
+                'total_count': word_total_counts.values
+            })
+            
+            # 절대값이 큰 순서로 정렬
+            word_bias['abs_bias'] = word_bias['bias_score'].abs()
         
-        # 절대값이 큰 순서로 정렬
-        word_bias['abs_bias'] = word_bias['bias_score'].abs()
         word_bias = word_bias.sort_values('abs_bias', ascending=False).reset_index(drop=True)
-        word_bias = word_bias[['word', 'bias_score', 'total_count']]
+        word_bias = word_bias[['word', *bias_columns, 'total_count']]
         
+        if model != 'linear':
+            print(f"0이 아닌 계수: {int(np.count_nonzero(estimator.coef_)):,}개")
         print(f"회귀 모델 학습 완료: {len(word_bias)}개 단어의 정치적 편향 계산")
         
         return word_bias
     
-    def analyze_word_political_bias(self, min_word_count=10, output_file='word_political_bias_1d.csv'):
+    def bootstrap_confidence_intervals(self, word_speaker_matrix, speakers, n_boot=200, confidence=0.95,
+                                       workers=1, seed=0):
+        """
+        의원을 복원 추출하여 모델을 n_boot번 다시 학습하고 단어별 편향 점수의 신뢰 구간 계산 (백분위수 방법)
+        
+        정규화 강도 등 학습 설정은 train_regression_model()에서 선택한 모델과 같게 유지한다.
+        의원-단어 행렬은 임시 디렉토리에 .npy로 한 번 저장하고 워커가 메모리 맵으로 공유한다.
+        
+        Args:
+            word_speaker_matrix: 의원-단어 희소 행렬 (TF-IDF 적용됨)
+            speakers: 행렬의 행 순서에 해당하는 의원 목록
+            n_boot: 부트스트랩 반복 횟수
+            confidence: 신뢰 수준
+            workers: 워커 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+            seed: 난수 시드 (워커 수와 관계없이 같은 시드면 같은 결과)
+        
+        Returns:
+            (하한 배열, 상한 배열) - 행렬의 단어 순서
+        """
+        if self.model is None:
+            raise ValueError("학습된 모델이 없습니다. train_regression_model()을 먼저 실행하세요.")
+        if n_boot < 1:
+            raise ValueError(f"부트스트랩 반복 횟수는 1 이상이어야 합니다: {n_boot}")
+        if not 0 < confidence < 1:
+            raise ValueError(f"신뢰 수준은 0과 1 사이여야 합니다: {confidence}")
+        
+        X, y = self._training_data(word_speaker_matrix, speakers)
+        X = sparse.csr_matrix(X)
+        
+        # 반복별 독립적인 난수 시드를 작업 단위로 나누기 (워커마다 여러 작업을 받아 부하를 고르게 분산)
+        seeds = np.random.SeedSequence(seed).spawn(n_boot)
+        chunk_size = max(1, -(-n_boot // (workers * 4)))
+        tasks = [seeds[i:i + chunk_size] for i in range(0, n_boot, chunk_size)]
+        
+        print(f"부트스트랩 신뢰 구간 계산 중... ({n_boot}회 재학습, 워커 {workers}개)")
+        progress = Progress('bias.bootstrap_replicates', total=n_boot, label='부트스트랩', unit='회')
+        coefficients = []
+        
+        with tempfile.TemporaryDirectory(prefix='word_bias_bootstrap_') as array_dir:
+            arrays = {
+                'data': X.data, 'indices': X.indices, 'indptr': X.indptr,
+                'shape': np.array(X.shape, dtype=np.int64), 'y': np.asarray(y, dtype=np.float64),
+            }
+            for name in BOOTSTRAP_ARRAYS:
+                np.save(os.path.join(array_dir, f"{name}.npy"), arrays[name])
+            
+            estimator = clone(self.model)
+            with timer('model.bootstrap'):
+                if workers > 1:
+                    with multiprocessing.get_context('spawn').Pool(
+                        workers, initializer=_init_bootstrap_worker, initargs=(array_dir, estimator)
+                    ) as pool:
+                        for result in pool.imap_unordered(_bootstrap_coefficients, tasks):
+                            coefficients.append(result)
+                            progress.update(len(result))
+                else:
+                    _init_bootstrap_worker(array_dir, estimator)
+                    for task in tasks:
+                        result = _bootstrap_coefficients(task)
+                        coefficients.append(result)
+                        progress.update(len(result))
+        
+        progress.close()
+        
+        coefficients = np.vstack(coefficients)
+        tail = (1 - confidence) / 2 * 100
+        ci_low, ci_high = np.percentile(coefficients, [tail, 100 - tail], axis=0)
+        
+        self.model_info['bootstrap'] = {
+            'replicates': n_boot,
+            'confidence': confidence,
+            'resample': 'members',
+            'seed': seed,
+        }
+        
+        return ci_low, ci_high
+    
+    @staticmethod
+    def dominant_tags(word_freq_df):
+        """
+        단어별로 가장 많이 등장한 품사 (행렬은 품사를 합쳐 단어 단위로 만들기 때문에 대표 품사만 남김)
+        """
+        tag_counts = word_freq_df.groupby(['word', 'tag'], as_index=False)['count'].sum()
+        tag_counts = tag_counts.sort_values(['word', 'count'], ascending=[True, False])
+        return tag_counts.drop_duplicates('word').set_index('word')['tag']
+    
+    def export_artifact(self, word_bias, artifact_file, word_tags=None):
+        """
+        단어별 편향 점수를 메모리 맵으로 읽을 수 있는 바이너리 파일로 저장 (BiasScorer.from_artifact로 사용)
+        
+        Args:
+            word_bias: train_regression_model() 결과 데이터프레임
+            artifact_file: 저장할 파일 경로
+            word_tags: 단어별 대표 품사 Series (dominant_tags() 결과)
+        """
+        columns = [column for column in word_bias.columns if column not in ('word', 'total_count')]
+        info = self.model_info or {}
+        metadata = {
+            'min_word_count': info.get('min_word_count'),
+            'training_fingerprint': info.get('training_fingerprint'),
+            'model': {key: value for key, value in info.items()
+                      if key not in ('words', 'min_word_count', 'training_fingerprint')},
+        }
+        
+        with timer('model.export_artifact'):
+            write_bias_artifact(
+                artifact_file,
+                word_bias['word'].tolist(),
+                word_bias[columns].to_numpy(),
+                columns,
+                total_counts=word_bias['total_count'].to_numpy(),
+                tags=word_bias['word'].map(word_tags).fillna('').tolist() if word_tags is not None else None,
+                metadata=metadata,
+            )
+        print(f"편향 점수 파일이 {artifact_file}에 저장되었습니다. ({len(word_bias):,}개 단어, 열: {', '.join(columns)})")
+    
+    def save_model(self, model_file, cv_results_file=None):
+        """
+        마지막으로 학습한 모델(joblib)과 교차 검증 결과(CSV) 저장
+        
+        저장한 모델은 joblib.load(model_file)로 읽으며, 'model'(학습된 회귀 모델)과
+        'info'(모델 종류, 선택된 정규화 강도, 교차 검증 점수, 계수 순서에 해당하는 단어 목록)를 가진다.
+        """
+        if self.model is None:
+            raise ValueError("학습된 모델이 없습니다. train_regression_model()을 먼저 실행하세요.")
+        
+        joblib.dump({'model': self.model, 'info': self.model_info}, model_file)
+        print(f"회귀 모델이 {model_file}에 저장되었습니다.")
+        
+        if cv_results_file and self.cv_results is not None:
+            self.cv_results.to_csv(cv_results_file, index=False, encoding='utf-8-sig')
+            print(f"교차 검증 결과가 {cv_results_file}에 저장되었습니다.")
+    
+    def analyze_word_political_bias(self, min_word_count=10, output_file='word_political_bias_1d.csv', model='linear',
+                                    cv_folds=DEFAULT_CV_FOLDS, alphas=None, l1_ratios=DEFAULT_L1_RATIOS, n_jobs=-1,
+                                    model_file=None, cv_results_file=None, bootstrap=0, confidence=0.95, seed=0,
+                                    targets=('coord1D',), artifact_file=None):
         """
         단어의 정치적 편향성 분석 수행
         
         Args:
             min_word_count: 최소 등장 횟수
             output_file: 결과를 저장할 CSV 파일 경로
+            model: 회귀 모델 (linear, ridge, lasso, elasticnet)
+            cv_folds: 교차 검증 fold 수
+            alphas: 정규화 강도 후보 (None이면 모델별 기본 범위)
+            l1_ratios: elasticnet의 L1 비율 후보
+            n_jobs: 교차 검증 병렬 프로세스 수 (-1이면 모든 코어)
+            model_file: 학습한 모델을 저장할 파일 경로 (정규화 모델은 생략 시 '{결과 파일 이름}_{모델}.joblib')
+            cv_results_file: 교차 검증 결과를 저장할 CSV 파일 경로 (생략 시 '{결과 파일 이름}_{모델}_cv.csv')
+            bootstrap: 신뢰 구간 계산을 위한 부트스트랩 반복 횟수 (0이면 계산하지 않음)
+            confidence: 신뢰 수준
+            seed: 부트스트랩 난수 시드
+            targets: 종속 변수로 사용할 정치적 위치 열 목록 (여러 개면 한 번의 분해로 함께 학습)
+            artifact_file: 편향 점수를 메모리 맵 바이너리 파일로도 저장할 경로
         """
+        if bootstrap < 0:
+            raise ValueError(f"부트스트랩 반복 횟수는 0 이상이어야 합니다: {bootstrap}")
+        if bootstrap and len(targets) > 1:
+            raise ValueError("부트스트랩 신뢰 구간은 종속 변수가 하나일 때만 계산할 수 있습니다.")
+        if bootstrap and not 0 < confidence < 1:
+            raise ValueError(f"신뢰 수준은 0과 1 사이여야 합니다: {confidence}")
+        
         # 단어 빈도 데이터 로드
         word_freq_df = self.load_word_frequency_data()
         
         # 의원-단어 행렬 생성
-        word_speaker_matrix, words, word_total_counts = self.create_word_speaker_matrix(word_freq_df, min_word_count)
+        word_speaker_matrix, speakers, words, word_total_counts = self.create_word_speaker_matrix(
+            word_freq_df, min_word_count
+        )
         
         # 회귀 모델 학습 및 단어별 정치적 편향 계산
-        word_bias = self.train_regression_model(word_speaker_matrix, words, word_total_counts)
+        word_bias = self.train_regression_model(
+            word_speaker_matrix, speakers, words, word_total_counts, model=model, cv_folds=cv_folds,
+            alphas=alphas, l1_ratios=l1_ratios, n_jobs=n_jobs, targets=targets
+        )
+        self.model_info['min_word_count'] = min_word_count
+        
+        # 의원 복원 추출로 단어별 신뢰 구간 계산 (교차 검증과 같은 수의 프로세스 사용)
+        if bootstrap:
+            workers = os.cpu_count() if n_jobs is None or n_jobs < 0 else max(1, n_jobs)
+            ci_low, ci_high = self.bootstrap_confidence_intervals(
+                word_speaker_matrix, speakers, n_boot=bootstrap, confidence=confidence, workers=workers, seed=seed
+            )
+            intervals = pd.DataFrame({'ci_low': ci_low, 'ci_high': ci_high}, index=words)
+            word_bias = word_bias.join(intervals, on='word')[['word', 'bias_score', 'ci_low', 'ci_high', 'total_count']]
         
         # 결과 저장
         word_bias.to_csv(output_file, index=False, encoding='utf-8-sig')
         print(f"단어별 정치적 편향 결과가 {output_file}에 저장되었습니다.")
         
+        if artifact_file:
+            self.export_artifact(word_bias, artifact_file, self.dominant_tags(word_freq_df))
+        
+        # 교차 검증으로 선택한 모델과 후보별 점수 저장
+        if model != 'linear' or model_file:
+            base = os.path.splitext(output_file)[0]
+            self.save_model(model_file or f"{base}_{model}.joblib",
+                            cv_results_file or f"{base}_{model}_cv.csv")
+        
         return word_bias
     
+    def load_period_word_frequency_data(self):
+        """
+        의원별, 기간별 단어 빈도 데이터와 시간 순서의 기간 목록 로드
+        (word_frequency_analyzer.py --by-period로 만든 member_period_word_frequency 테이블)
+        """
+        periods = [period for (period,) in self.conn.execute(
+            "SELECT period FROM meeting_periods GROUP BY period ORDER BY MIN(period_order)"
+        )]
+        
+        query = """
+        SELECT speaker, period, word, tag, count
+        FROM member_period_word_frequency
+        """
+        period_freq_df = pd.read_sql_query(query, self.conn)
+        print(f"기간별 단어 빈도 데이터 로드: {len(period_freq_df):,}개 행, {len(periods)}개 기간")
+        
+        return period_freq_df, periods
+    
+    @staticmethod
+    def period_count_matrices(period_freq_df, periods):
+        """
+        기간별 의원 × (단어, 품사) 빈도 희소 행렬 생성 (모든 기간이 같은 의원/단어 번호를 사용)
+        
+        Returns:
+            (기간 순서의 빈도 행렬 목록, 의원 배열, 단어 배열, 품사 배열)
+        """
+        speaker_codes, speakers = pd.factorize(period_freq_df['speaker'], sort=True)
+        token_codes, tokens = pd.MultiIndex.from_frame(period_freq_df[['word', 'tag']]).factorize()
+        period_codes = pd.Categorical(period_freq_df['period'], categories=periods).codes
+        shape = (len(speakers), len(tokens))
+        
+        # 기간 번호로 정렬한 뒤 기간별 구간을 잘라 행렬 생성
+        order = np.argsort(period_codes, kind='stable')
+        bounds = np.searchsorted(period_codes[order], np.arange(len(periods) + 1))
+        counts = period_freq_df['count'].to_numpy(dtype=np.int64)
+        
+        matrices = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            rows = order[start:end]
+            matrices.append(sparse.csr_matrix(
+                (counts[rows], (speaker_codes[rows], token_codes[rows])), shape=shape
+            ))
+        
+        words = np.asarray(tokens.get_level_values(0), dtype=object)
+        tags = np.asarray(tokens.get_level_values(1), dtype=object)
+        return matrices, np.asarray(speakers, dtype=object), words, tags
+    
+    @staticmethod
+    def define_windows(periods, window_size=1, step=1):
+        """
+        연속된 기간 window_size개를 묶은 구간을 step개 기간씩 이동하며 생성
+        
+        마지막 구간 뒤에 남는 기간은 버리지 않고 window_size보다 짧은 마지막 구간으로 포함한다.
+        
+        Returns:
+            (구간 이름, 시작 기간 번호, 끝 기간 번호(미포함)) 목록
+        """
+        if window_size < 1 or step < 1:
+            raise ValueError("구간 크기와 이동 간격은 1 이상이어야 합니다.")
+        
+        windows = []
+        for start in range(0, max(len(periods) - window_size, 0) + 1, step):
+            end = min(start + window_size, len(periods))
+            if start >= end:
+                break
+            label = periods[start] if end - start == 1 else f"{periods[start]}~{periods[end - 1]}"
+            windows.append((label, start, end))
+        
+        # 남은 기간을 짧은 구간으로 추가 (이동 간격이 구간 크기보다 커서 건너뛰는 기간은 제외)
+        if windows:
+            start = windows[-1][1] + step
+            if windows[-1][2] < len(periods) and start < len(periods):
+                end = len(periods)
+                label = periods[start] if end - start == 1 else f"{periods[start]}~{periods[end - 1]}"
+                windows.append((label, start, end))
+        return windows
+    
+    @staticmethod
+    def window_count_matrices(matrices, windows):
+        """
+        구간별 빈도 행렬을 기간 부분 집계의 합으로 계산
+        
+        구간이 겹치면 직전 구간의 합에서 새로 들어온 기간을 더하고 빠진 기간을 빼므로
+        각 기간 행렬은 구간 수와 관계없이 최대 한 번씩만 더하고 뺀다.
+        """
+        current = sparse.csr_matrix(matrices[0].shape, dtype=np.int64)
+        low = high = 0
+        
+        for label, start, end in windows:
+            if start >= high:
+                # 직전 구간과 겹치지 않으면 새로 합산
+                current = sparse.csr_matrix(current.shape, dtype=np.int64)
+                low = high = start
+            while high < end:
+                current = current + matrices[high]
+                high += 1
+                count('bias.window_periods_added')
+            while low < start:
+                current = current - matrices[low]
+                low += 1
+                count('bias.window_periods_removed')
+            current.eliminate_zeros()
+            yield current
+    
+    def analyze_windowed_word_political_bias(self, window_size=1, window_step=1, min_word_count=10,
+                                             output_file='word_political_bias_windows.csv', model='linear',
+                                             cv_folds=DEFAULT_CV_FOLDS, alphas=None, l1_ratios=DEFAULT_L1_RATIOS,
+                                             n_jobs=-1, targets=('coord1D',)):
+        """
+        기간 구간별로 단어의 정치적 편향 모델을 학습하여 편향 점수의 시간에 따른 변화 분석
+        
+        기간별 부분 집계(member_period_word_frequency)를 구간별로 합산하고, 구간마다 전체 분석과 같은
+        의원-단어 행렬 생성과 회귀 모델 학습을 워커 프로세스에서 병렬로 수행한다.
+        
+        Args:
+            window_size: 한 구간에 포함할 연속된 기간 수
+            window_step: 다음 구간까지 이동할 기간 수 (window_size보다 작으면 구간이 겹침)
+            min_word_count: 구간 안에서의 최소 등장 횟수
+            output_file: 결과를 저장할 CSV 파일 경로 (window, start_period, end_period, word, 편향 점수 열, total_count)
+            model: 회귀 모델 (linear, ridge, lasso, elasticnet)
+            cv_folds: 교차 검증 fold 수
+            alphas: 정규화 강도 후보 (None이면 모델별 기본 범위)
+            l1_ratios: elasticnet의 L1 비율 후보
+            n_jobs: 구간 학습 병렬 프로세스 수 (-1이면 모든 코어)
+            targets: 종속 변수로 사용할 정치적 위치 열 목록
+        """
+        period_freq_df, periods = self.load_period_word_frequency_data()
+        if not periods:
+            raise ValueError("기간 정보가 없습니다. 회의 날짜 파일이 회의와 일치하는지 확인하고 "
+                             "word_frequency_analyzer.py --by-period를 다시 실행하세요.")
+        if period_freq_df.empty:
+            raise ValueError("기간별 단어 빈도 데이터가 없습니다. word_frequency_analyzer.py --by-period를 먼저 실행하세요.")
+        
+        windows = self.define_windows(periods, window_size, window_step)
+        label, start, end = windows[-1]
+        if end - start < window_size:
+            print(f"마지막 구간 [{label}]은 기간 {end - start}개만 포함합니다.")
+        with timer('bias.period_matrices'):
+            matrices, speakers, words, tags = self.period_count_matrices(period_freq_df, periods)
+        del period_freq_df
+        
+        workers = os.cpu_count() if n_jobs is None or n_jobs < 0 else max(1, n_jobs)
+        workers = min(workers, len(windows))
+        
+        # 구간을 병렬로 학습할 때는 구간 안의 교차 검증을 순차 처리 (프로세스 수가 코어 수를 넘지 않도록)
+        options = {
+            'min_word_count': min_word_count, 'model': model, 'cv_folds': cv_folds, 'alphas': alphas,
+            'l1_ratios': l1_ratios, 'n_jobs': 1 if workers > 1 else n_jobs, 'targets': targets,
+        }
+        init_args = (self.wnominate_file, speakers, words, tags, options)
+        tasks = ((i, counts) for i, counts in enumerate(self.window_count_matrices(matrices, windows)))
+        
+        print(f"구간 {len(windows)}개 학습 중... (구간당 기간 {window_size}개, 이동 {window_step}개, 워커 {workers}개)")
+        progress = Progress('bias.windows', total=len(windows), label='구간별 학습', unit='개')
+        results = {}
+        
+        with timer('bias.window_models'):
+            if workers > 1:
+                with multiprocessing.get_context('spawn').Pool(
+                    workers, initializer=_init_window_worker, initargs=init_args
+                ) as pool:
+                    for window, word_bias, summary in pool.imap_unordered(_fit_window, tasks):
+                        results[window] = (word_bias, summary)
+                        progress.update()
+            else:
+                _init_window_worker(*init_args)
+                for task in tasks:
+                    window, word_bias, summary = _fit_window(task)
+                    results[window] = (word_bias, summary)
+                    progress.update()
+        
+        progress.close()
+        
+        frames = []
+        for window, (label, start, end) in enumerate(windows):
+            word_bias, summary = results[window]
+            if word_bias is None:
+                print(f"[{label}] 건너뜀: {summary}")
+                continue
+            
+            details = ', '.join(f"{key} {value:.4g}" for key, value in summary.items() if key not in ('members', 'words'))
+            print(f"[{label}] 의원 {summary['members']}명, 단어 {summary['words']:,}개" + (f", {details}" if details else ''))
+            
+            word_bias.insert(0, 'window', label)
+            word_bias.insert(1, 'start_period', periods[start])
+            word_bias.insert(2, 'end_period', periods[end - 1])
+            frames.append(word_bias)
+        
+        if not frames:
+            raise ValueError("학습할 수 있는 구간이 없습니다.")
+        
+        windowed_bias = pd.concat(frames, ignore_index=True)
+        windowed_bias.to_csv(output_file, index=False, encoding='utf-8-sig')
+        print(f"구간별 단어 편향 결과가 {output_file}에 저장되었습니다. ({len(frames)}개 구간, {len(windowed_bias):,}개 행)")
+        
+        return windowed_bias
+    
     def close(self):
         """
         연결 종료
@@ -182,11 +961,59 @@ if __name__ == "__main__":
                         help='최소 단어 등장 횟수 (기본값: 10)')
     parser.add_argument('--output', type=str, default='word_political_bias_1d.csv',
                         help='결과를 저장할 CSV 파일 경로')
+    parser.add_argument('--model', type=str, default='linear', choices=list(MODELS),
+                        help='회귀 모델 (기본값: linear, ridge/lasso/elasticnet은 교차 검증으로 정규화 강도 선택)')
+    parser.add_argument('--cv-folds', type=int, default=DEFAULT_CV_FOLDS,
+                        help=f'교차 검증 fold 수 (기본값: {DEFAULT_CV_FOLDS})')
+    parser.add_argument('--alphas', type=float, nargs='+', help='정규화 강도 후보 (기본값: 모델별 로그 간격 20개)')
+    parser.add_argument('--l1-ratios', type=float, nargs='+', default=list(DEFAULT_L1_RATIOS),
+                        help='elasticnet L1 비율 후보 (기본값: 0.1 0.5 0.9)')
+    parser.add_argument('--targets', type=str, nargs='+', default=['coord1D'],
+                        help='종속 변수로 사용할 정치적 위치 열 (기본값: coord1D, 예: coord1D coord2D)')
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help='교차 검증/부트스트랩 병렬 프로세스 수 (기본값: -1, 모든 코어)')
+    parser.add_argument('--bootstrap', type=int, default=0,
+                        help='신뢰 구간(ci_low, ci_high) 계산을 위한 부트스트랩 반복 횟수 (기본값: 0, 계산하지 않음)')
+    parser.add_argument('--confidence', type=float, default=0.95, help='신뢰 수준 (기본값: 0.95)')
+    parser.add_argument('--seed', type=int, default=0, help='부트스트랩 난수 시드 (기본값: 0)')
+    parser.add_argument('--artifact', type=str,
+                        help='편향 점수를 메모리 맵으로 읽을 수 있는 바이너리 파일로도 저장할 경로 (예: word_political_bias.bin)')
+    parser.add_argument('--model-file', type=str, help='학습한 모델을 저장할 파일 경로')
+    parser.add_argument('--cv-results', type=str, help='교차 검증 결과를 저장할 CSV 파일 경로')
+    parser.add_argument('--window-size', type=int,
+                        help='기간 구간별 학습: 한 구간에 포함할 연속된 기간 수 (word_frequency_analyzer.py --by-period 필요)')
+    parser.add_argument('--window-step', type=int, default=1,
+                        help='다음 구간까지 이동할 기간 수 (기본값: 1, 구간 크기보다 작으면 구간이 겹침)')
+    parser.add_argument('--window-output', type=str, default='word_political_bias_windows.csv',
+                        help='구간별 결과를 저장할 CSV 파일 경로 (기본값: word_political_bias_windows.csv)')
     args = parser.parse_args()
     
+    if args.bootstrap < 0:
+        parser.error(f"--bootstrap은 0 이상이어야 합니다: {args.bootstrap}")
+    
+    if args.window_size:
+        # 구간별 학습은 구간마다 모델을 따로 학습하므로 전체 학습용 옵션은 지원하지 않음
+        unsupported = [option for option, value in (('--bootstrap', args.bootstrap), ('--artifact', args.artifact),
+                                                    ('--model-file', args.model_file), ('--cv-results', args.cv_results))
+                       if value]
+        if unsupported:
+            parser.error(f"--window-size와 함께 사용할 수 없는 옵션입니다: {', '.join(unsupported)}")
+    
     analyzer = WordPoliticalBiasAnalyzer(args.wnominate)
     
     try:
-        analyzer.analyze_word_political_bias(min_word_count=args.min_count, output_file=args.output)
+        if args.window_size:
+            analyzer.analyze_windowed_word_political_bias(window_size=args.window_size, window_step=args.window_step,
+                                                          min_word_count=args.min_count, output_file=args.window_output,
+                                                          model=args.model, cv_folds=args.cv_folds, alphas=args.alphas,
+                                                          l1_ratios=args.l1_ratios, n_jobs=args.n_jobs,
+                                                          targets=args.targets)
+        else:
+            analyzer.analyze_word_political_bias(min_word_count=args.min_count, output_file=args.output,
+                                                 model=args.model, cv_folds=args.cv_folds, alphas=args.alphas,
+                                                 l1_ratios=args.l1_ratios, n_jobs=args.n_jobs,
+                                                 model_file=args.model_file, cv_results_file=args.cv_results,
+                                                 bootstrap=args.bootstrap, confidence=args.confidence, seed=args.seed,
+                                                 targets=args.targets, artifact_file=args.artifact)
     finally:
         analyzer.close()
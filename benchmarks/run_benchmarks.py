@@ -0,0 +1,425 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# 저장소 최상위 디렉토리
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+# 측정 단계 (실행 순서)
+STAGES = ['ingest', 'clean', 'filter', 'tokenize', 'frequency', 'matrix', 'regression', 'scoring']
+
+# 실패해도 이후 단계를 계속 측정할 수 있는 단계 (토큰화 결과는 생성 데이터의 토큰 목록으로 대체)
+OPTIONAL_STAGES = {'tokenize'}
+
+def _count(conn, query):
+    return conn.execute(query).fetchone()[0]
+
+def _fill_pretokenized(conn, data_dir):
+    """
+    토큰화되지 않은 발언을 가상 데이터 생성 때 저장한 토큰 목록으로 채우기 (측정 시간에서 제외)
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(speeches)")]
+    if '토큰화된_발언' not in columns:
+        conn.execute("ALTER TABLE speeches ADD COLUMN 토큰화된_발언 TEXT")
+
+    remaining = {row[0] for row in conn.execute("SELECT id FROM speeches WHERE 토큰화된_발언 IS NULL")}
+    if not remaining:
+        return 0
+
+    updates = []
+    with open(os.path.join(data_dir, 'pretokenized.jsonl'), 'r', encoding='utf-8') as f:
+        # 적재 순서대로 id가 부여되므로 줄 번호가 발언 id
+        for speech_id, line in enumerate(f, 1):
+            if speech_id in remaining:
+                updates.append((line.rstrip('\n'), speech_id))
+
+    conn.executemany("UPDATE speeches SET 토큰화된_발언 = ? WHERE id = ?", updates)
+    conn.commit()
+    return len(updates)
+
+def _load_pretokenized(data_dir, limit=None):
+    with open(os.path.join(data_dir, 'pretokenized.jsonl'), 'r', encoding='utf-8') as f:
+        token_lists = []
+        for line in f:
+            token_lists.append(json.loads(line))
+            if limit and len(token_lists) >= limit:
+                break
+    return token_lists
+
+def run_stage(stage, options):
+    """
+    자식 프로세스에서 단계 하나를 실행하고 처리량 측정
+
+    데이터 준비 작업은 측정 시간에서 제외하고, 단계의 핵심 작업만 측정한다.
+
+    Returns:
+        rows(처리한 단위 수), unit(단위), seconds(측정 시간) 딕셔너리
+    """
+    from database.connection import connect
+
+    data_dir = options['data_dir']
+    wnominate_file = os.path.join(data_dir, 'wnominate_results.csv')
+
+    if stage == 'ingest':
+        from database.create_database import create_database
+        from database.create_bias_table import create_bias_table
+
+        start = time.perf_counter()
+        create_database(workers=options['workers'])
+        create_bias_table()
+        seconds = time.perf_counter() - start
+
+        conn = connect('read_only')
+        rows = _count(conn, "SELECT COUNT(*) FROM speeches")
+        conn.close()
+        return {'rows': rows, 'unit': 'speeches', 'seconds': seconds}
+
+    if stage in ('clean', 'filter'):
+        conn = connect('read_only')
+        rows = _count(conn, "SELECT COUNT(*) FROM speeches")
+        conn.close()
+
+        start = time.perf_counter()
+        if stage == 'clean':
+            from database.clean_data import clean_data
+            from database.fix_empty_member_ids import fix_empty_member_ids
+            clean_data()
+            fix_empty_member_ids()
+        else:
+            from database.filter_speeches import filter_speeches
+            filter_speeches()
+        seconds = time.perf_counter() - start
+        return {'rows': rows, 'unit': 'speeches', 'seconds': seconds}
+
+    if stage == 'tokenize':
+        from analysis.speech_tokenizer import SpeechTokenizer
+
+        tokenizer = SpeechTokenizer(cache_path=options.get('cache'))
+        try:
+            start = time.perf_counter()
+            tokenizer.process_speeches(limit=options['tokenize_limit'], workers=options['workers'])
+            seconds = time.perf_counter() - start
+        finally:
+            tokenizer.close()
+
+        conn = connect('read_only')
+        rows = _count(conn, "SELECT COUNT(*) FROM speeches WHERE 토큰화된_발언 IS NOT NULL OR 토큰_ID IS NOT NULL")
+        conn.close()
+        return {'rows': rows, 'unit': 'speeches', 'seconds': seconds}
+
+    if stage == 'frequency':
+        from analysis.word_frequency_analyzer import WordFrequencyAnalyzer
+
+        conn = connect('bulk')
+        filled = _fill_pretokenized(conn, data_dir)
+        rows = _count(conn, "SELECT COUNT(*) FROM speeches")
+        conn.close()
+
+        analyzer = WordFrequencyAnalyzer()
+        try:
+            start = time.perf_counter()
+            analyzer.analyze_member_word_frequency()
+            seconds = time.perf_counter() - start
+        finally:
+            analyzer.close()
+        return {'rows': rows, 'unit': 'speeches', 'seconds': seconds, 'pretokenized_rows': filled}
+
+    if stage in ('matrix', 'regression'):
+        from analysis.word_political_bias_analyzer import WordPoliticalBiasAnalyzer
+
+        analyzer = WordPoliticalBiasAnalyzer(wnominate_file)
+        try:
+            start = time.perf_counter()
+            word_freq_df = analyzer.load_word_frequency_data()
+            matrix, speakers, words, word_total_counts = analyzer.create_word_speaker_matrix(
+                word_freq_df, options['min_count']
+            )
+            seconds = time.perf_counter() - start
+            if stage == 'matrix':
+                return {'rows': len(word_freq_df), 'unit': 'frequency rows', 'seconds': seconds}
+
+            start = time.perf_counter()
+            word_bias = analyzer.train_regression_model(matrix, speakers, words, word_total_counts,
+                                                        model=options['model'], n_jobs=options['n_jobs'])
+            seconds = time.perf_counter() - start
+            word_bias.to_csv(options['bias_file'], index=False, encoding='utf-8-sig')
+            return {'rows': int(matrix.nnz), 'unit': 'matrix nonzeros', 'seconds': seconds}
+        finally:
+            analyzer.close()
+
+    if stage == 'scoring':
+        from analysis.bias_scorer import BiasScorer
+
+        # 형태소 분석 시간을 제외하고 점수 계산만 측정 (토큰화는 tokenize 단계에서 측정)
+        scorer = BiasScorer(options['bias_file'])
+        token_lists = _load_pretokenized(data_dir, options['scoring_docs'])
+        batch_size = options['scoring_batch_size']
+
+        start = time.perf_counter()
+        for batch_start in range(0, len(token_lists), batch_size):
+            scorer.score_token_batch(token_lists[batch_start:batch_start + batch_size], top_k=5)
+        seconds = time.perf_counter() - start
+        return {'rows': len(token_lists), 'unit': 'documents', 'seconds': seconds}
+
+    raise ValueError(f"알 수 없는 단계입니다: {stage}")
+
+def _child_env():
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])))
+
+def prepare_workdir(workdir, corpus_options, files):
+    """
+    측정용 작업 디렉토리 준비
+
+    각 단계는 저장소와 같은 상대 경로(../data/*.xlsx, analysis/korean_stopwords.txt)를 사용하므로
+    workdir/data에 가상 데이터를, workdir/work에 불용어 파일을 두고 work에서 실행한다.
+
+    Returns:
+        (실행 디렉토리, 데이터 디렉토리, 생성 정보)
+    """
+    data_dir = os.path.join(workdir, 'data')
+    run_dir = os.path.join(workdir, 'work')
+    meta_path = os.path.join(data_dir, 'corpus.json')
+
+    # 같은 설정으로 만든 가상 데이터가 있으면 다시 생성하지 않음
+    corpus_info = None
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('options') == corpus_options and meta.get('files') == files:
+            corpus_info = meta['info']
+            print("기존 가상 데이터를 사용합니다.")
+
+    if corpus_info is None:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        print(f"가상 발언 데이터 {corpus_options['rows']:,}개 생성 중...")
+
+        # 측정 프로세스가 numpy/pandas를 불러오지 않도록 생성도 별도 프로세스에서 실행
+        # (리눅스에서는 자식 프로세스의 최대 RSS가 부모 프로세스의 메모리 사용량부터 시작하기 때문)
+        command = [sys.executable, '-m', 'benchmarks.synthetic_corpus', '--output-dir', data_dir, '--files', str(files)]
+        for key, value in corpus_options.items():
+            command += [f"--{key}", str(value)]
+
+        start = time.perf_counter()
+        subprocess.run(command, env=_child_env(), check=True)
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            corpus_info = json.load(f)['info']
+        corpus_info['generate_seconds'] = round(time.perf_counter() - start, 2)
+
+    # 이전 측정의 데이터베이스와 결과는 지우고 새로 시작
+    shutil.rmtree(run_dir, ignore_errors=True)
+    os.makedirs(os.path.join(run_dir, 'analysis'))
+    os.makedirs(os.path.join(run_dir, 'logs'))
+    shutil.copy(os.path.join(REPO_ROOT, 'analysis', 'korean_stopwords.txt'), os.path.join(run_dir, 'analysis'))
+
+    return run_dir, data_dir, corpus_info
+
+def measure_stage(stage, run_dir, options):
+    """
+    단계를 별도 프로세스로 실행하여 처리 시간과 최대 메모리 사용량(RSS) 측정
+    """
+    result_path = os.path.join(run_dir, f"stage_{stage}.json")
+    log_path = os.path.join(run_dir, 'logs', f"{stage}.log")
+    env = _child_env()
+
+    command = [sys.executable, '-m', 'benchmarks.run_benchmarks', '--child-stage', stage,
+               '--child-options', json.dumps(options), '--child-result', result_path]
+
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        process = subprocess.Popen(command, cwd=run_dir, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        # wait4로 자식 프로세스(와 그 워커 프로세스)의 최대 RSS 조회
+        _, status, usage = os.wait4(process.pid, 0)
+    wall_seconds = time.perf_counter() - start
+
+    exit_code = os.waitstatus_to_exitcode(status)
+    # 리눅스의 ru_maxrss 단위는 KB, macOS는 바이트
+    peak_rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+    record = {
+        'stage': stage,
+        'status': 'ok' if exit_code == 0 else 'failed',
+        'wall_seconds': round(wall_seconds, 3),
+        'peak_rss_mb': round(peak_rss_mb, 1),
+        'log': log_path,
+    }
+
+    if exit_code == 0 and os.path.exists(result_path):
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        seconds = result.pop('seconds')
+        record.update(result)
+        record['seconds'] = round(seconds, 3)
+        record['rows_per_sec'] = round(result['rows'] / seconds, 1) if seconds > 0 else None
+    else:
+        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+            record['error'] = ''.join(f.readlines()[-5:]).strip()
+
+    return record
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(report, baseline=None):
+    """
+    단계별 측정 결과 출력 (baseline이 있으면 처리 속도 비교)
+    """
+    baseline_stages = {stage['stage']: stage for stage in baseline['stages']} if baseline else {}
+
+    print("\n=== 단계별 측정 결과 ===")
+    print(f"{'단계':<12}{'상태':<8}{'처리량':>14}{'초당 처리':>14}{'시간(초)':>10}{'최대 RSS(MB)':>14}")
+    for stage in report['stages']:
+        rows = f"{stage['rows']:,}" if 'rows' in stage else '-'
+        rate = f"{stage['rows_per_sec']:,.1f}" if stage.get('rows_per_sec') else '-'
+        seconds = f"{stage['seconds']:.2f}" if 'seconds' in stage else '-'
+        line = f"{stage['stage']:<12}{stage['status']:<8}{rows:>14}{rate:>14}{seconds:>10}{stage['peak_rss_mb']:>14.1f}"
+
+        previous = baseline_stages.get(stage['stage'])
+        if previous and previous.get('rows_per_sec') and stage.get('rows_per_sec'):
+            line += f"  (기준 대비 {stage['rows_per_sec'] / previous['rows_per_sec']:.2f}배)"
+        print(line)
+
+        if stage['status'] == 'failed':
+            print(f"    오류: {stage['error'].splitlines()[-1] if stage.get('error') else '알 수 없음'}")
+
+def run_benchmarks(stages=STAGES, workdir=None, output='benchmark_report.json', rows=20000, members=300,
+                   vocabulary=8000, meetings=400, files=4, seed=0, workers=1, tokenize_limit=2000,
+                   min_count=10, model='linear', n_jobs=-1, scoring_docs=None, scoring_batch_size=256, cache=None,
+                   keep=False, baseline=None):
+    """
+    가상 데이터로 파이프라인 단계별 처리량 측정 후 JSON 보고서 저장
+
+    Returns:
+        보고서 딕셔너리
+    """
+    temporary = workdir is None
+    workdir = os.path.abspath(workdir or tempfile.mkdtemp(prefix='political_word_bias_bench_'))
+    corpus_options = {'rows': rows, 'members': members, 'vocabulary': vocabulary, 'meetings': meetings, 'seed': seed}
+
+    try:
+        run_dir, data_dir, corpus_info = prepare_workdir(workdir, corpus_options, files)
+
+        options = {
+            'data_dir': data_dir,
+            'workers': workers,
+            'tokenize_limit': tokenize_limit,
+            'min_count': min_count,
+            'model': model,
+            'n_jobs': n_jobs,
+            'scoring_docs': scoring_docs,
+            'scoring_batch_size': scoring_batch_size,
+            'bias_file': os.path.join(run_dir, 'word_political_bias_1d.csv'),
+            'cache': cache,
+        }
+
+        records = []
+        blocked = False
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            if blocked:
+                records.append({'stage': stage, 'status': 'not_run', 'peak_rss_mb': 0.0})
+                continue
+
+            print(f"[{stage}] 측정 중...")
+            record = measure_stage(stage, run_dir, options)
+            records.append(record)
+            print(f"[{stage}] {record['status']} ({record['wall_seconds']:.1f}초)")
+
+            # 앞 단계가 실패하면 이후 단계는 데이터가 없으므로 실행하지 않음
+            if record['status'] != 'ok' and stage not in OPTIONAL_STAGES:
+                blocked = True
+
+        report = {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'corpus': dict(corpus_options, **corpus_info),
+            'options': {key: value for key, value in options.items() if key not in ('data_dir', 'bias_file')},
+            'stages': records,
+        }
+
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print_report(report, baseline)
+        print(f"\n측정 결과가 {output}에 저장되었습니다.")
+        return report
+    finally:
+        if temporary and not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+        elif temporary:
+            print(f"작업 디렉토리: {workdir}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='가상 데이터를 사용한 파이프라인 단계별 성능 측정 도구')
+    parser.add_argument('--stages', type=str, nargs='+', default=STAGES, choices=STAGES, help='측정할 단계 (기본값: 전체)')
+    parser.add_argument('--workdir', type=str, help='작업 디렉토리 (지정하면 가상 데이터를 재사용, 기본값: 임시 디렉토리)')
+    parser.add_argument('--output', type=str, default='benchmark_report.json', help='측정 결과 JSON 파일 경로')
+    parser.add_argument('--baseline', type=str, help='비교할 이전 측정 결과 JSON 파일 경로')
+    parser.add_argument('--rows', type=int, default=20000, help='가상 발언 수 (기본값: 20000)')
+    parser.add_argument('--members', type=int, default=300, help='가상 의원 수 (기본값: 300)')
+    parser.add_argument('--vocabulary', type=int, default=8000, help='가상 명사 어휘 수 (기본값: 8000)')
+    parser.add_argument('--meetings', type=int, default=400, help='가상 회의 수 (기본값: 400)')
+    parser.add_argument('--files', type=int, default=4, help='엑셀 파일 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본값: 0)')
+    parser.add_argument('--workers', type=int, default=1, help='적재/토큰화 워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('--tokenize-limit', type=int, default=2000, help='형태소 분석할 발언 수 (기본값: 2000)')
+    parser.add_argument('--min-count', type=int, default=10, help='최소 단어 등장 횟수 (기본값: 10)')
+    parser.add_argument('--model', type=str, default='linear', choices=['linear', 'ridge', 'lasso', 'elasticnet'],
+                        help='regression 단계의 회귀 모델 (기본값: linear)')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='교차 검증 병렬 프로세스 수 (기본값: -1, 모든 코어)')
+    parser.add_argument('--scoring-docs', type=int, help='점수 계산할 문서 수 (기본값: 전체)')
+    parser.add_argument('--scoring-batch-size', type=int, default=256, help='점수 계산 배치 크기 (기본값: 256)')
+    parser.add_argument('--cache', type=str, help='형태소 분석 캐시 파일 경로')
+    parser.add_argument('--keep', action='store_true', help='임시 작업 디렉토리를 지우지 않음')
+    # 단계 측정용 자식 프로세스 인수 (내부용)
+    parser.add_argument('--child-stage', type=str, help=argparse.SUPPRESS)
+    parser.add_argument('--child-options', type=str, help=argparse.SUPPRESS)
+    parser.add_argument('--child-result', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_stage:
+        result = run_stage(args.child_stage, json.loads(args.child_options))
+        with open(args.child_result, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        sys.exit(0)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    run_benchmarks(
+        stages=args.stages,
+        workdir=args.workdir,
+        output=args.output,
+        rows=args.rows,
+        members=args.members,
+        vocabulary=args.vocabulary,
+        meetings=args.meetings,
+        files=args.files,
+        seed=args.seed,
+        workers=args.workers,
+        tokenize_limit=args.tokenize_limit,
+        min_count=args.min_count,
+        model=args.model,
+        n_jobs=args.n_jobs,
+        scoring_docs=args.scoring_docs,
+        scoring_batch_size=args.scoring_batch_size,
+        cache=args.cache,
+        keep=args.keep,
+        baseline=baseline,
+    )
@@ -0,0 +1,282 @@
+import argparse
+import glob
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# 발언 내용 열 목록과 열 하나에 저장할 최대 글자 수
+SPEECH_COLUMNS = ['발언내용1', '발언내용2', '발언내용3', '발언내용4', '발언내용5', '발언내용6', '발언내용7']
+CELL_LENGTH = 5000
+
+# 회의록에 자주 등장하는 명사 (나머지 어휘는 음절을 조합하여 생성)
+COMMON_NOUNS = [
+    '정부', '국민', '예산', '법안', '위원회', '정책', '경제', '안보', '북한', '일본', '대통령', '국회', '의원', '문제',
+    '질의', '답변', '자료', '부처', '지원', '사업', '지역', '기업', '노동', '환경', '교육', '복지', '부동산', '세금',
+    '검찰', '수사', '개혁', '언론', '코로나', '백신', '방역', '재난', '에너지', '원전', '탄소', '청년', '일자리', '주택',
+    '금리', '물가', '수출', '농업', '국방', '외교', '통일', '인권', '여성', '아동', '노인', '의료', '병원', '대학',
+    '장관', '총리', '감사', '조사', '보고', '계획', '제도', '개선', '대책', '피해', '안전', '사고', '조치', '결과',
+]
+
+# 동사/형용사 어간 (단어, 품사)
+PREDICATES = [
+    ('하', 'VV'), ('되', 'VV'), ('보', 'VV'), ('말씀드리', 'VV'), ('생각하', 'VV'), ('질문하', 'VV'), ('검토하', 'VV'),
+    ('추진하', 'VV'), ('지적하', 'VV'), ('요구하', 'VV'), ('있', 'VA'), ('없', 'VA'), ('필요하', 'VA'), ('중요하', 'VA'),
+    ('어렵', 'VA'), ('많', 'VA'),
+]
+
+PARTICLES = ['은', '는', '이', '가', '을', '를', '에', '의', '에서', '으로', '와', '도']
+ENDINGS = ['습니다', '고', '는데', '어서', '지만', '겠습니다', '기 때문에']
+
+SURNAMES = list('김이박최정강조윤장임한오서신권황안송류홍전고문양손배백허남심노하곽성차주우구민유진지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예경봉사부가복태목형피두감음빈동온호범좌팽승간상갈서')
+GIVEN_SYLLABLES = list('민서준지현우진영수연하은호성동재혁윤희정훈경태상석원철용선미혜숙자순옥식기환규범찬승섭')
+
+def make_vocabulary(size, rng):
+    """
+    명사 어휘 생성 (자주 쓰는 명사 + 음절 조합 명사)
+    """
+    syllables = list('가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히개내대래매배새애재채')
+    words = list(dict.fromkeys(COMMON_NOUNS))
+    seen = set(words)
+
+    while len(words) < size:
+        word = ''.join(rng.choice(syllables, size=rng.integers(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+
+    return words[:size]
+
+def make_members(count, rng):
+    """
+    중복되지 않는 의원 이름 생성
+    """
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN_SYLLABLES, size=2))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+class SyntheticCorpus:
+    """
+    speeches 테이블과 같은 형식의 가상 국회 발언 데이터 생성 클래스
+
+    - 발언 길이는 실제 회의록처럼 로그 정규 분포(짧은 발언이 대부분이고 아주 긴 발언이 일부 있음)를 따른다.
+    - 단어 빈도는 Zipf 분포를 따르고, 일부 단어는 의원의 정치적 위치(coord1D)에 따라 사용 빈도가 달라진다.
+    - 발언자 이름에는 직함("XXX 위원", "국무총리 XXX")이 붙고, 의원이 아닌 발언자와 의원ID가 공백인 행이 섞여 있어
+      정제/필터링 단계도 실제와 비슷한 양의 작업을 한다.
+    - 형태소 분석기 없이도 이후 단계를 측정할 수 있도록 생성에 사용한 (단어, 품사) 목록을 함께 저장한다.
+    """
+
+    def __init__(self, rows=20000, members=300, vocabulary=8000, meetings=400, seed=0,
+                 mean_log_words=4.0, sigma_log_words=1.1, max_words=4000):
+        """
+        초기화 함수
+
+        Args:
+            rows: 발언 수
+            members: 의원 수
+            vocabulary: 명사 어휘 수
+            meetings: 회의 수
+            seed: 난수 시드 (같은 시드면 같은 데이터)
+            mean_log_words, sigma_log_words: 발언당 어절 수의 로그 정규 분포 인자
+            max_words: 발언당 최대 어절 수
+        """
+        self.rows = rows
+        self.meetings = meetings
+        self.mean_log_words = mean_log_words
+        self.sigma_log_words = sigma_log_words
+        self.max_words = max_words
+        self.rng = np.random.default_rng(seed)
+
+        self.nouns = make_vocabulary(vocabulary, self.rng)
+        names = make_members(members + max(10, members // 5), self.rng)
+        self.members = names[:members]
+        self.non_members = names[members:]
+        self.member_ids = {name: f"{9770000 + idx}" for idx, name in enumerate(names)}
+
+        # 의원별 정치적 위치와 정당
+        self.positions = np.clip(self.rng.normal(0, 0.55, size=members), -1, 1)
+        self.coord2d = np.clip(self.rng.normal(0, 0.4, size=members), -1, 1)
+
+        # Zipf 분포 단어 빈도 + 일부 단어(20%)는 정치적 위치에 따라 빈도가 달라짐
+        base = 1.0 / np.arange(1, vocabulary + 1) ** 1.05
+        slant = np.where(self.rng.random(vocabulary) < 0.2, self.rng.normal(0, 1.5, size=vocabulary), 0.0)
+        weights = base[None, :] * np.exp(self.positions[:, None] * slant[None, :])
+        # 누적 분포로 저장하여 발언마다 searchsorted로 빠르게 표본 추출
+        self.member_word_cdf = np.cumsum(weights / weights.sum(axis=1, keepdims=True), axis=1)
+        self.non_member_word_cdf = np.cumsum(base / base.sum())
+
+    def _speaker(self):
+        """
+        발언자 이름, 의원ID, 의원 번호 (의원이 아니면 None)
+        """
+        if self.rng.random() < 0.85:
+            member_idx = int(self.rng.integers(len(self.members)))
+            name = self.members[member_idx]
+            r = self.rng.random()
+            if r < 0.4:
+                speaker = name
+            elif r < 0.8:
+                speaker = f"{name} 위원"
+            elif r < 0.9:
+                speaker = f"{name} 위원장"
+            else:
+                speaker = f"{name} 의원"
+        else:
+            member_idx = None
+            name = self.non_members[int(self.rng.integers(len(self.non_members)))]
+            speaker = self.rng.choice([f"{name} 장관", f"국방부장관 {name}", f"국무총리 {name}", f"{name} 청장"])
+
+        r = self.rng.random()
+        if r < 0.03:
+            member_id = ' '
+        elif r < 0.04:
+            member_id = ''
+        else:
+            member_id = self.member_ids[name]
+
+        return speaker, member_id, member_idx
+
+    def _speech(self, member_idx):
+        """
+        발언 텍스트와 생성에 사용한 (단어, 품사) 목록
+        """
+        word_count = int(min(self.max_words, max(1, self.rng.lognormal(self.mean_log_words, self.sigma_log_words))))
+        cdf = self.member_word_cdf[member_idx] if member_idx is not None else self.non_member_word_cdf
+
+        noun_ids = np.minimum(np.searchsorted(cdf, self.rng.random(word_count)), len(self.nouns) - 1)
+        is_predicate = self.rng.random(word_count) < 0.3
+        predicate_ids = self.rng.integers(len(PREDICATES), size=word_count)
+        particle_ids = self.rng.integers(len(PARTICLES), size=word_count)
+        ending_ids = self.rng.integers(len(ENDINGS), size=word_count)
+        sentence_end = self.rng.random(word_count) < 0.12
+
+        pieces = []
+        tokens = []
+        for i in range(word_count):
+            if is_predicate[i]:
+                stem, tag = PREDICATES[predicate_ids[i]]
+                pieces.append(stem + ('습니다.' if sentence_end[i] else ENDINGS[ending_ids[i]]))
+            else:
+                word, tag = self.nouns[noun_ids[i]], 'NNG'
+                pieces.append(word + PARTICLES[particle_ids[i]])
+            tokens.append((stem if is_predicate[i] else word, tag))
+
+        return ' '.join(pieces), tokens
+
+    def iter_rows(self):
+        """
+        (speeches 행 딕셔너리, (단어, 품사) 목록)을 발언 순서대로 생성
+        """
+        # 회의번호는 발언 순서에 따라 증가
+        meeting_bounds = np.sort(self.rng.integers(0, self.rows, size=self.meetings - 1))
+
+        for row_idx in range(self.rows):
+            speaker, member_id, member_idx = self._speaker()
+            text, tokens = self._speech(member_idx)
+
+            row = {
+                '회의번호': str(int(np.searchsorted(meeting_bounds, row_idx, side='right')) + 1),
+                '의원ID': member_id,
+                '발언자': speaker,
+            }
+            for col_idx, column in enumerate(SPEECH_COLUMNS):
+                cell = text[col_idx * CELL_LENGTH:(col_idx + 1) * CELL_LENGTH]
+                row[column] = cell or None
+
+            yield row, tokens
+
+    def write(self, data_dir, files=4):
+        """
+        엑셀 파일(../data/*.xlsx 형식), 의원 정치적 위치 CSV, 토큰 목록 JSONL 저장
+
+        실제 회의록 데이터를 덮어쓰지 않도록 엑셀 파일이나 정치적 위치 CSV가 이미 있는 디렉토리에는 저장하지 않는다.
+
+        Args:
+            data_dir: 저장할 디렉토리 (비어 있거나 없는 디렉토리)
+            files: 나누어 저장할 엑셀 파일 수
+
+        Returns:
+            생성 정보 딕셔너리
+        """
+        from openpyxl import Workbook
+
+        existing = glob.glob(os.path.join(data_dir, '*.xlsx')) + glob.glob(os.path.join(data_dir, 'wnominate_results.csv'))
+        if existing:
+            raise FileExistsError(f"{data_dir}에 이미 데이터 파일이 있습니다 ({os.path.basename(existing[0])} 등). "
+                                  "가상 데이터는 비어 있는 별도 디렉토리에 저장하세요.")
+
+        os.makedirs(data_dir, exist_ok=True)
+        columns = ['회의번호', '의원ID', '발언자'] + SPEECH_COLUMNS
+        rows_per_file = -(-self.rows // files)
+
+        workbook = None
+        sheet = None
+        file_idx = 0
+        total_chars = 0
+
+        with open(os.path.join(data_dir, 'pretokenized.jsonl'), 'w', encoding='utf-8') as token_file:
+            for row_idx, (row, tokens) in enumerate(self.iter_rows()):
+                if row_idx % rows_per_file == 0:
+                    if workbook is not None:
+                        workbook.save(os.path.join(data_dir, f"speeches_{file_idx:02d}.xlsx"))
+                        file_idx += 1
+                    # 대용량 저장을 위해 쓰기 전용 모드 사용
+                    workbook = Workbook(write_only=True)
+                    sheet = workbook.create_sheet()
+                    sheet.append(columns)
+
+                sheet.append([row[column] for column in columns])
+                token_file.write(json.dumps(tokens, ensure_ascii=False) + '\n')
+                total_chars += sum(len(row[column]) for column in SPEECH_COLUMNS if row[column])
+
+            if workbook is not None:
+                workbook.save(os.path.join(data_dir, f"speeches_{file_idx:02d}.xlsx"))
+
+        pd.DataFrame({
+            'party': np.where(self.positions > 0, '국민의힘', '더불어민주당'),
+            'name': self.members,
+            'coord1D': self.positions,
+            'coord2D': self.coord2d,
+        }).to_csv(os.path.join(data_dir, 'wnominate_results.csv'), index=False)
+
+        return {
+            'rows': self.rows,
+            'members': len(self.members),
+            'vocabulary': len(self.nouns),
+            'meetings': self.meetings,
+            'files': file_idx + 1,
+            'total_chars': total_chars,
+            'avg_chars': round(total_chars / max(1, self.rows), 1),
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='가상 국회 발언 데이터 생성 도구')
+    parser.add_argument('--output-dir', type=str, required=True,
+                        help='저장할 디렉토리 (비어 있는 벤치마크 전용 디렉토리, 실제 데이터 디렉토리 ../data는 사용하지 않음)')
+    parser.add_argument('--rows', type=int, default=20000, help='발언 수 (기본값: 20000)')
+    parser.add_argument('--members', type=int, default=300, help='의원 수 (기본값: 300)')
+    parser.add_argument('--vocabulary', type=int, default=8000, help='명사 어휘 수 (기본값: 8000)')
+    parser.add_argument('--meetings', type=int, default=400, help='회의 수 (기본값: 400)')
+    parser.add_argument('--files', type=int, default=4, help='엑셀 파일 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본값: 0)')
+    args = parser.parse_args()
+
+    corpus = SyntheticCorpus(rows=args.rows, members=args.members, vocabulary=args.vocabulary,
+                             meetings=args.meetings, seed=args.seed)
+    try:
+        info = corpus.write(args.output_dir, files=args.files)
+    except FileExistsError as e:
+        parser.error(str(e))
+
+    # 같은 설정으로 다시 생성하지 않도록 생성 정보 저장
+    options = {'rows': args.rows, 'members': args.members, 'vocabulary': args.vocabulary,
+               'meetings': args.meetings, 'seed': args.seed}
+    with open(os.path.join(args.output_dir, 'corpus.json'), 'w', encoding='utf-8') as f:
+        json.dump({'options': options, 'files': args.files, 'info': info}, f, ensure_ascii=False, indent=2)
+
+    print(f"가상 발언 {info['rows']:,}개를 {info['files']}개 파일로 저장했습니다. (발언당 평균 {info['avg_chars']:,}자)")
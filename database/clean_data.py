@@ -1,7 +1,48 @@
 import sqlite3
 import pandas as pd
 import re
-from database import DATABASE_NAME
+from database.connection import connect
+from instrumentation import METRICS, timer
+
+# 발언자 이름 정제 규칙 (규칙 이름, 정규식) - 위에서부터 순서대로 적용하여 처음 일치한 규칙 사용
+# 직함이 뒤에 붙는 경우("XXX 위원")는 첫 직함 앞부분, 앞에 붙는 경우("국무총리 XXX")는 직함 뒤 부분을 이름으로 사용
+SPEAKER_NAME_RULES = [
+    ('패턴 1: XXX 위원', re.compile(r'^(.*?) 위원', re.DOTALL)),
+    ('패턴 2: XXX 위원장', re.compile(r'^(.*?) 위원장', re.DOTALL)),
+    ('패턴 3: XXX 의원', re.compile(r'^(.*?) 의원', re.DOTALL)),
+    ('패턴 4: XXX 장관', re.compile(r'^(.*?) 장관', re.DOTALL)),
+    ('패턴 5: 국방부장관 XXX', re.compile(r'장관 (.*?)(?:장관 |\Z)', re.DOTALL)),
+    ('패턴 6: 부총리겸기획재정부장관 XXX', re.compile(r'부총리겸기획재정부장관 (.*?)(?:부총리겸기획재정부장관 |\Z)', re.DOTALL)),
+    ('패턴 7: 국무총리 XXX', re.compile(r'국무총리 (.*?)(?:국무총리 |\Z)', re.DOTALL)),
+    ('패턴 8: XXX 부총리', re.compile(r'^(.*?) 부총리', re.DOTALL)),
+    ('패턴 9: XXX 청장', re.compile(r'^(.*?) 청장', re.DOTALL)),
+    ('패턴 10: XXX 처장', re.compile(r'^(.*?) 처장', re.DOTALL)),
+    ('패턴 11: XXX 실장', re.compile(r'^(.*?) 실장', re.DOTALL)),
+    ('패턴 12: XXX 국장', re.compile(r'^(.*?) 국장', re.DOTALL)),
+]
+
+def normalize_speaker_name(speaker, member_names):
+    """
+    발언자 이름에서 직함을 제거하여 의원 이름으로 변환
+
+    Args:
+        speaker: 발언자 이름
+        member_names: 의원 이름 집합
+
+    Returns:
+        (정제된 이름, 적용된 규칙 이름), 이미 의원 이름이거나 일치하는 규칙이 없으면 (None, None)
+    """
+    if not isinstance(speaker, str) or speaker in member_names:
+        return None, None
+
+    for rule, pattern in SPEAKER_NAME_RULES:
+        match = pattern.search(speaker)
+        if match:
+            clean_name = match.group(1).strip()
+            if clean_name in member_names:
+                return clean_name, rule
+
+    return None, None
 
 def clean_data():
     """
@@ -12,7 +53,7 @@ def clean_data():
     print("데이터베이스 정제 작업을 시작합니다...")
     
     # 데이터베이스 연결
-    conn = sqlite3.connect(DATABASE_NAME)
+    conn = connect('bulk')
     cursor = conn.cursor()
     
     # 1. 현재 데이터 상태 확인
@@ -27,8 +68,10 @@ def clean_data():
     
     # 3. 의원ID가 없는 행 제거
     if empty_id_count > 0:
-        cursor.execute("DELETE FROM speeches WHERE 의원ID IS NULL OR 의원ID = ''")
-        conn.commit()
+        with timer('sql.delete_empty_member_ids'):
+            cursor.execute("DELETE FROM speeches WHERE 의원ID IS NULL OR 의원ID = ''")
+        with timer('sql.commit'):
+            conn.commit()
         print(f"의원ID가 없는 {empty_id_count:,}개 행을 제거했습니다.")
     
     # 4. 제거 후 데이터 상태 확인
@@ -41,131 +84,69 @@ def clean_data():
     
     # 6. member_bias 테이블에서 의원 이름 가져오기
     query = "SELECT name FROM member_bias"
-    member_names = pd.read_sql_query(query, conn)['name'].tolist()
+    member_names = set(pd.read_sql_query(query, conn)['name'].tolist())
     print(f"member_bias 테이블에서 {len(member_names)}명의 의원 이름을 가져왔습니다.")
     
-    # 7. speeches 테이블에서 고유한 발언자 이름 가져오기
-    query = "SELECT DISTINCT 발언자 FROM speeches"
-    speakers = pd.read_sql_query(query, conn)['발언자'].tolist()
-    print(f"speeches 테이블에서 {len(speakers)}명의 고유한 발언자를 찾았습니다.")
-    
-    # 8. 발언자 이름 정제 매핑 생성
-    name_mapping = {}
-    
-    for speaker in speakers:
-        if speaker in member_names:
-            # 이미 정확히 일치하는 이름은 그대로 유지
-            continue
-        
-        # 패턴 1: "XXX 위원" -> "XXX"
-        if ' 위원' in speaker:
-            clean_name = speaker.split(' 위원')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 2: "XXX 위원장" -> "XXX"
-        if ' 위원장' in speaker:
-            clean_name = speaker.split(' 위원장')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 3: "XXX 의원" -> "XXX"
-        if ' 의원' in speaker:
-            clean_name = speaker.split(' 의원')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 4: "XXX 장관" -> "XXX"
-        if ' 장관' in speaker:
-            clean_name = speaker.split(' 장관')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 5: "국방부장관 XXX" -> "XXX"
-        if '장관 ' in speaker:
-            clean_name = speaker.split('장관 ')[1].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 6: "부총리겸기획재정부장관 XXX" -> "XXX"
-        if '부총리겸기획재정부장관 ' in speaker:
-            clean_name = speaker.split('부총리겸기획재정부장관 ')[1].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 7: "국무총리 XXX" -> "XXX"
-        if '국무총리 ' in speaker:
-            clean_name = speaker.split('국무총리 ')[1].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 8: "XXX 부총리" -> "XXX"
-        if ' 부총리' in speaker:
-            clean_name = speaker.split(' 부총리')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 9: "XXX 청장" -> "XXX"
-        if ' 청장' in speaker:
-            clean_name = speaker.split(' 청장')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 10: "XXX 처장" -> "XXX"
-        if ' 처장' in speaker:
-            clean_name = speaker.split(' 처장')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 11: "XXX 실장" -> "XXX"
-        if ' 실장' in speaker:
-            clean_name = speaker.split(' 실장')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-        
-        # 패턴 12: "XXX 국장" -> "XXX"
-        if ' 국장' in speaker:
-            clean_name = speaker.split(' 국장')[0].strip()
-            if clean_name in member_names:
-                name_mapping[speaker] = clean_name
-                continue
-    
-    print(f"총 {len(name_mapping)}개의 발언자 이름이 정제되었습니다.")
-    
-    # 9. 발언자 이름 업데이트
+    # 7. speeches 테이블에서 고유한 발언자 이름과 발언 수 가져오기
+    query = "SELECT 발언자, COUNT(*) AS 발언수 FROM speeches GROUP BY 발언자"
+    speaker_counts = pd.read_sql_query(query, conn)
+    print(f"speeches 테이블에서 {len(speaker_counts)}명의 고유한 발언자를 찾았습니다.")
+    
+    # 8. 발언자 이름 정제 매핑 생성 (규칙 테이블 순서대로 적용)
+    mapping_rows = []
+    
+    for speaker, speech_count in speaker_counts.itertuples(index=False):
+        clean_name, rule = normalize_speaker_name(speaker, member_names)
+        if clean_name is not None:
+            mapping_rows.append((speaker, clean_name, rule, int(speech_count)))
+    
+    print(f"총 {len(mapping_rows)}개의 발언자 이름이 정제되었습니다.")
+    
+    # 9. 정제 매핑을 speaker_name_mapping 테이블에 저장
+    cursor.execute("DROP TABLE IF EXISTS speaker_name_mapping")
+    cursor.execute('''
+    CREATE TABLE speaker_name_mapping (
+        speaker TEXT PRIMARY KEY,
+        clean_name TEXT,
+        rule TEXT,
+        speech_count INTEGER
+    )
+    ''')
+    cursor.executemany("INSERT INTO speaker_name_mapping VALUES (?, ?, ?, ?)", mapping_rows)
+    
+    # 10. 매핑 테이블과 조인하여 한 번의 UPDATE로 발언자 이름 변경
     print("speeches 테이블 업데이트 중...")
     
-    update_count = 0
-    batch_size = 1000
-    
-    # 10. 배치 처리로 업데이트
-    for speaker, clean_name in name_mapping.items():
-        cursor.execute(
-            "UPDATE speeches SET 발언자 = ? WHERE 발언자 = ?",
-            (clean_name, speaker)
-        )
-        
-        update_count += cursor.rowcount
-        
-        if update_count % 50000 == 0:
-                conn.commit()
-                print(f"  - {update_count:,}개 행 업데이트 완료")
-    
-    # 최종 커밋
-    conn.commit()
+    with timer('sql.update_speaker_names'):
+        if sqlite3.sqlite_version_info >= (3, 33, 0):
+            cursor.execute("""
+            UPDATE speeches
+            SET 발언자 = m.clean_name
+            FROM speaker_name_mapping m
+            WHERE speeches.발언자 = m.speaker
+            """)
+        else:
+            # UPDATE ... FROM을 지원하지 않는 SQLite 버전
+            cursor.execute("""
+            UPDATE speeches
+            SET 발언자 = (SELECT m.clean_name FROM speaker_name_mapping m WHERE m.speaker = speeches.발언자)
+            WHERE 발언자 IN (SELECT speaker FROM speaker_name_mapping)
+            """)
+    update_count = cursor.rowcount
+    
+    with timer('sql.commit'):
+        conn.commit()
     print(f"총 {update_count:,}개 행이 업데이트되었습니다.")
     
+    # 적용된 규칙별 통계
+    if mapping_rows:
+        rule_stats = pd.DataFrame(mapping_rows, columns=['speaker', 'clean_name', 'rule', 'speech_count'])
+        rule_stats = rule_stats.groupby('rule', sort=False).agg(발언자수=('speaker', 'size'), 발언수=('speech_count', 'sum'))
+        print("\n=== 규칙별 정제 결과 ===")
+        for rule, row in rule_stats.iterrows():
+            print(f"{rule}: {row['발언자수']:,}명, {row['발언수']:,}개 행")
+        print("발언자별 적용 규칙은 speaker_name_mapping 테이블에서 확인할 수 있습니다.")
+    
     # 11. 정제 후 통계
     query = """
     SELECT s.발언자, COUNT(*) as 발언수, m.party
@@ -213,6 +194,7 @@ def clean_data():
     # 데이터베이스 연결 종료
     conn.close()
     print("\n데이터베이스 정제 작업이 완료되었습니다.")
+    METRICS.print_summary('정제 실행 지표')
 
 if __name__ == "__main__":
     clean_data()
@@ -0,0 +1,54 @@
+import sqlite3
+from pathlib import Path
+from database import DATABASE_NAME
+
+# 작업 유형별 SQLite 설정
+# - default: 일반 작업 (WAL 모드로 읽기와 쓰기가 서로 막지 않음)
+# - bulk: 대량 적재/갱신 작업 (큰 페이지 캐시, 메모리 매핑, 임시 테이블을 메모리에 생성)
+# - read_only: 분석/점수 계산용 읽기 전용 연결 (여러 프로세스가 동시에 읽을 수 있음)
+PRAGMA_PROFILES = {
+    'default': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+    },
+    'bulk': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -512 * 1024,      # 512MB (음수는 KB 단위)
+        'mmap_size': 2 * 1024 ** 3,     # 2GB
+        'temp_store': 'MEMORY',
+    },
+    'read_only': {
+        'cache_size': -256 * 1024,      # 256MB
+        'mmap_size': 2 * 1024 ** 3,
+        'temp_store': 'MEMORY',
+        'query_only': 'ON',
+    },
+}
+
+def connect(profile='default', path=DATABASE_NAME, timeout=60):
+    """
+    작업 유형에 맞는 설정을 적용한 SQLite 연결 생성
+
+    Args:
+        profile: 설정 이름 (default, bulk, read_only)
+        path: 데이터베이스 파일 경로
+        timeout: 다른 연결이 잠금을 해제할 때까지 기다리는 최대 시간 (초)
+
+    Returns:
+        sqlite3 연결
+    """
+    if profile not in PRAGMA_PROFILES:
+        raise ValueError(f"지원하지 않는 연결 설정입니다: {profile} (가능한 값: {', '.join(PRAGMA_PROFILES)})")
+
+    if profile == 'read_only':
+        # 파일이 없으면 새로 만들지 않고 오류가 나도록 읽기 전용 URI로 연결
+        uri = Path(path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, timeout=timeout)
+    else:
+        conn = sqlite3.connect(path, timeout=timeout)
+
+    for name, value in PRAGMA_PROFILES[profile].items():
+        conn.execute(f"PRAGMA {name}={value}")
+
+    return conn
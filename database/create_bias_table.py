@@ -1,7 +1,6 @@
-import sqlite3
 import pandas as pd
 import os
-from database import DATABASE_NAME
+from database.connection import connect
 
 def create_bias_table():
     """
@@ -10,7 +9,7 @@ def create_bias_table():
     print("의원 편향 정보 테이블 생성을 시작합니다...")
     
     # 데이터베이스 연결
-    conn = sqlite3.connect(DATABASE_NAME)
+    conn = connect()
     cursor = conn.cursor()
     
     # 기존 테이블이 있으면 삭제
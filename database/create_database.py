@@ -1,21 +1,198 @@
-import sqlite3
-import pandas as pd
 import os
 import glob
-from database import DATABASE_NAME
+import argparse
+import multiprocessing
+from database.connection import connect
+from instrumentation import METRICS, Progress, configure, timer
 
-def create_database():
+# speeches 테이블에 저장하는 원본 열 목록
+SPEECH_COLUMNS = ['회의번호', '의원ID', '발언자', '발언내용1', '발언내용2', '발언내용3',
+                  '발언내용4', '발언내용5', '발언내용6', '발언내용7']
+
+INSERT_QUERY = f"INSERT INTO speeches ({', '.join(SPEECH_COLUMNS)}) VALUES ({', '.join('?' * len(SPEECH_COLUMNS))})"
+
+# 워커 프로세스의 파일별 결과 큐 (워커 초기화 시 설정)
+_worker_queues = None
+
+def _snapshot_value(value):
+    """
+    스냅샷 저장용 값 변환 (speeches 테이블 열은 모두 TEXT이므로 문자열로 저장해도 같은 값이 들어감)
+    """
+    return None if value is None else str(value)
+
+def iter_excel_rows(path, batch_size=10000):
+    """
+    엑셀 파일의 첫 번째 시트를 한 행씩 읽어 speeches 열 순서의 행 묶음으로 반환
+
+    읽기 전용 모드로 열어 시트 전체를 메모리에 올리지 않는다.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        # 테이블에 있는 열만 위치를 찾아 선택 (없는 열은 NULL)
+        positions = {str(name).strip(): idx for idx, name in enumerate(header) if name is not None}
+        column_positions = [positions.get(column) for column in SPEECH_COLUMNS]
+
+        batch = []
+        for row in rows:
+            if not any(value is not None for value in row):
+                continue
+            batch.append(tuple(
+                row[idx] if idx is not None and idx < len(row) else None
+                for idx in column_positions
+            ))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        workbook.close()
+
+def iter_parquet_rows(path, batch_size=10000):
+    """
+    Parquet 스냅샷 파일을 행 묶음으로 읽기
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=SPEECH_COLUMNS):
+        columns = [record_batch.column(column).to_pylist() for column in SPEECH_COLUMNS]
+        yield list(zip(*columns))
+
+class SnapshotWriter:
+    """
+    읽은 원본 데이터를 파일별 Parquet 스냅샷으로 저장하는 클래스 (다음 적재 때 엑셀 파싱을 생략하기 위함)
+    """
+
+    def __init__(self, snapshot_dir, source_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.schema = pa.schema([(column, pa.string()) for column in SPEECH_COLUMNS])
+        self.path = os.path.join(snapshot_dir, os.path.splitext(os.path.basename(source_path))[0] + '.parquet')
+        # 작성이 끝난 뒤에 이름을 바꿔 중간에 실패한 스냅샷이 남지 않도록 함
+        self.temp_path = self.path + '.tmp'
+        self.writer = pq.ParquetWriter(self.temp_path, self.schema)
+
+    def write(self, batch):
+        columns = list(zip(*batch))
+        self.writer.write_table(self.pa.table(
+            [self.pa.array([_snapshot_value(value) for value in values], type=self.pa.string()) for values in columns],
+            schema=self.schema
+        ))
+
+    def close(self):
+        self.writer.close()
+        os.replace(self.temp_path, self.path)
+
+def iter_file_rows(path, batch_size=10000, snapshot_dir=None):
+    """
+    엑셀 또는 Parquet 파일을 행 묶음으로 읽기 (snapshot_dir이 있으면 엑셀 내용을 스냅샷으로도 저장)
+    """
+    if path.endswith('.parquet'):
+        yield from iter_parquet_rows(path, batch_size)
+        return
+
+    snapshot = SnapshotWriter(snapshot_dir, path) if snapshot_dir else None
+    for batch in iter_excel_rows(path, batch_size):
+        if snapshot:
+            snapshot.write(batch)
+        yield batch
+    if snapshot:
+        snapshot.close()
+
+def _init_reader_worker(queues):
+    """
+    파일 읽기 워커 초기화 (파일별 결과 큐 설정)
+    """
+    global _worker_queues
+    _worker_queues = queues
+
+def _read_file(file_idx, path, batch_size, snapshot_dir):
+    """
+    워커 프로세스에서 파일 하나를 읽어 행 묶음을 해당 파일의 큐로 전달
+
+    큐의 크기가 제한되어 있으므로 기록이 늦어지면 읽기도 멈춰 메모리 사용량이 일정하게 유지된다.
+    """
+    queue = _worker_queues[file_idx]
+    try:
+        for batch in iter_file_rows(path, batch_size, snapshot_dir):
+            queue.put(('rows', batch))
+        queue.put(('done', None))
+    except Exception as e:
+        queue.put(('error', f"{type(e).__name__}: {e}"))
+
+def _iter_parallel_batches(files, workers, batch_size, snapshot_dir, queue_size=4):
+    """
+    여러 파일을 워커 프로세스에서 동시에 읽고, 파일 순서대로 (파일 번호, 행 묶음) 반환
+
+    파일마다 별도의 큐를 두어 병렬로 읽어도 데이터베이스에는 순차 처리와 같은 순서로 기록된다.
+    """
+    context = multiprocessing.get_context('spawn')
+    queues = [context.Queue(maxsize=queue_size) for _ in files]
+    pool = context.Pool(workers, initializer=_init_reader_worker, initargs=(queues,))
+
+    try:
+        for file_idx, path in enumerate(files):
+            pool.apply_async(_read_file, (file_idx, path, batch_size, snapshot_dir))
+        pool.close()
+
+        for file_idx, path in enumerate(files):
+            while True:
+                kind, payload = queues[file_idx].get()
+                if kind == 'done':
+                    break
+                if kind == 'error':
+                    raise RuntimeError(f"{os.path.basename(path)} 파일을 읽는 중 오류가 발생했습니다: {payload}")
+                yield file_idx, payload
+
+        pool.join()
+    finally:
+        pool.terminate()
+
+def create_database(workers=1, batch_size=10000, snapshot_dir=None, from_snapshot=None):
     """
     엑셀 파일에서 데이터를 읽어 SQLite 데이터베이스를 생성하는 함수
+
+    엑셀 파일은 읽기 전용 모드로 한 행씩 읽고(workers > 1이면 파일별로 병렬 처리),
+    하나의 연결에서 큰 묶음 단위 executemany로 삽입한 뒤 인덱스는 적재가 끝난 후에 생성한다.
+
+    Args:
+        workers: 파일 읽기 워커 프로세스 수
+        batch_size: 한 번에 삽입할 행 수
+        snapshot_dir: 읽은 원본 데이터를 Parquet 스냅샷으로 저장할 디렉토리
+        from_snapshot: 엑셀 대신 Parquet 스냅샷을 읽을 디렉토리
     """
     print("데이터베이스 생성을 시작합니다...")
-    
+
+    # 원본 파일 목록 가져오기 (항상 같은 순서로 적재되도록 정렬)
+    if from_snapshot:
+        source_files = sorted(glob.glob(os.path.join(from_snapshot, '*.parquet')))
+        snapshot_dir = None
+    else:
+        source_files = sorted(glob.glob('../data/*.xlsx'))
+
+    if not source_files:
+        print("데이터 폴더에 엑셀 파일이 없습니다." if not from_snapshot else f"{from_snapshot} 폴더에 스냅샷 파일이 없습니다.")
+        return
+
+    if snapshot_dir:
+        os.makedirs(snapshot_dir, exist_ok=True)
+
     # 데이터베이스 연결
-    conn = sqlite3.connect(DATABASE_NAME)
-    
+    conn = connect('bulk')
+
     # 기존 테이블이 있으면 삭제
     conn.execute("DROP TABLE IF EXISTS speeches")
-    
+
     # 새 테이블 생성
     conn.execute('''
     CREATE TABLE speeches (
@@ -32,49 +209,70 @@ def create_database():
         발언내용7 TEXT
     )
     ''')
-    
-    # 인덱스 생성
-    conn.execute('CREATE INDEX idx_member_id ON speeches(의원ID)')
-    conn.execute('CREATE INDEX idx_speaker ON speeches(발언자)')
-    
-    # 엑셀 파일 목록 가져오기
-    excel_files = glob.glob('../data/*.xlsx')
-    
-    if not excel_files:
-        print("데이터 폴더에 엑셀 파일이 없습니다.")
+
+    if workers > 1 and len(source_files) > 1:
+        batches = _iter_parallel_batches(source_files, min(workers, len(source_files)), batch_size, snapshot_dir)
+    else:
+        batches = (
+            (file_idx, batch)
+            for file_idx, path in enumerate(source_files)
+            for batch in iter_file_rows(path, batch_size, snapshot_dir)
+        )
+
+    file_rows = [0] * len(source_files)
+    current_file = None
+    progress = Progress('ingest.rows', label='발언 적재', unit='행')
+
+    try:
+        # 각 파일의 행 묶음을 하나의 연결에서 순서대로 삽입
+        for file_idx, batch in batches:
+            if file_idx != current_file:
+                if current_file is not None:
+                    print(f"  - {file_rows[current_file]:,}개 행 추가됨")
+                current_file = file_idx
+                print(f"{os.path.basename(source_files[file_idx])} 파일 처리 중...")
+
+            with timer('sql.insert_speeches'):
+                conn.executemany(INSERT_QUERY, batch)
+            file_rows[file_idx] += len(batch)
+            progress.update(len(batch))
+
+        if current_file is not None:
+            print(f"  - {file_rows[current_file]:,}개 행 추가됨")
+
+        # 적재가 끝난 후 인덱스 생성
+        print("인덱스 생성 중...")
+        with timer('sql.create_speech_indexes'):
+            conn.execute('CREATE INDEX idx_member_id ON speeches(의원ID)')
+            conn.execute('CREATE INDEX idx_speaker ON speeches(발언자)')
+
+        with timer('sql.commit'):
+            conn.commit()
+    finally:
+        # 데이터베이스 연결 종료
         conn.close()
-        return
-    
-    total_rows = 0
-    
-    # 각 엑셀 파일 처리
-    for file in excel_files:
-        print(f"{os.path.basename(file)} 파일 처리 중...")
-        
-        # 엑셀 파일 읽기
-        df = pd.read_excel(file)
-        
-        # 필요한 열만 선택
-        if '발언내용8' in df.columns:
-            cols = ['회의번호', '의원ID', '발언자', '발언내용1', '발언내용2', '발언내용3', 
-                    '발언내용4', '발언내용5', '발언내용6', '발언내용7']
-        else:
-            cols = df.columns
-        
-        df = df[cols]
-        
-        # 데이터베이스에 삽입
-        df.to_sql('speeches', conn, if_exists='append', index=False)
-        
-        total_rows += len(df)
-        print(f"  - {len(df):,}개 행 추가됨")
-    
-    # 데이터베이스 연결 종료
-    conn.commit()
-    conn.close()
-    
-    print(f"\n총 {total_rows:,}개 행이 데이터베이스에 추가되었습니다.")
+
+    progress.close()
+    print(f"\n총 {progress.done:,}개 행이 데이터베이스에 추가되었습니다.")
+    if snapshot_dir:
+        print(f"원본 데이터 스냅샷을 {snapshot_dir} 폴더에 저장했습니다.")
     print("데이터베이스 생성이 완료되었습니다.")
+    METRICS.print_summary('적재 실행 지표')
 
 if __name__ == "__main__":
-    create_database()
+    parser = argparse.ArgumentParser(description='국회 회의록 엑셀 파일로 SQLite 데이터베이스 생성')
+    parser.add_argument('--workers', type=int, default=1, help='파일 읽기 워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('--batch-size', type=int, default=10000, help='한 번에 삽입할 행 수 (기본값: 10000)')
+    parser.add_argument('--snapshot', type=str, help='읽은 원본 데이터를 Parquet 스냅샷으로 저장할 디렉토리')
+    parser.add_argument('--from-snapshot', type=str, help='엑셀 대신 Parquet 스냅샷을 읽을 디렉토리')
+    parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 실행 지표를 기록할 JSON Lines 파일 경로')
+    parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
+    args = parser.parse_args()
+    configure(args.metrics_jsonl, args.metrics_prom)
+
+    create_database(
+        workers=args.workers,
+        batch_size=args.batch_size,
+        snapshot_dir=args.snapshot,
+        from_snapshot=args.from_snapshot,
+    )
@@ -1,6 +1,6 @@
-import sqlite3
 import pandas as pd
-from database import DATABASE_NAME
+from database.connection import connect
+from instrumentation import METRICS, timer
 
 def filter_speeches():
     """
@@ -10,7 +10,7 @@ def filter_speeches():
     print("speeches 테이블 필터링 작업을 시작합니다...")
     
     # 데이터베이스 연결
-    conn = sqlite3.connect(DATABASE_NAME)
+    conn = connect('bulk')
     cursor = conn.cursor()
     
     # 1. 현재 데이터 상태 확인
@@ -47,11 +47,13 @@ def filter_speeches():
     print(f"\n매칭되지 않는 행 수: {non_matching_count:,}개 (삭제 예정)")
     
     # 5. 매칭되지 않는 행 삭제
-    cursor.execute("""
-    DELETE FROM speeches 
-    WHERE 발언자 NOT IN (SELECT name FROM member_bias)
-    """)
-    conn.commit()
+    with timer('sql.delete_unmatched_speeches'):
+        cursor.execute("""
+        DELETE FROM speeches 
+        WHERE 발언자 NOT IN (SELECT name FROM member_bias)
+        """)
+    with timer('sql.commit'):
+        conn.commit()
     print(f"매칭되지 않는 {non_matching_count:,}개 행을 삭제했습니다.")
     
     # 6. 필터링 후 데이터 상태 확인
@@ -88,6 +90,7 @@ def filter_speeches():
     # 데이터베이스 연결 종료
     conn.close()
     print("\nspeeches 테이블 필터링 작업이 완료되었습니다.")
+    METRICS.print_summary('필터링 실행 지표')
 
 if __name__ == "__main__":
     filter_speeches()
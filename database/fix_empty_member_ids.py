@@ -1,20 +1,37 @@
 import sqlite3
+import argparse
 import pandas as pd
 import os
 import sys
 
 # 상위 디렉토리를 모듈 검색 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from database import DATABASE_NAME
+from database.connection import connect
+from instrumentation import METRICS, configure, timer
 
-def fix_empty_member_ids():
+# 한 발언자에게 정상적인 의원ID가 여러 개 있을 때 사용할 의원ID를 고르는 기준
+CONFLICT_POLICIES = {
+    'most-frequent': 'rank_by_rows',  # 가장 많은 행에서 사용된 의원ID
+    'first': 'rank_by_first',         # 가장 먼저 등장한 행의 의원ID
+    'skip': None,                     # 수정하지 않고 공백으로 남김
+}
+
+def fix_empty_member_ids(conflict_policy='most-frequent'):
     """
     의원ID가 공백(' ')인 행들을 찾아서 해당 발언자의 다른 행에서 정상적인 의원ID를 찾아 업데이트하는 함수
+
+    발언자별 의원ID 후보를 한 번의 그룹 쿼리로 구해 임시 테이블에 저장하고, 한 번의 UPDATE로 반영한다.
+
+    Args:
+        conflict_policy: 한 발언자에게 서로 다른 의원ID가 있을 때의 처리 방식 (most-frequent, first, skip)
     """
+    if conflict_policy not in CONFLICT_POLICIES:
+        raise ValueError(f"지원하지 않는 처리 방식입니다: {conflict_policy} (가능한 값: {', '.join(CONFLICT_POLICIES)})")
+
     print("의원ID 공백 문제 수정 작업을 시작합니다...")
     
     # 데이터베이스 연결
-    conn = sqlite3.connect(DATABASE_NAME)
+    conn = connect('bulk')
     cursor = conn.cursor()
     
     # 1. 현재 데이터 상태 확인
@@ -32,42 +49,91 @@ def fix_empty_member_ids():
         conn.close()
         return
     
-    # 3. 의원ID가 공백인 행의 발언자 목록 가져오기
-    query = "SELECT DISTINCT 발언자 FROM speeches WHERE 의원ID = ' '"
-    speakers_with_empty_id = pd.read_sql_query(query, conn)['발언자'].tolist()
-    print(f"의원ID가 공백인 발언자 수: {len(speakers_with_empty_id)}명")
+    # 3. 의원ID가 공백인 발언자의 (발언자, 의원ID)별 행 수를 한 번에 집계
+    cursor.execute("DROP TABLE IF EXISTS temp.member_id_candidates")
+    with timer('sql.aggregate_member_id_candidates'):
+        cursor.execute("""
+        CREATE TEMP TABLE member_id_candidates AS
+        WITH speaker_ids AS (
+            SELECT 발언자 AS speaker, 의원ID AS member_id, COUNT(*) AS row_count, MIN(id) AS first_id
+            FROM speeches
+            WHERE 발언자 IN (SELECT 발언자 FROM speeches WHERE 의원ID = ' ')
+              AND 의원ID IS NOT NULL AND 의원ID != ''
+            GROUP BY 발언자, 의원ID
+        )
+        SELECT
+            speaker,
+            member_id,
+            row_count,
+            SUM(CASE WHEN member_id = ' ' THEN row_count ELSE 0 END) OVER (PARTITION BY speaker) AS empty_rows,
+            SUM(CASE WHEN member_id != ' ' THEN 1 ELSE 0 END) OVER (PARTITION BY speaker) AS id_count,
+            ROW_NUMBER() OVER (PARTITION BY speaker ORDER BY member_id = ' ', row_count DESC, first_id) AS rank_by_rows,
+            ROW_NUMBER() OVER (PARTITION BY speaker ORDER BY member_id = ' ', first_id) AS rank_by_first
+        FROM speaker_ids
+        """)
     
-    # 4. 각 발언자별로 정상적인 의원ID 찾기
-    update_count = 0
-    speakers_fixed = 0
+    speaker_count = cursor.execute("SELECT COUNT(DISTINCT speaker) FROM member_id_candidates").fetchone()[0]
+    print(f"의원ID가 공백인 발언자 수: {speaker_count}명")
     
-    for speaker in speakers_with_empty_id:
-        # 해당 발언자의 정상적인 의원ID 찾기
-        query = """
-        SELECT DISTINCT 의원ID 
-        FROM speeches 
-        WHERE 발언자 = ? AND 의원ID != ' ' AND 의원ID IS NOT NULL AND 의원ID != ''
-        LIMIT 1
-        """
-        result = pd.read_sql_query(query, conn, params=(speaker,))
-        
-        if not result.empty:
-            valid_member_id = result.iloc[0, 0]
-            
-            # 의원ID 업데이트
-            cursor.execute(
-                "UPDATE speeches SET 의원ID = ? WHERE 발언자 = ? AND 의원ID = ' '",
-                (valid_member_id, speaker)
-            )
-            
-            rows_updated = cursor.rowcount
-            update_count += rows_updated
-            speakers_fixed += 1
-            
-            print(f"발언자 '{speaker}': 의원ID '{valid_member_id}'로 {rows_updated:,}개 행 업데이트")
-    
-    # 5. 변경사항 저장
-    conn.commit()
+    # 4. 서로 다른 의원ID가 여러 개인 발언자 확인
+    conflicts = pd.read_sql_query("""
+    SELECT speaker, member_id, row_count
+    FROM member_id_candidates
+    WHERE id_count > 1 AND member_id != ' '
+    ORDER BY speaker, row_count DESC
+    """, conn)
+    
+    if not conflicts.empty:
+        print(f"\n=== 의원ID가 여러 개인 발언자 ({conflicts['speaker'].nunique()}명, 처리 방식: {conflict_policy}) ===")
+        for speaker, group in conflicts.groupby('speaker', sort=False):
+            # 행 수가 많은 상위 5개 의원ID만 출력
+            candidates = ', '.join(f"'{member_id}'({row_count:,}행)" for member_id, row_count in zip(group['member_id'][:5], group['row_count'][:5]))
+            if len(group) > 5:
+                candidates += f" 외 {len(group) - 5}개"
+            print(f"발언자 '{speaker}': {candidates}")
+        print()
+    
+    # 발언자별로 사용할 의원ID 선택
+    rank_column = CONFLICT_POLICIES[conflict_policy]
+    conflict_condition = "AND id_count = 1" if rank_column is None else ""
+    cursor.execute("DROP TABLE IF EXISTS temp.canonical_member_ids")
+    cursor.execute(f"""
+    CREATE TEMP TABLE canonical_member_ids AS
+    SELECT speaker, member_id, empty_rows
+    FROM member_id_candidates
+    WHERE member_id != ' ' AND {rank_column or 'rank_by_rows'} = 1 {conflict_condition}
+    """)
+    cursor.execute("CREATE UNIQUE INDEX temp.idx_canonical_speaker ON canonical_member_ids(speaker)")
+    
+    fixed = pd.read_sql_query(
+        "SELECT speaker, member_id, empty_rows FROM canonical_member_ids ORDER BY empty_rows DESC, speaker", conn
+    )
+    for speaker, member_id, rows_updated in fixed.itertuples(index=False):
+        print(f"발언자 '{speaker}': 의원ID '{member_id}'로 {rows_updated:,}개 행 업데이트")
+    
+    # 5. 한 번의 UPDATE로 의원ID 반영
+    with timer('sql.update_member_ids'):
+        if sqlite3.sqlite_version_info >= (3, 33, 0):
+            cursor.execute("""
+            UPDATE speeches
+            SET 의원ID = c.member_id
+            FROM canonical_member_ids c
+            WHERE speeches.발언자 = c.speaker AND speeches.의원ID = ' '
+            """)
+        else:
+            # UPDATE ... FROM을 지원하지 않는 SQLite 버전
+            cursor.execute("""
+            UPDATE speeches
+            SET 의원ID = (SELECT c.member_id FROM canonical_member_ids c WHERE c.speaker = speeches.발언자)
+            WHERE 의원ID = ' ' AND 발언자 IN (SELECT speaker FROM canonical_member_ids)
+            """)
+    
+    update_count = cursor.rowcount
+    speakers_fixed = len(fixed)
+    
+    # 변경사항 저장
+    with timer('sql.commit'):
+        conn.commit()
     
     # 6. 업데이트 후 상태 확인
     query = "SELECT COUNT(*) FROM speeches WHERE 의원ID = ' '"
@@ -95,6 +161,15 @@ def fix_empty_member_ids():
     # 데이터베이스 연결 종료
     conn.close()
     print("\n의원ID 공백 문제 수정 작업이 완료되었습니다.")
+    METRICS.print_summary('의원ID 수정 실행 지표')
 
 if __name__ == "__main__":
-    fix_empty_member_ids()
+    parser = argparse.ArgumentParser(description='의원ID 공백 문제 수정 도구')
+    parser.add_argument('--conflict-policy', type=str, default='most-frequent', choices=list(CONFLICT_POLICIES),
+                        help='발언자에게 서로 다른 의원ID가 있을 때의 처리 방식 (기본값: most-frequent)')
+    parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 실행 지표를 기록할 JSON Lines 파일 경로')
+    parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
+    args = parser.parse_args()
+    configure(args.metrics_jsonl, args.metrics_prom)
+
+    fix_empty_member_ids(conflict_policy=args.conflict_policy)
@@ -0,0 +1,306 @@
+import atexit
+import json
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+
+# 지표 파일 경로를 지정하는 환경 변수 (파이프라인에서 실행한 단계나 자식 프로세스에도 적용됨)
+METRICS_JSONL_ENV = 'POLITICAL_WORD_BIAS_METRICS_JSONL'
+METRICS_PROM_ENV = 'POLITICAL_WORD_BIAS_METRICS_PROM'
+
+# Prometheus 지표 이름 접두사
+PROMETHEUS_PREFIX = 'political_word_bias'
+
+class Metrics:
+    """
+    실행 시간과 처리량 지표를 모으는 클래스
+
+    - 카운터: 처리한 행 수, 캐시 적중 수 등 누적 값
+    - 타이머: 형태소 분석, JSON 변환, SQL 실행처럼 반복 호출되는 구간의 호출 수/누적 시간/최대 시간
+
+    워커 프로세스는 snapshot(reset=True)로 지금까지의 지표를 넘기고,
+    메인 프로세스는 merge()로 합쳐 전체 실행의 지표를 만든다.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.timers = {}
+
+    def count(self, name, value=1):
+        """
+        카운터 증가
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, seconds, calls=1):
+        """
+        타이머에 실행 시간 추가
+        """
+        stats = self.timers.get(name)
+        if stats is None:
+            self.timers[name] = [calls, seconds, seconds]
+        else:
+            stats[0] += calls
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+
+    @contextmanager
+    def timer(self, name):
+        """
+        with 블록의 실행 시간 측정
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time)
+
+    def snapshot(self, reset=False):
+        """
+        현재 지표를 직렬화 가능한 딕셔너리로 반환
+
+        Args:
+            reset: 반환 후 지표 초기화 (워커가 다음 작업에서 증가분만 보내도록 할 때 사용)
+        """
+        snapshot = {
+            'counters': dict(self.counters),
+            'timers': {
+                name: {'count': count, 'total_seconds': total, 'max_seconds': maximum}
+                for name, (count, total, maximum) in self.timers.items()
+            },
+        }
+        if reset:
+            self.reset()
+        return snapshot
+
+    def merge(self, snapshot):
+        """
+        다른 프로세스의 지표 합치기
+        """
+        if not snapshot:
+            return
+        for name, value in snapshot.get('counters', {}).items():
+            self.count(name, value)
+        for name, stats in snapshot.get('timers', {}).items():
+            current = self.timers.get(name)
+            if current is None:
+                self.timers[name] = [stats['count'], stats['total_seconds'], stats['max_seconds']]
+            else:
+                current[0] += stats['count']
+                current[1] += stats['total_seconds']
+                current[2] = max(current[2], stats['max_seconds'])
+
+    def reset(self):
+        self.counters = {}
+        self.timers = {}
+
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 형식으로 변환
+        """
+        def metric_name(name):
+            return PROMETHEUS_PREFIX + '_' + ''.join(c if c.isascii() and c.isalnum() else '_' for c in name)
+
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = metric_name(name) + '_total'
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for name, (count, total, maximum) in sorted(self.timers.items()):
+            metric = metric_name(name) + '_seconds'
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"{metric}_count {count}")
+            lines.append(f"{metric}_sum {total:.6f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            lines.append(f"{metric}_max {maximum:.6f}")
+
+        return '\n'.join(lines) + '\n'
+
+    def summary_lines(self):
+        """
+        누적 시간이 긴 순서의 타이머 요약과 카운터 목록
+        """
+        lines = []
+        for name, (count, total, maximum) in sorted(self.timers.items(), key=lambda item: -item[1][1]):
+            average = total / count if count else 0
+            lines.append(f"{name}: {count:,}회, 총 {total:.2f}초 (평균 {average * 1000:.2f}ms, 최대 {maximum * 1000:.1f}ms)")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value:,}")
+        return lines
+
+    def print_summary(self, title='실행 지표'):
+        lines = self.summary_lines()
+        if not lines:
+            return
+        print(f"\n=== {title} ===")
+        for line in lines:
+            print(line)
+
+# 프로세스 전체에서 공유하는 지표
+METRICS = Metrics()
+
+def count(name, value=1):
+    METRICS.count(name, value)
+
+def timer(name):
+    return METRICS.timer(name)
+
+# 지표 내보내기 설정 (last: 마지막으로 기록한 지표, 종료 시 같은 지표를 다시 기록하지 않도록 사용)
+_export_paths = {'jsonl': None, 'prometheus': None}
+_last_export = {'snapshot': None}
+
+def configure(jsonl_path=None, prometheus_path=None):
+    """
+    지표 파일 경로 설정 (프로세스 종료 시 최종 지표를 기록)
+
+    Args:
+        jsonl_path: 진행 상황과 최종 지표를 한 줄씩 추가할 JSON Lines 파일 경로
+        prometheus_path: 최종 지표를 기록할 Prometheus 텍스트 파일 경로 (node_exporter textfile 수집기 형식)
+    """
+    if jsonl_path:
+        _export_paths['jsonl'] = jsonl_path
+        # 같은 실행에서 시작한 다른 프로세스도 같은 파일에 기록하도록 환경 변수로 전달
+        os.environ[METRICS_JSONL_ENV] = jsonl_path
+    if prometheus_path:
+        _export_paths['prometheus'] = prometheus_path
+        os.environ[METRICS_PROM_ENV] = prometheus_path
+
+def write_event(event, **fields):
+    """
+    JSON Lines 파일에 이벤트 한 줄 추가 (파일이 설정되지 않았으면 무시)
+    """
+    path = _export_paths['jsonl']
+    if not path:
+        return
+    record = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'pid': os.getpid(), 'event': event}
+    record.update(fields)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def export(stage=None):
+    """
+    현재 지표를 설정된 파일로 기록
+
+    Args:
+        stage: 지표를 기록한 단계 이름 (JSON Lines 기록에 포함)
+    """
+    if not METRICS.counters and not METRICS.timers:
+        return
+
+    snapshot = METRICS.snapshot()
+    _last_export['snapshot'] = snapshot
+    write_event('metrics', stage=stage, **snapshot)
+
+    path = _export_paths['prometheus']
+    if path:
+        # 수집기가 작성 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름 변경
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(METRICS.to_prometheus())
+        os.replace(temp_path, path)
+
+def _format_duration(seconds):
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+class Progress:
+    """
+    처리 진행 상황 출력 클래스 (처리 수, 초당 처리량, 남은 시간)
+
+    interval초마다 한 번씩만 출력하고, 지표 파일이 설정되어 있으면 진행 상황을 JSON Lines로도 기록한다.
+    """
+
+    def __init__(self, name, total=None, label=None, unit='개', interval=10.0, metrics=METRICS):
+        """
+        초기화 함수
+
+        Args:
+            name: 작업 이름 (지표 이름에 사용하므로 영문, 예: tokenizer.speeches)
+            label: 출력에 사용할 작업 이름 (기본값: name)
+            total: 전체 처리 수 (모르면 None, 남은 시간을 계산하지 않음)
+            unit: 처리 단위
+            interval: 출력 간격 (초)
+            metrics: 처리 수를 기록할 지표 (카운터 이름: '{name}.processed')
+        """
+        self.name = name
+        self.label = label or name
+        self.total = total
+        self.unit = unit
+        self.interval = interval
+        self.metrics = metrics
+        self.done = 0
+        self.start_time = time.perf_counter()
+        self.last_report = self.start_time
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.start_time
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+        """
+        남은 예상 시간 (초), 전체 처리 수를 모르면 None
+        """
+        rate = self.rate()
+        if not self.total or rate <= 0:
+            return None
+        return max(0.0, (self.total - self.done) / rate)
+
+    def update(self, n=1, force=False):
+        """
+        처리 수 증가 (출력 간격이 지났으면 진행 상황 출력)
+        """
+        self.done += n
+        if self.metrics is not None:
+            self.metrics.count(f"{self.name}.processed", n)
+
+        now = time.perf_counter()
+        if force or now - self.last_report >= self.interval:
+            self.report()
+            self.last_report = now
+
+    def report(self):
+        rate = self.rate()
+        eta = self.eta()
+
+        if self.total:
+            message = f"[{self.label}] {self.done:,}/{self.total:,}{self.unit} ({self.done / self.total * 100:.1f}%)"
+        else:
+            message = f"[{self.label}] {self.done:,}{self.unit}"
+        message += f", {rate:,.1f}{self.unit}/초"
+        if eta is not None:
+            message += f", 남은 시간 {_format_duration(eta)}"
+        print(message)
+
+        write_event('progress', name=self.name, done=self.done, total=self.total,
+                    rate=round(rate, 3), eta_seconds=round(eta, 1) if eta is not None else None)
+
+    def close(self):
+        """
+        최종 처리 수와 처리 속도 출력
+        """
+        elapsed = time.perf_counter() - self.start_time
+        print(f"[{self.label}] 완료: {self.done:,}{self.unit}, {_format_duration(elapsed)} ({self.rate():,.1f}{self.unit}/초)")
+        write_event('progress_done', name=self.name, done=self.done, total=self.total,
+                    seconds=round(elapsed, 3), rate=round(self.rate(), 3))
+
+def _export_at_exit():
+    # 워커 프로세스의 지표는 메인 프로세스로 전달되어 합쳐지므로 메인 프로세스에서만 기록
+    if multiprocessing.parent_process() is not None:
+        return
+    if not (_export_paths['jsonl'] or _export_paths['prometheus']):
+        return
+    if METRICS.snapshot() != _last_export['snapshot']:
+        export()
+
+# 환경 변수로 지표 파일이 지정된 경우에도 프로세스 종료 시 자동으로 기록
+configure(os.environ.get(METRICS_JSONL_ENV), os.environ.get(METRICS_PROM_ENV))
+atexit.register(_export_at_exit)
@@ -0,0 +1,386 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+
+from database import DATABASE_NAME
+from database.connection import connect
+import instrumentation
+from instrumentation import METRICS, timer
+
+# 단계별 실행 상태 저장 파일
+STATE_FILE = '.pipeline_state.json'
+
+class Stage:
+    """
+    파이프라인 단계
+
+    각 단계는 입력(파일, 선행 단계)과 출력(테이블, 파일)을 선언하며,
+    입력의 지문(fingerprint)이 마지막 실행 때와 같고 출력이 남아 있으면 다시 실행하지 않는다.
+
+    여러 단계가 같은 테이블(speeches)을 제자리에서 고쳐 쓰므로, 출력 지문은 테이블 내용이 아니라
+    실행마다 새로 만드는 실행 ID로 기록한다. 선행 단계가 다시 실행되면 그 이후 단계는 모두 다시 실행된다.
+    """
+
+    def __init__(self, name, run, deps=(), input_files=(), output_tables=(), output_files=(), params=None):
+        """
+        초기화 함수
+
+        Args:
+            name: 단계 이름
+            run: 단계 실행 함수 (명령행 인수를 받음)
+            deps: 선행 단계 이름 목록
+            input_files: 입력 파일 경로 또는 glob 패턴 목록, 또는 명령행 인수를 받아 목록을 반환하는 함수
+            output_tables: 단계가 만들거나 변경하는 테이블 목록
+            output_files: 단계가 만드는 파일 목록 또는 명령행 인수를 받아 파일 목록을 반환하는 함수
+            params: 결과에 영향을 주는 설정값을 반환하는 함수 (명령행 인수를 받음)
+        """
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self.input_files = input_files if callable(input_files) else (lambda args, files=list(input_files): files)
+        self.output_tables = list(output_tables)
+        self.output_files = output_files if callable(output_files) else (lambda args, files=list(output_files): files)
+        self.params = params or (lambda args: {})
+
+def file_fingerprint(path):
+    """
+    파일 내용의 SHA-256 해시
+    """
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+def table_row_count(conn, table):
+    """
+    테이블 행 수 (테이블이 없으면 None)
+    """
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+
+# ------------------------------------------------------------------
+# 단계 실행 함수
+# ------------------------------------------------------------------
+
+def run_create_database(args):
+    from database.create_database import create_database
+    create_database()
+
+def run_create_bias_table(args):
+    from database.create_bias_table import create_bias_table
+    create_bias_table()
+
+def run_clean_data(args):
+    from database.clean_data import clean_data
+    clean_data()
+
+def run_fix_empty_member_ids(args):
+    from database.fix_empty_member_ids import fix_empty_member_ids
+    fix_empty_member_ids()
+
+def run_filter_speeches(args):
+    from database.filter_speeches import filter_speeches
+    filter_speeches()
+
+def run_speech_tokenizer(args):
+    from analysis.speech_tokenizer import SpeechTokenizer
+    tokenizer = SpeechTokenizer(backend=args.backend, cache_path=args.cache)
+    try:
+        tokenizer.process_speeches(workers=args.workers, storage=args.storage)
+    finally:
+        tokenizer.close()
+
+def run_word_frequency_analyzer(args):
+    from analysis.word_frequency_analyzer import WordFrequencyAnalyzer
+    analyzer = WordFrequencyAnalyzer()
+    try:
+        analyzer.analyze_member_word_frequency()
+    finally:
+        analyzer.close()
+
+def run_word_political_bias_analyzer(args):
+    from analysis.word_political_bias_analyzer import WordPoliticalBiasAnalyzer
+    analyzer = WordPoliticalBiasAnalyzer(args.wnominate)
+    try:
+        analyzer.analyze_word_political_bias(min_word_count=args.min_count, output_file=args.output,
+                                             model=args.model, cv_folds=args.cv_folds, n_jobs=args.n_jobs,
+                                             bootstrap=args.bootstrap, targets=args.targets,
+                                             artifact_file=args.artifact)
+    finally:
+        analyzer.close()
+
+# README의 실행 순서를 따르는 단계 목록
+STAGES = [
+    Stage('create_database', run_create_database,
+          input_files=['../data/*.xlsx'],
+          output_tables=['speeches']),
+    Stage('create_bias_table', run_create_bias_table,
+          input_files=['../data/wnominate_results.csv'],
+          output_tables=['member_bias']),
+    Stage('clean_data', run_clean_data,
+          deps=['create_database', 'create_bias_table'],
+          output_tables=['speeches', 'speaker_name_mapping']),
+    Stage('fix_empty_member_ids', run_fix_empty_member_ids,
+          deps=['clean_data'],
+          output_tables=['speeches']),
+    Stage('filter_speeches', run_filter_speeches,
+          deps=['fix_empty_member_ids', 'create_bias_table'],
+          output_tables=['speeches']),
+    Stage('speech_tokenizer', run_speech_tokenizer,
+          deps=['filter_speeches'],
+          input_files=['analysis/korean_stopwords.txt'],
+          output_tables=['speeches'],
+          params=lambda args: {'backend': args.backend, 'storage': args.storage}),
+    Stage('word_frequency_analyzer', run_word_frequency_analyzer,
+          deps=['speech_tokenizer'],
+          output_tables=['member_word_frequency']),
+    Stage('word_political_bias_analyzer', run_word_political_bias_analyzer,
+          deps=['word_frequency_analyzer'],
+          input_files=lambda args: [args.wnominate],
+          output_files=lambda args: [args.output] + ([args.artifact] if args.artifact else []),
+          params=lambda args: {'min_count': args.min_count, 'wnominate': args.wnominate, 'output': args.output,
+                               'model': args.model, 'cv_folds': args.cv_folds, 'bootstrap': args.bootstrap,
+                               'targets': args.targets, 'artifact': args.artifact}),
+]
+
+class PipelineRunner:
+    """
+    전처리/분석 단계를 의존 관계 순서대로 실행하고, 입력이 바뀐 단계와 그 이후 단계만 다시 실행하는 클래스
+    """
+
+    def __init__(self, stages=STAGES, state_file=STATE_FILE, database=DATABASE_NAME):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = self._topological_order(stages)
+        self.state_file = state_file
+        self.database = database
+        self.state = self._load_state()
+
+    @staticmethod
+    def _topological_order(stages):
+        """
+        선행 단계가 먼저 오도록 단계 정렬 (같은 조건이면 선언 순서 유지)
+        """
+        names = [stage.name for stage in stages]
+        deps = {stage.name: set(stage.deps) for stage in stages}
+        order = []
+
+        while len(order) < len(names):
+            ready = [name for name in names if name not in order and deps[name] <= set(order)]
+            if not ready:
+                raise ValueError("파이프라인 단계에 순환 의존 관계가 있습니다.")
+            order.append(ready[0])
+
+        return order
+
+    def _load_state(self):
+        if os.path.exists(self.state_file):
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_state(self):
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    def input_fingerprint(self, stage, args):
+        """
+        단계 입력 지문 (입력 파일 내용, 선행 단계 출력 지문, 설정값)
+        """
+        files = {}
+        for pattern in stage.input_files(args):
+            for path in sorted(glob.glob(pattern)):
+                files[path] = file_fingerprint(path)
+
+        upstream = {dep: self.state.get(dep, {}).get('output_fingerprint') for dep in stage.deps}
+
+        payload = json.dumps({
+            'files': files,
+            'upstream': upstream,
+            'params': stage.params(args),
+        }, sort_keys=True, ensure_ascii=False)
+
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _table_row_counts(self, tables):
+        """
+        테이블별 행 수 (데이터베이스 파일이나 테이블이 없으면 None)
+        """
+        try:
+            conn = connect('read_only', path=self.database)
+        except sqlite3.OperationalError:
+            # 데이터베이스 파일이 없는 경우 (예: 읽을 xlsx 파일이 없어 create_database가 DB를 만들지 않음)
+            return {table: None for table in tables}
+        try:
+            return {table: table_row_count(conn, table) for table in tables}
+        finally:
+            conn.close()
+
+    def output_fingerprint(self, stage, args):
+        """
+        단계 출력 지문 (실행 ID)과 출력 기록 (출력 테이블 행 수, 출력 파일 해시)
+
+        공유 테이블 전체를 해시하지 않고 실행마다 새 실행 ID를 지문으로 사용하므로,
+        단계가 다시 실행되면 출력 내용과 관계없이 후속 단계의 입력 지문이 바뀐다.
+        """
+        outputs = {}
+
+        for table, rows in self._table_row_counts(stage.output_tables).items():
+            outputs[f"table:{table}"] = rows
+
+        for path in stage.output_files(args):
+            outputs[f"file:{path}"] = file_fingerprint(path) if os.path.exists(path) else None
+
+        return uuid.uuid4().hex, outputs
+
+    def _outputs_present(self, stage, args):
+        """
+        마지막 실행 때 만든 출력이 그대로 남아 있는지 확인 (테이블 존재 여부와 행 수, 파일 존재 여부)
+        """
+        recorded = self.state.get(stage.name, {}).get('outputs', {})
+
+        for table, rows in self._table_row_counts(stage.output_tables).items():
+            if rows is None or recorded.get(f"table:{table}") is None:
+                return False
+
+        for path in stage.output_files(args):
+            if not os.path.exists(path) or recorded.get(f"file:{path}") is None:
+                return False
+
+        return True
+
+    def is_stale(self, stage, args):
+        """
+        단계를 다시 실행해야 하는지 확인
+
+        Returns:
+            (재실행 필요 여부, 이유)
+        """
+        stage_state = self.state.get(stage.name)
+        if not stage_state:
+            return True, '실행 기록 없음'
+
+        if stage_state.get('input_fingerprint') != self.input_fingerprint(stage, args):
+            return True, '입력 변경'
+
+        if not self._outputs_present(stage, args):
+            return True, '출력 없음'
+
+        return False, '최신 상태'
+
+    def _select_stages(self, until=None):
+        """
+        실행 대상 단계 (until이 있으면 해당 단계와 그 선행 단계만)
+        """
+        if not until:
+            return self.order
+
+        if until not in self.stages:
+            raise ValueError(f"알 수 없는 단계입니다: {until}")
+
+        needed = set()
+        pending = [until]
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].deps)
+
+        return [name for name in self.order if name in needed]
+
+    def run(self, args, force=(), until=None, dry_run=False):
+        """
+        오래된 단계만 순서대로 실행
+
+        Args:
+            args: 단계 실행 설정 (명령행 인수)
+            force: 입력과 관계없이 다시 실행할 단계 목록
+            until: 이 단계까지만 실행
+            dry_run: 실행하지 않고 단계별 상태만 출력
+        """
+        # 이번 실행에서 다시 실행한(또는 dry_run에서 실행 예정인) 단계
+        rerun = set()
+
+        for name in self._select_stages(until):
+            stage = self.stages[name]
+            stale, reason = self.is_stale(stage, args)
+
+            if name in force:
+                stale, reason = True, '강제 실행'
+            elif not stale and rerun.intersection(stage.deps):
+                stale, reason = True, '선행 단계 재실행'
+
+            if not stale:
+                print(f"[건너뜀] {name}: {reason}")
+                continue
+
+            rerun.add(name)
+
+            if dry_run:
+                print(f"[실행 예정] {name}: {reason}")
+                continue
+
+            print(f"\n[실행] {name}: {reason}")
+            # 단계 안에서 출력하는 지표 요약에는 해당 단계의 지표만 나오도록 이전 단계 지표를 잠시 분리
+            previous_metrics = METRICS.snapshot(reset=True)
+            start_time = time.time()
+            with timer(f"stage.{name}"):
+                stage.run(args)
+            elapsed = time.time() - start_time
+            METRICS.merge(previous_metrics)
+            # 여러 시간이 걸리는 실행 중에도 확인할 수 있도록 단계가 끝날 때마다 누적 지표 기록
+            instrumentation.export(stage=name)
+
+            # 실행 후 입력/출력 지문 기록 (새 실행 ID로 후속 단계가 모두 오래된 단계가 됨)
+            output_fingerprint, outputs = self.output_fingerprint(stage, args)
+            self.state[name] = {
+                'input_fingerprint': self.input_fingerprint(stage, args),
+                'output_fingerprint': output_fingerprint,
+                'outputs': outputs,
+                'finished_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'seconds': round(elapsed, 2),
+            }
+            self._save_state()
+            print(f"[완료] {name}: {elapsed:.1f}초")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='국회 발언 정치 편향 분석 파이프라인 실행 도구')
+    parser.add_argument('--until', type=str, help='이 단계까지만 실행')
+    parser.add_argument('--force', type=str, nargs='*', default=[], help='입력과 관계없이 다시 실행할 단계')
+    parser.add_argument('--dry-run', action='store_true', help='실행하지 않고 단계별 상태만 출력')
+    parser.add_argument('--workers', type=int, default=1, help='형태소 분석 워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('--backend', type=str, default='kkma', help='형태소 분석기 (기본값: kkma)')
+    parser.add_argument('--storage', type=str, default='json', choices=['json', 'binary', 'both'],
+                        help='토큰 저장 형식 (기본값: json)')
+    parser.add_argument('--cache', type=str, help='형태소 분석 캐시 파일 경로')
+    parser.add_argument('--wnominate', type=str, default='wnominate_results.csv',
+                        help='의원별 정치적 위치 정보가 담긴 CSV 파일 경로')
+    parser.add_argument('--min-count', type=int, default=10, help='최소 단어 등장 횟수 (기본값: 10)')
+    parser.add_argument('--output', type=str, default='word_political_bias_1d.csv',
+                        help='단어별 정치적 편향 결과 CSV 파일 경로')
+    parser.add_argument('--model', type=str, default='linear', choices=['linear', 'ridge', 'lasso', 'elasticnet'],
+                        help='편향 회귀 모델 (기본값: linear)')
+    parser.add_argument('--artifact', type=str, help='편향 점수를 메모리 맵 바이너리 파일로도 저장할 경로')
+    parser.add_argument('--cv-folds', type=int, default=5, help='정규화 강도 교차 검증 fold 수 (기본값: 5)')
+    parser.add_argument('--targets', type=str, nargs='+', default=['coord1D'],
+                        help='종속 변수로 사용할 정치적 위치 열 (기본값: coord1D, 예: coord1D coord2D)')
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help='교차 검증/부트스트랩 병렬 프로세스 수 (기본값: -1, 모든 코어)')
+    parser.add_argument('--bootstrap', type=int, default=0,
+                        help='단어별 신뢰 구간 계산을 위한 부트스트랩 반복 횟수 (기본값: 0, 계산하지 않음)')
+    parser.add_argument('--metrics-jsonl', type=str, help='진행 상황과 단계별 실행 지표를 기록할 JSON Lines 파일 경로')
+    parser.add_argument('--metrics-prom', type=str, help='실행 지표를 기록할 Prometheus 텍스트 파일 경로')
+    args = parser.parse_args()
+    if args.bootstrap < 0:
+        parser.error(f"--bootstrap은 0 이상이어야 합니다: {args.bootstrap}")
+    instrumentation.configure(args.metrics_jsonl, args.metrics_prom)
+
+    runner = PipelineRunner()
+    runner.run(args, force=args.force, until=args.until, dry_run=args.dry_run)
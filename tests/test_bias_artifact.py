@@ -0,0 +1,76 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.bias_artifact import BiasArtifact, is_bias_artifact, write_bias_artifact
+
+class BiasArtifactTest(unittest.TestCase):
+    """
+    편향 점수 바이너리 파일 저장/읽기 확인
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'word_political_bias.bin')
+
+        self.words = ['정부', '국회', '예산', '민생', '가']
+        self.coefficients = np.array([[0.5, -1.0], [-0.25, 2.0], [1.5, 0.0], [-2.0, 0.75], [0.125, -0.5]])
+        self.total_counts = [120, 300, 45, 80, 10]
+        self.tags = ['NNG', 'NNG', 'NNG', 'NNG', 'VV']
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self):
+        write_bias_artifact(self.path, self.words, self.coefficients, ['bias_x', 'bias_y'],
+                            total_counts=self.total_counts, tags=self.tags, metadata={'min_word_count': 10})
+        return BiasArtifact(self.path)
+
+    def test_round_trip(self):
+        artifact = self.write()
+
+        self.assertTrue(is_bias_artifact(self.path))
+        self.assertEqual(len(artifact), len(self.words))
+        self.assertEqual(artifact.columns, ['bias_x', 'bias_y'])
+        self.assertEqual(artifact.metadata['min_word_count'], 10)
+
+        positions = artifact.lookup(self.words)
+        self.assertTrue(np.all(positions >= 0))
+        for i, position in enumerate(positions):
+            self.assertEqual(artifact.word(position), self.words[i])
+            self.assertEqual(artifact.tag(position), self.tags[i])
+            self.assertEqual(artifact.total_counts[position], self.total_counts[i])
+            self.assertAlmostEqual(float(artifact.column('bias_x')[position]), self.coefficients[i, 0])
+            self.assertAlmostEqual(float(artifact.column('bias_y')[position]), self.coefficients[i, 1])
+
+    def test_unknown_and_over_long_words_are_not_found(self):
+        artifact = self.write()
+
+        # 고정 길이(가장 긴 저장 단어의 바이트 수)보다 긴 단어는 잘린 앞부분이 저장된 단어와 같아도 찾지 않음
+        words = ['국회의원', '정부부처', '가나', '없음', '', '예산']
+        self.assertEqual(artifact.lookup(words).tolist(), [-1, -1, -1, -1, -1, artifact.lookup(['예산'])[0]])
+        self.assertEqual(artifact.lookup([]).tolist(), [])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            write_bias_artifact(self.path, ['정부', '정부'], [0.1, 0.2], ['bias_score'])
+        with self.assertRaises(ValueError):
+            write_bias_artifact(self.path, self.words, self.coefficients, ['bias_score'])
+
+        artifact = self.write()
+        with self.assertRaises(ValueError):
+            artifact.column('bias_score')
+
+    def test_csv_is_not_artifact(self):
+        csv_path = os.path.join(self.directory.name, 'word_political_bias.csv')
+        with open(csv_path, 'w', encoding='utf-8-sig') as f:
+            f.write('word,bias_score\n정부,0.5\n')
+        self.assertFalse(is_bias_artifact(csv_path))
+
+if __name__ == '__main__':
+    unittest.main()
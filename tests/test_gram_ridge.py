@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import LinearRegression, Ridge
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.word_political_bias_analyzer import GramRidge
+
+class GramRidgeTest(unittest.TestCase):
+    """
+    Gram 행렬 분해로 구한 ridge 해가 scikit-learn 모델과 같은지 확인
+    """
+
+    def setUp(self):
+        # 의원 수보다 단어 수가 훨씬 많은 희소 빈도 행렬 (실제 의원-단어 행렬과 같은 형태)
+        rng = np.random.default_rng(0)
+        self.X = sparse.random(40, 300, density=0.1, format='csr', random_state=1,
+                               data_rvs=lambda size: rng.poisson(3, size) + 1.0)
+        self.Y = rng.normal(size=(40, 2))
+
+    def test_matches_sklearn_ridge(self):
+        for alpha in (0.01, 1.0, 100.0):
+            with self.subTest(alpha=alpha):
+                model = GramRidge(alpha=alpha).fit(self.X, self.Y)
+                expected = Ridge(alpha=alpha).fit(self.X.toarray(), self.Y)
+
+                np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-6, atol=1e-10)
+                np.testing.assert_allclose(model.intercept_, expected.intercept_, rtol=1e-6, atol=1e-10)
+                np.testing.assert_allclose(model.predict(self.X), expected.predict(self.X.toarray()), rtol=1e-6)
+
+    def test_single_target_matches_sklearn_ridge(self):
+        model = GramRidge(alpha=1.0).fit(self.X, self.Y[:, 0])
+        expected = Ridge(alpha=1.0).fit(self.X.toarray(), self.Y[:, 0])
+
+        self.assertEqual(model.coef_.shape, (self.X.shape[1],))
+        np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-6, atol=1e-10)
+        self.assertAlmostEqual(float(model.intercept_), float(expected.intercept_))
+
+    def test_zero_alpha_is_minimum_norm_least_squares(self):
+        model = GramRidge(alpha=0).fit(self.X, self.Y)
+        expected = LinearRegression().fit(self.X.toarray(), self.Y)
+
+        np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-5, atol=1e-8)
+        np.testing.assert_allclose(model.predict(self.X), self.Y, atol=1e-8)
+
+    def test_decomposition_is_reused_across_alphas(self):
+        decomposition = GramRidge.decompose(self.X)
+        for alpha in (0.1, 10.0):
+            coef, intercept = GramRidge.solve(decomposition, self.Y, alpha)
+            expected = GramRidge(alpha=alpha).fit(self.X, self.Y)
+            np.testing.assert_allclose(coef, expected.coef_)
+            np.testing.assert_allclose(intercept, expected.intercept_)
+
+if __name__ == '__main__':
+    unittest.main()
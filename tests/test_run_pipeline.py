@@ -0,0 +1,117 @@
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from run_pipeline import PipelineRunner, Stage
+
+class PipelineStalenessTest(unittest.TestCase):
+    """
+    같은 테이블을 제자리에서 고쳐 쓰는 단계들의 재실행 전파 확인
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, 'pipeline.db')
+        self.state_file = os.path.join(self.directory.name, 'state.json')
+        self.args = argparse.Namespace()
+        self.calls = []
+
+        def load(args):
+            # 원본 데이터를 다시 적재 (create_database처럼 테이블을 지우고 같은 내용으로 다시 만듦)
+            self.calls.append('load')
+            conn = sqlite3.connect(self.database)
+            conn.execute("DROP TABLE IF EXISTS speeches")
+            conn.execute("CREATE TABLE speeches (speaker TEXT, cleaned INTEGER DEFAULT 0)")
+            conn.executemany("INSERT INTO speeches (speaker) VALUES (?)", [('가',), ('나',)])
+            conn.commit()
+            conn.close()
+
+        def clean(args):
+            self.calls.append('clean')
+            conn = sqlite3.connect(self.database)
+            conn.execute("UPDATE speeches SET cleaned = 1")
+            conn.commit()
+            conn.close()
+
+        def tokenize(args):
+            self.calls.append('tokenize')
+
+        self.stages = [
+            Stage('load', load, output_tables=['speeches']),
+            Stage('clean', clean, deps=['load'], output_tables=['speeches']),
+            Stage('tokenize', tokenize, deps=['clean'], output_tables=['speeches']),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_pipeline(self, **kwargs):
+        self.calls = []
+        runner = PipelineRunner(self.stages, state_file=self.state_file, database=self.database)
+        with contextlib.redirect_stdout(io.StringIO()):
+            runner.run(self.args, **kwargs)
+        return self.calls
+
+    def test_up_to_date_stages_are_skipped(self):
+        self.assertEqual(self.run_pipeline(), ['load', 'clean', 'tokenize'])
+        self.assertEqual(self.run_pipeline(), [])
+
+    def test_forced_reload_reruns_every_downstream_stage(self):
+        self.run_pipeline()
+
+        # 다시 적재한 테이블이 지난번 원본 적재 결과와 같아도 후속 단계는 모두 다시 실행되어야 함
+        self.assertEqual(self.run_pipeline(force=['load']), ['load', 'clean', 'tokenize'])
+
+        conn = sqlite3.connect(self.database)
+        self.assertEqual(conn.execute("SELECT MIN(cleaned) FROM speeches").fetchone()[0], 1)
+        conn.close()
+
+        self.assertEqual(self.run_pipeline(), [])
+
+    def test_dry_run_marks_downstream_stages(self):
+        self.run_pipeline()
+
+        output = io.StringIO()
+        runner = PipelineRunner(self.stages, state_file=self.state_file, database=self.database)
+        with contextlib.redirect_stdout(output):
+            runner.run(self.args, force=['clean'], dry_run=True)
+
+        self.assertIn('[건너뜀] load', output.getvalue())
+        self.assertIn('[실행 예정] tokenize', output.getvalue())
+
+    def test_missing_database_is_recorded_as_missing_output(self):
+        # 입력 파일이 없어 데이터베이스를 만들지 않은 단계도 오류 없이 기록되고 다음 실행에서 다시 실행됨
+        stages = [Stage('load', lambda args: self.calls.append('load'), output_tables=['speeches'])]
+        runner = PipelineRunner(stages, state_file=self.state_file, database=self.database)
+        with contextlib.redirect_stdout(io.StringIO()):
+            runner.run(self.args)
+            runner.run(self.args)
+
+        self.assertEqual(self.calls, ['load', 'load'])
+        self.assertFalse(os.path.exists(self.database))
+
+    def test_input_files_from_arguments(self):
+        # 명령행 인수로 지정한 입력 파일 내용이 바뀌면 다시 실행
+        wnominate = os.path.join(self.directory.name, 'custom_wnominate.csv')
+        with open(wnominate, 'w', encoding='utf-8') as f:
+            f.write('name,coord1D\n가,0.1\n')
+
+        self.args.wnominate = wnominate
+        self.stages.append(Stage('bias', lambda args: self.calls.append('bias'), deps=['tokenize'],
+                                 input_files=lambda args: [args.wnominate]))
+        self.assertEqual(self.run_pipeline(), ['load', 'clean', 'tokenize', 'bias'])
+        self.assertEqual(self.run_pipeline(), [])
+
+        with open(wnominate, 'w', encoding='utf-8') as f:
+            f.write('name,coord1D\n가,-0.3\n')
+        self.assertEqual(self.run_pipeline(), ['bias'])
+
+if __name__ == '__main__':
+    unittest.main()
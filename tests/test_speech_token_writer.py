@@ -0,0 +1,78 @@
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.speech_tokenizer import SpeechTokenWriter
+from analysis.token_store import TokenStore
+
+class SpeechTokenWriterTest(unittest.TestCase):
+    """
+    저장 형식을 바꾸어 다시 토큰화했을 때 이전 형식의 토큰이 남지 않는지 확인
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.directory.name, 'speeches.db'))
+        self.conn.execute("CREATE TABLE speeches (id INTEGER PRIMARY KEY, 토큰화된_발언 TEXT, 토큰_ID BLOB, 원문_해시 TEXT)")
+        self.conn.execute("INSERT INTO speeches (id) VALUES (1)")
+        self.conn.execute("""
+        CREATE TABLE speech_tokenize_timings (
+            speech_id INTEGER PRIMARY KEY, text_length INTEGER, segments INTEGER, seconds REAL
+        )
+        """)
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        self.directory.cleanup()
+
+    def write(self, storage, tokens):
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer = SpeechTokenWriter(self.conn, storage=storage)
+        writer.add(1, tokens, source_hash=storage)
+        writer.commit()
+        return self.conn.execute("SELECT 토큰화된_발언, 토큰_ID, 원문_해시 FROM speeches WHERE id = 1").fetchone()
+
+    def test_json_after_binary_clears_token_ids(self):
+        self.write('binary', [('예산', 'NNG')])
+        tokens_json, blob, source_hash = self.write('json', [('국방', 'NNG'), ('국방', 'NNG')])
+
+        self.assertEqual(json.loads(tokens_json), [['국방', 'NNG'], ['국방', 'NNG']])
+        self.assertIsNone(blob)
+        self.assertEqual(source_hash, 'json')
+
+    def test_binary_after_json_clears_json(self):
+        self.write('json', [('예산', 'NNG')])
+        tokens_json, blob, _ = self.write('binary', [('국방', 'NNG')])
+
+        self.assertIsNone(tokens_json)
+        store = TokenStore(self.conn)
+        self.assertEqual([tuple(token) for token in store.decode(blob)], [('국방', 'NNG')])
+
+    def test_both_writes_both_columns(self):
+        self.write('json', [('예산', 'NNG')])
+        tokens_json, blob, _ = self.write('both', [('국방', 'NNG')])
+
+        self.assertEqual(json.loads(tokens_json), [['국방', 'NNG']])
+        self.assertIsNotNone(blob)
+
+    def test_json_without_token_id_column(self):
+        # 토큰_ID 열이 없는 데이터베이스에서는 JSON 열만 갱신
+        self.conn.execute("ALTER TABLE speeches DROP COLUMN 토큰_ID")
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer = SpeechTokenWriter(self.conn, storage='json')
+        writer.add(1, [('예산', 'NNG')], source_hash='json')
+        writer.commit()
+
+        row = self.conn.execute("SELECT 토큰화된_발언, 원문_해시 FROM speeches WHERE id = 1").fetchone()
+        self.assertEqual(json.loads(row[0]), [['예산', 'NNG']])
+
+if __name__ == '__main__':
+    unittest.main()
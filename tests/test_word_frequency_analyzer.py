@@ -0,0 +1,88 @@
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.speech_tokenizer import SpeechTokenWriter
+from analysis.word_frequency_analyzer import WordFrequencyAnalyzer
+from database import DATABASE_NAME
+
+class CountMemberWordsTest(unittest.TestCase):
+    """
+    두 저장 형식이 섞인 speeches 테이블의 의원별 단어 빈도 집계 확인
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+
+        conn = sqlite3.connect(DATABASE_NAME)
+        conn.execute("""
+        CREATE TABLE speeches (
+            id INTEGER PRIMARY KEY, 의원ID TEXT, 발언자 TEXT, 토큰화된_발언 TEXT, 토큰_ID BLOB, 원문_해시 TEXT
+        )
+        """)
+        conn.execute("""
+        CREATE TABLE speech_tokenize_timings (
+            speech_id INTEGER PRIMARY KEY, text_length INTEGER, segments INTEGER, seconds REAL
+        )
+        """)
+        conn.execute("CREATE TABLE member_bias (name TEXT, party TEXT)")
+        conn.executemany("INSERT INTO member_bias VALUES (?, ?)", [('가', 'A'), ('나', 'B')])
+        conn.executemany("INSERT INTO speeches (id, 의원ID, 발언자) VALUES (?, ?, ?)",
+                         [(1, 'M1', '가'), (2, 'M1', '가'), (3, None, '나'), (4, 'M3', '비의원')])
+        conn.commit()
+        self.conn = conn
+
+    def tearDown(self):
+        self.conn.close()
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def write(self, storage, rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer = SpeechTokenWriter(self.conn, storage=storage)
+        for speech_id, tokens in rows:
+            writer.add(speech_id, tokens)
+        writer.commit()
+
+    def count_words(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyzer = WordFrequencyAnalyzer()
+            try:
+                word_counts = analyzer.count_member_words()
+            finally:
+                analyzer.close()
+        return {(None if pd.isna(row.member_id) else row.member_id, row.speaker, row.word, row.tag): row.count
+                for row in word_counts.itertuples()}
+
+    def test_mixed_storage_formats(self):
+        self.write('binary', [(1, [('예산', 'NNG'), ('국방', 'NNG')]), (3, [('예산', 'NNG')])])
+        self.write('json', [(2, [('예산', 'NNG'), ('민생', 'NNG')]), (4, [('예산', 'NNG')])])
+
+        self.assertEqual(self.count_words(), {
+            ('M1', '가', '예산', 'NNG'): 2,
+            ('M1', '가', '국방', 'NNG'): 1,
+            ('M1', '가', '민생', 'NNG'): 1,
+            # 의원ID가 없는 발언자도 집계에서 빠지지 않음
+            (None, '나', '예산', 'NNG'): 1,
+        })
+
+    def test_retokenized_speech_counts_only_latest_tokens(self):
+        self.write('binary', [(1, [('예산', 'NNG')])])
+        self.write('json', [(1, [('국방', 'NNG'), ('국방', 'NNG')])])
+        self.assertEqual(self.count_words(), {('M1', '가', '국방', 'NNG'): 2})
+
+        self.write('binary', [(1, [('민생', 'NNG')])])
+        self.assertEqual(self.count_words(), {('M1', '가', '민생', 'NNG'): 1})
+
+if __name__ == '__main__':
+    unittest.main()